@@ -22,10 +22,79 @@ class Settings(BaseSettings):
     USE_OPENAI_WHISPER: bool = False
     USE_LOCAL_WHISPER: bool = True
     WHISPER_MODEL_SIZE: str = "medium"  # tiny, base, small, medium, large-v3
+    WHISPER_EXECUTOR_WORKERS: int = 0  # Threads d'inférence (0 = nombre de répliques)
+    WHISPER_REPLICAS: int = 0  # Répliques du modèle (0 = cœurs / threads par réplique)
+    WHISPER_THREADS_PER_REPLICA: int = 4  # Threads CTranslate2 par réplique
+    WHISPER_CPU_AFFINITY: bool = False  # Épingle chaque réplique sur ses cœurs (Linux)
+    # Paliers par durée, ex. "60:base,1800:small,medium" (vide = WHISPER_MODEL_SIZE)
+    WHISPER_MODEL_ROUTING: str = ""
+    WHISPER_AVAILABLE_MODELS: str = "tiny,base,small,medium,large-v3"  # Chargés à la demande
+    # Mémoire des modèles chargés, éviction LRU au-delà (0 = illimitée)
+    WHISPER_MODEL_MEMORY_BUDGET_MB: int = 0
+    WHISPER_DRAFT_MODEL: str = "base"  # Brouillon rapide du mode deux passes (two_pass)
+    
+    # Transcription parallèle des longs enregistrements (découpe aux silences)
+    PARALLEL_CHUNKING_ENABLED: bool = True
+    PARALLEL_CHUNKING_MIN_AUDIO_SECONDS: int = 600  # En dessous, décodage en un bloc
+    PARALLEL_CHUNK_TARGET_SECONDS: int = 300  # Durée visée par bloc
+    PARALLEL_CHUNK_OVERLAP_SECONDS: float = 1.0  # Chevauchement si aucun silence n'est trouvé
+    
+    # Regroupement des clips courts en lots (pipeline batché faster-whisper)
+    WHISPER_BATCHING_ENABLED: bool = False
+    WHISPER_BATCH_MAX_SIZE: int = 8  # Clips par lot
+    WHISPER_BATCH_MAX_WAIT_MS: int = 20  # Attente maximum avant l'envoi d'un lot incomplet
+    WHISPER_BATCH_MAX_AUDIO_SECONDS: int = 60  # Au-delà, décodage individuel
+    
+    # Clients HTTP Azure OpenAI / OpenAI
+    AZURE_MAX_CONCURRENT_REQUESTS: int = 8  # Requêtes simultanées maximum
+    AZURE_MAX_RETRIES: int = 4  # Nouvelles tentatives sur 429/5xx
+    AZURE_RETRY_BASE_DELAY_SECONDS: float = 0.5
+    AZURE_RETRY_MAX_DELAY_SECONDS: float = 30.0
+    HTTP_MAX_CONNECTIONS: int = 50
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_TIMEOUT_SECONDS: float = 120.0
+    
+    # Jobs de transcription asynchrones
+    JOB_MAX_CONCURRENT: int = 2  # Jobs traités simultanément
+    JOB_QUEUE_MAX_SIZE: int = 100  # Jobs en attente maximum
+    
+    # Transcription par lots (plusieurs fichiers ou archive zip)
+    BATCH_MAX_FILES: int = 50  # Fichiers par lot, archives comprises
+    BATCH_MAX_CONCURRENT: int = 2  # Fichiers transcrits simultanément
+    
+    # Uploads reprenables (session, blocs envoyés par PUT, finalisation)
+    UPLOAD_SESSION_EXPIRE_HOURS: int = 24  # Session inactive supprimée au-delà
+    UPLOAD_SESSION_MAX: int = 100  # Sessions ouvertes simultanément
+    
+    # Contrôle d'admission des transcriptions (rejet anticipé en cas de surcharge)
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_MAX_PENDING: int = 32  # Transcriptions acceptées et non terminées
+    ADMISSION_MAX_AUDIO_SECONDS: int = 14400  # Audio en attente maximum (estimé)
+    ADMISSION_BYTES_PER_AUDIO_SECOND: int = 16000  # Estimation avant décodage (~128 kbit/s)
+    ADMISSION_INITIAL_SPEED: float = 1.0  # Secondes d'audio par seconde et par slot, avant mesure
+    ADMISSION_MAX_RETRY_AFTER_SECONDS: int = 600
+    
+    # Cache des transcriptions (adressé par le contenu audio)
+    TRANSCRIPTION_CACHE_ENABLED: bool = True
+    TRANSCRIPTION_CACHE_MAX_MB: int = 100  # Budget disque, éviction LRU au-delà
+    
+    # Résumés des transcriptions longues (map-reduce)
+    SUMMARY_CHUNK_MAX_TOKENS: int = 6000  # Au-delà, la transcription est découpée
+    SUMMARY_MAP_CONCURRENCY: int = 4  # Appels GPT simultanés pour les blocs
+    
+    # Cache des résumés GPT
+    SUMMARY_CACHE_ENABLED: bool = True
+    SUMMARY_CACHE_TTL_SECONDS: int = 3600
+    SUMMARY_CACHE_MAX_MB: int = 50  # Plafond mémoire, éviction LRU au-delà
+    
+    # Health checks
+    HEALTH_CHECK_INTERVAL_SECONDS: int = 30  # Intervalle de la sonde Azure OpenAI
     
     # Application Settings
     TEMP_FOLDER: str = "./temp"
     MAX_FILE_SIZE_MB: int = 200
+    UPLOAD_CHUNK_SIZE_KB: int = 1024  # Taille des blocs lus à l'upload
+    UPLOAD_SPOOL_MAX_MEMORY_MB: int = 8  # Au-delà, l'upload est écrit directement sur disque
     ALLOWED_AUDIO_EXTENSIONS: str = "mp3,wav,m4a,flac,ogg,webm"
     
     # Security
@@ -54,6 +123,42 @@ class Settings(BaseSettings):
     def max_file_size_bytes(self) -> int:
         """Retourne la taille max en octets"""
         return self.MAX_FILE_SIZE_MB * 1024 * 1024
+    
+    @property
+    def upload_chunk_size_bytes(self) -> int:
+        """Retourne la taille des blocs d'upload en octets"""
+        return self.UPLOAD_CHUNK_SIZE_KB * 1024
+    
+    @property
+    def upload_spool_max_memory_bytes(self) -> int:
+        """Retourne le seuil de bascule sur disque en octets"""
+        return self.UPLOAD_SPOOL_MAX_MEMORY_MB * 1024 * 1024
+    
+    @property
+    def whisper_replicas(self) -> int:
+        """Retourne le nombre de répliques du modèle (cœurs / threads par réplique par défaut)"""
+        if self.WHISPER_REPLICAS:
+            return self.WHISPER_REPLICAS
+        return max(1, (os.cpu_count() or 1) // max(1, self.WHISPER_THREADS_PER_REPLICA))
+    
+    @property
+    def whisper_available_models_list(self) -> List[str]:
+        """Retourne la liste des modèles Whisper chargeables à la demande"""
+        return [
+            model.strip() for model in self.WHISPER_AVAILABLE_MODELS.split(",") if model.strip()
+        ]
+    
+    @property
+    def whisper_executor_workers(self) -> int:
+        """Retourne la taille du pool d'inférence (une tâche par réplique par défaut)"""
+        return self.WHISPER_EXECUTOR_WORKERS or self.whisper_replicas
+    
+    @property
+    def transcription_slots(self) -> int:
+        """Retourne le nombre de transcriptions traitées en parallèle"""
+        if self.USE_LOCAL_WHISPER:
+            return self.whisper_replicas
+        return max(1, self.AZURE_MAX_CONCURRENT_REQUESTS)
 
 
 # Instance globale de configuration
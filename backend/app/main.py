@@ -5,12 +5,19 @@ FastAPI application avec configuration CORS, middleware et routes
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from app.config import settings
 from app.routes import transcription, summary
 from app.models.schemas import HealthResponse
+from app.services.admission_controller import admission_controller, AdmissionRejectedError
 from app.services.azure_service import azure_service
+from app.services.inference_executor import inference_executor
+from app.services.job_manager import job_manager
+from app.services.transcription_cache import transcription_cache
+from app.services.health_monitor import health_monitor
 from app.utils.file_handler import file_handler
+from app.utils import metrics
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 import logging
 from datetime import datetime
 import uvicorn
@@ -57,6 +64,55 @@ app = FastAPI(
     }
 )
 
+# Endpoints soumis au contrôle d'admission
+ADMISSION_CONTROLLED_PATHS = {
+    "/api/v1/transcription/upload",
+    "/api/v1/transcription/stream",
+    "/api/v1/transcription/jobs",
+    "/api/v1/transcription/pipeline",
+    "/api/v1/transcription/batch",
+}
+
+# Middleware de contrôle d'admission (déclaré avant CORS : les refus portent les en-têtes CORS)
+@app.middleware("http")
+async def admission_control(request: Request, call_next):
+    """
+    Refuse les transcriptions en cas de surcharge, avant la lecture du fichier
+    
+    La durée d'audio est estimée d'après Content-Length. Le ticket est
+    disponible pour la route dans request.state.admission_ticket ; il est
+    libéré ici sauf si la route l'a détaché (flux, job).
+    """
+    if (
+        not settings.ADMISSION_CONTROL_ENABLED
+        or request.method != "POST"
+        or request.url.path not in ADMISSION_CONTROLLED_PATHS
+    ):
+        return await call_next(request)
+    
+    try:
+        content_length = int(request.headers.get("content-length") or 0)
+    except ValueError:
+        content_length = 0
+    
+    try:
+        ticket = admission_controller.admit(
+            admission_controller.estimate_audio_seconds(content_length)
+        )
+    except AdmissionRejectedError as e:
+        return JSONResponse(
+            status_code=429,
+            content={"detail": str(e)},
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    
+    request.state.admission_ticket = ticket
+    try:
+        return await call_next(request)
+    finally:
+        if not ticket.detached:
+            ticket.release()
+
 # Configuration CORS
 app.add_middleware(
     CORSMiddleware,
@@ -84,6 +140,14 @@ async def log_requests(request: Request, call_next):
         f"Time: {process_time:.3f}s"
     )
     
+    # Étiquette = modèle de route (pas le chemin brut, pour borner la cardinalité)
+    route = request.scope.get("route")
+    metrics.HTTP_REQUEST_DURATION.labels(
+        method=request.method,
+        route=route.path if route is not None else "unmatched",
+        status=str(response.status_code)
+    ).observe(process_time)
+    
     return response
 
 # Inclusion des routes
@@ -106,6 +170,7 @@ async def root():
         "health": "/health",
         "endpoints": {
             "transcription": "/api/v1/transcription/upload",
+            "transcription_jobs": "/api/v1/transcription/jobs",
             "summary": "/api/v1/summary/generate"
         }
     }
@@ -122,17 +187,18 @@ async def health_check():
     
     Vérifie:
     - Disponibilité de l'API
-    - Connexion à Azure OpenAI
-    - État du système de fichiers
+    - Connexion à Azure OpenAI (résultat de la dernière sonde)
     """
     try:
-        # Vérification de la connexion Azure OpenAI
-        azure_connected = await azure_service.check_connection()
+        # Dernier état connu d'Azure OpenAI (sonde en arrière-plan)
+        azure_connected = await health_monitor.get_azure_status()
         
         return HealthResponse(
             status="healthy" if azure_connected else "degraded",
             version="1.0.0",
             azure_openai_connected=azure_connected,
+            azure_checked_at=health_monitor.checked_at,
+            azure_check_age_seconds=health_monitor.age_seconds,
             timestamp=datetime.utcnow()
         )
     except Exception as e:
@@ -148,6 +214,69 @@ async def health_check():
             }
         )
 
+@app.get(
+    "/health/live",
+    summary="Liveness probe",
+    description="Indique que le processus répond (sans vérifier les dépendances)"
+)
+async def liveness():
+    """Liveness probe"""
+    return {"status": "alive", "timestamp": datetime.utcnow().isoformat()}
+
+@app.get(
+    "/health/ready",
+    summary="Readiness probe",
+    description="Indique si l'API peut accepter des transcriptions (modèle chargé, file non pleine)"
+)
+async def readiness():
+    """
+    Readiness probe
+    
+    Prêt si un moteur de transcription est disponible et que la file
+    des jobs n'est pas pleine. L'état d'Azure OpenAI est indiqué sans
+    bloquer la transcription.
+    """
+    jobs = job_manager.stats()
+    transcription_ready = azure_service.transcription_available
+    queue_available = jobs["queue_depth"] < jobs["max_queue_size"]
+    is_ready = transcription_ready and queue_available
+    
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={
+            "status": "ready" if is_ready else "not_ready",
+            "transcription_ready": transcription_ready,
+            "model": azure_service.model_info(),
+            "queue": {
+                "depth": jobs["queue_depth"],
+                "max_size": jobs["max_queue_size"],
+                "processing": jobs["jobs"]["processing"]
+            },
+            "azure_openai": health_monitor.snapshot(),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    )
+
+# Jauges Prometheus lues au moment du scrape
+metrics.JOB_QUEUE_DEPTH.set_function(lambda: job_manager.stats()["queue_depth"])
+metrics.JOBS_IN_FLIGHT.set_function(lambda: job_manager.stats()["jobs"]["processing"])
+metrics.INFERENCE_QUEUE_DEPTH.set_function(lambda: inference_executor.stats()["queue_depth"])
+metrics.INFERENCE_RUNNING.set_function(lambda: inference_executor.stats()["running"])
+metrics.MODEL_REPLICAS_BUSY.set_function(lambda: azure_service.model_registry.busy_replicas())
+metrics.ADMISSION_PENDING.set_function(lambda: admission_controller.pending)
+metrics.ADMISSION_OUTSTANDING_AUDIO_SECONDS.set_function(
+    lambda: admission_controller.outstanding_audio_seconds
+)
+
+@app.get(
+    "/metrics",
+    include_in_schema=False,
+    summary="Métriques Prometheus"
+)
+async def prometheus_metrics():
+    """Exposition des métriques au format Prometheus"""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 # Événements de démarrage et arrêt
 @app.on_event("startup")
 async def startup_event():
@@ -157,26 +286,38 @@ async def startup_event():
     logger.info(f"🌐 CORS origins: {settings.cors_origins_list}")
     logger.info(f"🤖 Azure OpenAI endpoint: {settings.AZURE_OPENAI_ENDPOINT}")
     
+    # Chargement du modèle Whisper en arrière-plan (l'API répond pendant ce temps)
+    azure_service.start_model_loading()
+    
+    # Démarrage des workers de jobs de transcription
+    job_manager.start()
+    
     # Nettoyage initial des vieux fichiers
     deleted = await file_handler.cleanup_old_files()
     if deleted > 0:
         logger.info(f"🧹 Cleaned up {deleted} old files on startup")
     
-    # Test de connexion Azure
-    try:
-        is_connected = await azure_service.check_connection()
-        if is_connected:
-            logger.info("✅ Azure OpenAI connection: OK")
-        else:
-            logger.warning("⚠️ Azure OpenAI connection: FAILED")
-    except Exception as e:
-        logger.error(f"❌ Azure OpenAI connection error: {e}")
+    expired = transcription_cache.purge_expired()
+    if expired > 0:
+        logger.info(f"🧹 Purged {expired} expired cached transcriptions on startup")
+    
+    # Sonde Azure OpenAI en arrière-plan (premier test immédiat)
+    health_monitor.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Actions à l'arrêt de l'application"""
     logger.info("🛑 Shutting down Whispen API...")
     
+    await health_monitor.stop()
+    
+    # Arrêt des workers de jobs puis du pool d'inférence Whisper
+    await job_manager.stop()
+    inference_executor.shutdown()
+    
+    # Fermeture du pool de connexions Azure OpenAI
+    await azure_service.aclose()
+    
     # Nettoyage final (optionnel - peut être commenté en prod)
     # await file_handler.cleanup_old_files(hours=0)
 
@@ -22,6 +22,13 @@ class TranscriptionRequest(BaseModel):
     include_timestamps: bool = Field(default=False, description="Inclure les timestamps")
 
 
+class TranscriptionSegments(BaseModel):
+    """Segments horodatés, en colonnes (un élément par segment dans chaque liste)"""
+    start: List[float] = Field(description="Début de chaque segment (secondes)")
+    end: List[float] = Field(description="Fin de chaque segment (secondes)")
+    text: List[str] = Field(description="Texte de chaque segment")
+
+
 class TranscriptionResponse(BaseModel):
     """Réponse de transcription"""
     id: str = Field(description="ID unique de la transcription")
@@ -31,9 +38,41 @@ class TranscriptionResponse(BaseModel):
     word_count: int = Field(description="Nombre de mots")
     confidence: Optional[float] = Field(description="Score de confiance (0-1)", default=None)
     processing_time_seconds: float = Field(description="Temps de traitement")
+    model: Optional[str] = Field(default=None, description="Modèle Whisper utilisé")
+    cached: bool = Field(default=False, description="Résultat servi depuis le cache")
+    segments: Optional[TranscriptionSegments] = Field(
+        default=None, description="Segments horodatés (si include_timestamps)"
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class TranscriptionDraft(BaseModel):
+    """Transcription provisoire du mode deux passes, remplacée au fil de l'affinage"""
+    text: str = Field(description="Texte provisoire")
+    model: str = Field(description="Modèle du brouillon")
+    refined_until: float = Field(
+        description="Fin (secondes) de la partie déjà affinée par le modèle final"
+    )
+    segments: Optional[TranscriptionSegments] = Field(
+        default=None, description="Segments horodatés (si include_timestamps)"
+    )
+
+
+class TranscriptionJobResponse(BaseModel):
+    """État d'un job de transcription asynchrone"""
+    id: str = Field(description="ID unique du job")
+    status: TranscriptionStatus = Field(description="Statut du job")
+    progress: float = Field(default=0.0, description="Progression du décodage (0-1)")
+    filename: Optional[str] = Field(default=None, description="Nom du fichier uploadé")
+    result: Optional[TranscriptionResponse] = Field(default=None, description="Résultat si terminé")
+    draft: Optional[TranscriptionDraft] = Field(
+        default=None, description="Transcription provisoire (two_pass) en attendant le résultat"
+    )
+    error: Optional[str] = Field(default=None, description="Message d'erreur si échec")
+    created_at: datetime = Field(description="Date de création du job")
+    updated_at: datetime = Field(description="Dernière mise à jour du job")
+
+
 class SummaryRequest(BaseModel):
     """Requête de résumé"""
     transcription_text: str = Field(description="Texte à résumer")
@@ -50,6 +89,41 @@ class SummaryResponse(BaseModel):
     action_items: List[str] = Field(default_factory=list, description="Actions à mener")
     participants: List[str] = Field(default_factory=list, description="Participants mentionnés")
     processing_time_seconds: float = Field(description="Temps de traitement")
+    cached: bool = Field(default=False, description="Résultat servi depuis le cache")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class UploadSessionRequest(BaseModel):
+    """Ouverture d'un upload reprenable"""
+    filename: str = Field(description="Nom du fichier audio")
+    size_bytes: int = Field(gt=0, description="Taille totale du fichier en octets")
+
+
+class UploadSessionResponse(BaseModel):
+    """État d'un upload reprenable"""
+    id: str = Field(description="ID de la session d'upload")
+    filename: str = Field(description="Nom du fichier audio")
+    size_bytes: int = Field(description="Taille totale annoncée")
+    received_bytes: int = Field(description="Octets reçus : position du prochain bloc")
+    complete: bool = Field(description="Tous les octets sont reçus, l'upload peut être finalisé")
+    created_at: datetime = Field(description="Date de création de la session")
+    expires_at: datetime = Field(description="Expiration de la session sans nouveau bloc")
+
+
+class PipelineResponse(BaseModel):
+    """Transcription et résumé produits en une seule requête"""
+    id: str = Field(description="ID unique du traitement")
+    transcription: TranscriptionResponse = Field(description="Résultat de la transcription")
+    summary: Optional[SummaryResponse] = Field(
+        default=None, description="Résumé (absent si texte trop court ou échec)"
+    )
+    summary_error: Optional[str] = Field(
+        default=None, description="Message d'erreur si le résumé a échoué"
+    )
+    overlapped_summary_parts: int = Field(
+        default=0, description="Résumés partiels lancés pendant la transcription"
+    )
+    processing_time_seconds: float = Field(description="Temps de traitement total")
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
@@ -58,6 +132,12 @@ class HealthResponse(BaseModel):
     status: str = Field(description="Status de l'API")
     version: str = Field(description="Version de l'application")
     azure_openai_connected: bool = Field(description="Connexion Azure OpenAI OK")
+    azure_checked_at: Optional[datetime] = Field(
+        default=None, description="Date de la dernière sonde Azure OpenAI"
+    )
+    azure_check_age_seconds: Optional[float] = Field(
+        default=None, description="Âge du résultat de la sonde"
+    )
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
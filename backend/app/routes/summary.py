@@ -7,6 +7,9 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 from app.models.schemas import SummaryRequest, SummaryResponse, ErrorResponse
 from app.services.azure_service import azure_service
+from app.services.health_monitor import health_monitor
+from app.services.summary_cache import summary_cache
+from app.utils.metrics import STAGE_DURATION
 import uuid
 from datetime import datetime
 import logging
@@ -62,16 +65,18 @@ async def generate_summary(request: SummaryRequest) -> SummaryResponse:
         )
         
         # Construction de la réponse
-        response = SummaryResponse(
-            id=str(uuid.uuid4()),
-            summary=result["summary"],
-            key_points=result.get("key_points", []),
-            decisions=result.get("decisions", []),
-            action_items=result.get("action_items", []),
-            participants=result.get("participants", []),
-            processing_time_seconds=result["processing_time"],
-            created_at=datetime.utcnow()
-        )
+        with STAGE_DURATION.labels(stage="serialization").time():
+            response = SummaryResponse(
+                id=str(uuid.uuid4()),
+                summary=result["summary"],
+                key_points=result.get("key_points", []),
+                decisions=result.get("decisions", []),
+                action_items=result.get("action_items", []),
+                participants=result.get("participants", []),
+                processing_time_seconds=result["processing_time"],
+                cached=result.get("cached", False),
+                created_at=datetime.utcnow()
+            )
         
         logger.info(f"✅ Summary generated successfully")
         return response
@@ -104,15 +109,28 @@ async def quick_summary(transcription_text: str, language: str = "fr"):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get(
+    "/stats",
+    summary="Statistiques du service de résumé",
+    description="Taux de succès et occupation du cache des résumés"
+)
+async def summary_stats():
+    """Statistiques du cache des résumés"""
+    return {
+        "cache": summary_cache.stats(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
 @router.get(
     "/health",
     summary="Vérifie la disponibilité du service de résumé",
-    description="Teste la connexion à Azure OpenAI GPT-4"
+    description="État de la connexion à Azure OpenAI GPT-4 (dernière sonde en arrière-plan)"
 )
 async def summary_health():
     """Health check du service de résumé"""
     try:
-        is_connected = await azure_service.check_connection()
+        is_connected = await health_monitor.get_azure_status()
         
         return JSONResponse(
             status_code=200 if is_connected else 503,
@@ -120,8 +138,12 @@ async def summary_health():
                 "service": "summary",
                 "status": "operational" if is_connected else "unavailable",
                 "azure_gpt4": is_connected,
-                "timestamp": datetime.utcnow().isoformat()
-            }
+                "checked_at": (
+                    health_monitor.checked_at.isoformat() if health_monitor.checked_at else None
+                ),
+                "age_seconds": health_monitor.age_seconds,
+                "timestamp": datetime.utcnow().isoformat(),
+            },
         )
     except Exception as e:
         logger.error(f"❌ Health check failed: {e}")
@@ -3,26 +3,101 @@ Routes de transcription audio
 Endpoints pour upload et transcription de fichiers audio
 """
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from fastapi.responses import JSONResponse
-from app.models.schemas import TranscriptionResponse, ErrorResponse
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.requests import ClientDisconnect
+from app.config import settings
+from app.models.schemas import (
+    TranscriptionResponse, TranscriptionJobResponse, TranscriptionSegments, TranscriptionDraft,
+    PipelineResponse, SummaryResponse, UploadSessionRequest, UploadSessionResponse,
+    ErrorResponse, TranscriptionStatus
+)
+from app.services.admission_controller import (
+    admission_controller,
+    AdmissionTicket,
+    AdmissionRejectedError,
+)
 from app.services.azure_service import azure_service
+from app.services.batch_transcriber import batch_transcriber
+from app.services.audio_preprocessor import audio_preprocessor
+from app.services.health_monitor import health_monitor
+from app.services.inference_executor import inference_executor
+from app.services.job_manager import job_manager, JobQueueFullError, TranscriptionJob
+from app.services.model_router import model_router
+from app.services.pipeline import meeting_pipeline
+from app.services.transcription_cache import transcription_cache
+from app.services.upload_sessions import upload_session_manager, UploadOffsetError, UploadSession
 from app.utils.file_handler import file_handler
+from app.utils.segment_timeline import EXPORT_FORMATS
+from app.utils.metrics import STAGE_DURATION
 import uuid
 from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/transcription", tags=["Transcription"])
 
 
+# Délai suggéré aux clients pendant le chargement du modèle Whisper
+MODEL_LOADING_RETRY_AFTER_SECONDS = 10
+
+
+def _ensure_transcription_ready() -> None:
+    """
+    Refuse la requête (503) tant qu'aucun moteur de transcription n'est prêt
+    
+    Vérifié avant l'upload pour ne pas recevoir un fichier qui ne pourrait
+    pas être transcrit.
+    """
+    if azure_service.transcription_available:
+        return
+    
+    model = azure_service.model_info()
+    if model["status"] in ("not_loaded", "loading"):
+        raise HTTPException(
+            status_code=503,
+            detail="Modèle Whisper en cours de chargement, réessayez dans quelques secondes",
+            headers={"Retry-After": str(MODEL_LOADING_RETRY_AFTER_SECONDS)}
+        )
+    raise HTTPException(
+        status_code=503,
+        detail=f"Aucun moteur de transcription disponible ({model['error'] or model['status']})"
+    )
+
+
+def _requested_model(model: Optional[str]) -> Optional[str]:
+    """Modèle imposé par la requête, vérifié avant l'upload (400 si inconnu)"""
+    try:
+        return model_router.validate(model)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _admission_ticket(
+    request: Request, size_bytes: int, filename: Optional[str]
+) -> Optional[AdmissionTicket]:
+    """
+    Ticket réservé par le middleware d'admission, ajusté à la taille réelle du fichier
+    
+    None si le contrôle d'admission est désactivé.
+    """
+    ticket = getattr(request.state, "admission_ticket", None)
+    if ticket is not None:
+        ticket.resize(admission_controller.estimate_audio_seconds(size_bytes, filename))
+    return ticket
+
+
 @router.post(
     "/upload",
     response_model=TranscriptionResponse,
     responses={
         400: {"model": ErrorResponse},
         413: {"model": ErrorResponse},
-        500: {"model": ErrorResponse}
+        429: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
     },
     summary="Transcrit un fichier audio uploadé",
     description="""
@@ -36,8 +111,14 @@ router = APIRouter(prefix="/transcription", tags=["Transcription"])
     """
 )
 async def transcribe_upload(
+    request: Request,
     file: UploadFile = File(..., description="Fichier audio à transcrire"),
-    language: str = Form(default="fr", description="Code langue (fr, en, es, etc.)")
+    language: str = Form(default="fr", description="Code langue (fr, en, es, etc.)"),
+    include_timestamps: bool = Form(default=False, description="Inclure les segments horodatés"),
+    model: Optional[str] = Form(
+        default=None,
+        description="Modèle Whisper imposé, chargé à la demande (sinon choisi selon la durée)",
+    ),
 ) -> TranscriptionResponse:
     """
     Transcrit un fichier audio uploadé
@@ -45,6 +126,8 @@ async def transcribe_upload(
     Args:
         file: Fichier audio
         language: Code langue ISO 639-1
+        include_timestamps: Inclure les segments horodatés dans la réponse
+        model: Modèle Whisper imposé (taille, ex. base ou medium)
     
     Returns:
         TranscriptionResponse avec le texte transcrit et métadonnées
@@ -53,25 +136,25 @@ async def transcribe_upload(
     
     try:
         logger.info(f"📤 Received transcription request: {file.filename} (lang: {language})")
+        _ensure_transcription_ready()
+        model = _requested_model(model)
         
         # 1. Sauvegarde sécurisée du fichier
-        file_path, file_id = await file_handler.save_upload_file(file)
+        stored = await file_handler.ingest_upload(file)
+        file_path = stored.file_path
+        ticket = _admission_ticket(request, stored.size_bytes, file.filename)
         
-        # 2. Transcription via Azure OpenAI Whisper
-        result = await azure_service.transcribe_audio(file_path, language)
+        # 2. Transcription via Azure OpenAI Whisper (ou cache si déjà transcrit)
+        result = await azure_service.transcribe_audio(
+            file_path, language, content_hash=stored.sha256, model=model
+        )
+        if ticket is not None:
+            ticket.release(result)
         
         # 3. Construction de la réponse
-        response = TranscriptionResponse(
-            id=file_id,
-            text=result["text"],
-            language=result["language"],
-            duration_seconds=result.get("duration"),
-            word_count=result["word_count"],
-            processing_time_seconds=result["processing_time"],
-            created_at=datetime.utcnow()
-        )
+        response = _build_transcription_response(stored.file_id, result, include_timestamps)
         
-        logger.info(f"✅ Transcription completed: {file_id}")
+        logger.info(f"✅ Transcription completed: {stored.file_id}")
         return response
         
     except HTTPException:
@@ -88,15 +171,627 @@ async def transcribe_upload(
             await file_handler.delete_file(file_path)
 
 
+@router.post(
+    "/stream",
+    responses={
+        200: {"content": {"application/x-ndjson": {}}},
+        400: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Transcrit un fichier audio en streaming",
+    description="""
+    Upload un fichier audio et renvoie les segments au fur et à mesure du décodage
+    (NDJSON, un objet JSON par ligne).
+    
+    **Événements:**
+    - `draft` (si `two_pass`): brouillon complet du modèle rapide, remplacé par les
+      segments suivants
+    - `segment`: `start`, `end`, `text`, `progress` (0-1)
+    - `done`: texte complet et métadonnées
+    - `error`: `detail`
+    """
+)
+async def transcribe_stream(
+    request: Request,
+    file: UploadFile = File(..., description="Fichier audio à transcrire"),
+    language: str = Form(default="fr", description="Code langue (fr, en, es, etc.)"),
+    model: Optional[str] = Form(
+        default=None,
+        description="Modèle Whisper imposé, chargé à la demande (sinon choisi selon la durée)",
+    ),
+    two_pass: bool = Form(
+        default=False, description="Brouillon rapide (WHISPER_DRAFT_MODEL) avant le résultat final"
+    ),
+) -> StreamingResponse:
+    """
+    Transcrit un fichier audio en streaming NDJSON
+    
+    Args:
+        file: Fichier audio
+        language: Code langue ISO 639-1
+        model: Modèle Whisper imposé (taille, ex. base ou medium)
+        two_pass: Émettre d'abord un brouillon (événement draft)
+    
+    Returns:
+        StreamingResponse émettant un événement par segment décodé
+    """
+    logger.info(f"📤 Received streaming transcription request: {file.filename} (lang: {language})")
+    _ensure_transcription_ready()
+    model = _requested_model(model)
+    
+    stored = await file_handler.ingest_upload(file)
+    
+    # La place réservée est rendue à la fin du flux, pas au retour de la route
+    ticket = _admission_ticket(request, stored.size_bytes, file.filename)
+    if ticket is not None:
+        ticket.detach()
+    
+    async def event_stream() -> AsyncIterator[str]:
+        result = None
+        try:
+            async for event in azure_service.stream_transcription(
+                stored.file_path,
+                language,
+                content_hash=stored.sha256,
+                model=model,
+                two_pass=two_pass,
+            ):
+                if event["type"] == "done":
+                    event["id"] = stored.file_id
+                    result = event
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+        finally:
+            # Nettoyage du fichier temporaire (RGPD compliance)
+            await file_handler.delete_file(stored.file_path)
+            if ticket is not None:
+                ticket.release(result)
+    
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/jobs",
+    response_model=TranscriptionJobResponse,
+    status_code=202,
+    responses={
+        400: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Crée un job de transcription asynchrone",
+    description="""
+    Upload un fichier audio et retourne immédiatement un ID de job.
+    
+    La transcription est effectuée en arrière-plan ; suivre l'avancement via
+    `GET /api/v1/transcription/jobs/{job_id}`.
+    
+    Avec `two_pass`, un brouillon (champ `draft`) est disponible dès la fin de
+    la passe rapide, puis remplacé segment par segment par la passe finale.
+    """
+)
+async def create_transcription_job(
+    request: Request,
+    file: UploadFile = File(..., description="Fichier audio à transcrire"),
+    language: str = Form(default="fr", description="Code langue (fr, en, es, etc.)"),
+    model: Optional[str] = Form(
+        default=None,
+        description="Modèle Whisper imposé, chargé à la demande (sinon choisi selon la durée)",
+    ),
+    two_pass: bool = Form(
+        default=False, description="Brouillon rapide (WHISPER_DRAFT_MODEL) avant le résultat final"
+    ),
+) -> TranscriptionJobResponse:
+    """
+    Crée un job de transcription
+    
+    Args:
+        file: Fichier audio
+        language: Code langue ISO 639-1
+        model: Modèle Whisper imposé (taille, ex. base ou medium)
+        two_pass: Brouillon consultable (champ draft) pendant la passe finale
+    
+    Returns:
+        TranscriptionJobResponse avec le statut initial du job
+    """
+    logger.info(f"📤 Received transcription job: {file.filename} (lang: {language})")
+    _ensure_transcription_ready()
+    model = _requested_model(model)
+    
+    stored = await file_handler.ingest_upload(file)
+    ticket = _admission_ticket(request, stored.size_bytes, file.filename)
+    
+    try:
+        job = job_manager.submit(
+            stored.file_id,
+            stored.file_path,
+            language,
+            filename=file.filename,
+            content_hash=stored.sha256,
+            admission=ticket,
+            model=model,
+            two_pass=two_pass
+        )
+    except JobQueueFullError as e:
+        await file_handler.delete_file(stored.file_path)
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(admission_controller.estimated_wait_seconds())}
+        )
+    
+    # Le ticket est libéré par le job_manager à la fin du job
+    if ticket is not None:
+        ticket.detach()
+    return _build_job_response(job)
+
+
+@router.post(
+    "/uploads",
+    response_model=UploadSessionResponse,
+    status_code=201,
+    responses={
+        400: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Ouvre un upload reprenable",
+    description="""
+    Upload reprenable des gros fichiers, en trois étapes :
+    
+    1. `POST /uploads` : nom et taille du fichier, retourne l'ID de session
+    2. `PUT /uploads/{upload_id}?offset=N` : blocs envoyés dans l'ordre (corps brut),
+       à partir de la position `received_bytes` de la session
+    3. `POST /uploads/{upload_id}/complete` : empreinte SHA-256, puis transcription
+    
+    Après une coupure, `GET /uploads/{upload_id}` donne la position de reprise.
+    """
+)
+async def create_upload_session(request: UploadSessionRequest) -> UploadSessionResponse:
+    """
+    Ouvre une session d'upload reprenable
+    
+    Args:
+        request: Nom et taille du fichier (extension et taille vérifiées ici)
+    
+    Returns:
+        UploadSessionResponse avec l'ID de session
+    """
+    session = await upload_session_manager.create(request.filename, request.size_bytes)
+    return _build_upload_session_response(session)
+
+
+@router.get(
+    "/uploads/{upload_id}",
+    response_model=UploadSessionResponse,
+    responses={404: {"model": ErrorResponse}},
+    summary="Retourne l'état d'un upload reprenable",
+    description="Octets reçus (position du prochain bloc) après une coupure"
+)
+async def get_upload_session(upload_id: str) -> UploadSessionResponse:
+    """Retourne l'état d'un upload reprenable"""
+    return _build_upload_session_response(_upload_session(upload_id))
+
+
+@router.put(
+    "/uploads/{upload_id}",
+    response_model=UploadSessionResponse,
+    responses={
+        404: {"model": ErrorResponse},
+        409: {"model": ErrorResponse},
+        413: {"model": ErrorResponse}
+    },
+    summary="Envoie un bloc d'un upload reprenable",
+    description="""
+    Corps brut du bloc, écrit directement dans le fichier temporaire à la position `offset`.
+    
+    `offset` doit être égal aux octets déjà reçus ; sinon 409 avec la position
+    attendue (en-tête `Upload-Offset`).
+    """
+)
+async def upload_chunk(
+    upload_id: str,
+    request: Request,
+    offset: int = Query(
+        ..., ge=0, description="Position du bloc dans le fichier (octets déjà reçus)"
+    ),
+) -> UploadSessionResponse:
+    """
+    Écrit un bloc d'un upload reprenable
+    
+    Args:
+        upload_id: ID de la session d'upload
+        offset: Position du premier octet du bloc
+    
+    Returns:
+        UploadSessionResponse avec la nouvelle position
+    """
+    session = _upload_session(upload_id)
+    
+    try:
+        with STAGE_DURATION.labels(stage="upload").time():
+            await upload_session_manager.write(session, offset, request.stream())
+    except UploadOffsetError as e:
+        raise HTTPException(
+            status_code=409,
+            detail=str(e),
+            headers={"Upload-Offset": str(e.received_bytes)}
+        )
+    except ClientDisconnect:
+        # Octets écrits conservés : le client reprendra à received_bytes
+        logger.warning(f"⚠️ Upload {upload_id} interrupted at {session.received_bytes} bytes")
+    
+    return _build_upload_session_response(session)
+
+
+@router.delete(
+    "/uploads/{upload_id}",
+    status_code=204,
+    responses={404: {"model": ErrorResponse}},
+    summary="Abandonne un upload reprenable",
+    description="Supprime la session et les octets déjà reçus"
+)
+async def delete_upload_session(upload_id: str) -> Response:
+    """Abandonne un upload reprenable"""
+    if not await upload_session_manager.delete(upload_id):
+        raise HTTPException(status_code=404, detail="Upload introuvable")
+    return Response(status_code=204)
+
+
+@router.post(
+    "/uploads/{upload_id}/complete",
+    response_model=TranscriptionResponse,
+    responses={
+        400: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+        409: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Finalise un upload reprenable et le transcrit",
+    description="""
+    Vérifie l'empreinte SHA-256 du fichier reçu, le valide comme un upload
+    classique (sans nouvelle copie) puis le transcrit.
+    
+    Une empreinte différente supprime la session : l'upload est à recommencer.
+    """
+)
+async def complete_upload_session(
+    upload_id: str,
+    sha256: str = Form(..., description="Empreinte SHA-256 (hexadécimale) du fichier complet"),
+    language: str = Form(default="fr", description="Code langue (fr, en, es, etc.)"),
+    include_timestamps: bool = Form(default=False, description="Inclure les segments horodatés"),
+    model: Optional[str] = Form(
+        default=None,
+        description="Modèle Whisper imposé, chargé à la demande (sinon choisi selon la durée)",
+    ),
+) -> TranscriptionResponse:
+    """
+    Finalise un upload reprenable et transcrit le fichier
+    
+    Args:
+        upload_id: ID de la session d'upload
+        sha256: Empreinte SHA-256 du fichier complet
+        language: Code langue ISO 639-1
+        include_timestamps: Inclure les segments horodatés dans la réponse
+        model: Modèle Whisper imposé (taille, ex. base ou medium)
+    
+    Returns:
+        TranscriptionResponse avec le texte transcrit et métadonnées
+    """
+    session = _upload_session(upload_id)
+    _ensure_transcription_ready()
+    model = _requested_model(model)
+    ticket = _admit_upload_session(session)
+    file_path = None
+    
+    try:
+        stored = await upload_session_manager.finalize(session, sha256)
+        file_path = stored.file_path
+        
+        result = await azure_service.transcribe_audio(
+            file_path, language, content_hash=stored.sha256, model=model
+        )
+        if ticket is not None:
+            ticket.release(result)
+        
+        logger.info(f"✅ Transcription completed: {stored.file_id}")
+        return _build_transcription_response(stored.file_id, result, include_timestamps)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Transcription failed: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Erreur lors de la transcription: {str(e)}"
+        )
+    finally:
+        if ticket is not None:
+            ticket.release()
+        # Nettoyage du fichier temporaire (RGPD compliance)
+        if file_path:
+            await file_handler.delete_file(file_path)
+
+
+@router.post(
+    "/batch",
+    responses={
+        200: {"content": {"application/x-ndjson": {}}},
+        400: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Transcrit plusieurs fichiers audio en une requête",
+    description="""
+    Upload plusieurs fichiers audio (ou des archives zip de fichiers audio) et
+    renvoie chaque transcription dès qu'elle est terminée (NDJSON, un objet
+    JSON par ligne). Les fichiers sont transcrits `BATCH_MAX_CONCURRENT` à la fois.
+    
+    Chaque fichier est validé comme un upload individuel ; un fichier refusé
+    ou en échec n'interrompt pas le lot.
+    
+    **Événements:**
+    - `file`: `index`, `filename`, `status` (`completed` ou `failed`), `result` ou `error`
+    - `done`: nombre de fichiers transcrits et en échec
+    """
+)
+async def transcribe_batch(
+    request: Request,
+    files: List[UploadFile] = File(..., description="Fichiers audio ou archives zip"),
+    language: str = Form(default="fr", description="Code langue (fr, en, es, etc.)"),
+    include_timestamps: bool = Form(default=False, description="Inclure les segments horodatés"),
+    model: Optional[str] = Form(
+        default=None,
+        description="Modèle Whisper imposé, chargé à la demande (sinon choisi selon la durée)",
+    ),
+) -> StreamingResponse:
+    """
+    Transcrit un lot de fichiers audio en streaming NDJSON
+    
+    Args:
+        files: Fichiers audio ou archives zip
+        language: Code langue ISO 639-1
+        include_timestamps: Inclure les segments horodatés dans les résultats
+        model: Modèle Whisper imposé (taille, ex. base ou medium)
+    
+    Returns:
+        StreamingResponse émettant un événement par fichier traité
+    """
+    logger.info(f"📤 Received batch transcription request: {len(files)} files (lang: {language})")
+    _ensure_transcription_ready()
+    model = _requested_model(model)
+    
+    # Validation et sauvegarde avant le flux : les uploads sont fermés au retour de la route
+    items = await batch_transcriber.ingest(files)
+    
+    # La place réservée est rendue à la fin du lot, pas au retour de la route
+    ticket = getattr(request.state, "admission_ticket", None)
+    if ticket is not None:
+        ticket.detach()
+    
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async for event in batch_transcriber.run(items, language, model=model, ticket=ticket):
+                if event.get("result") is not None:
+                    event["result"] = _build_transcription_response(
+                        event["id"], event["result"], include_timestamps
+                    ).model_dump(mode="json")
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+        finally:
+            # Nettoyage des fichiers non transcrits (RGPD compliance)
+            await batch_transcriber.cleanup(items)
+            if ticket is not None:
+                ticket.release()
+    
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/pipeline",
+    response_model=PipelineResponse,
+    responses={
+        400: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Transcrit et résume un fichier audio en une requête",
+    description="""
+    Upload un fichier audio, le transcrit puis génère son résumé côté serveur :
+    le texte n'a pas à être renvoyé à `/api/v1/summary/generate`.
+    
+    Pour un long enregistrement, les extraits déjà transcrits sont résumés
+    pendant le décodage de la suite ; seule la fusion des résumés partiels
+    reste à faire à la fin de la transcription.
+    
+    Un échec du résumé n'annule pas la transcription (champ `summary_error`).
+    """
+)
+async def transcribe_and_summarize(
+    request: Request,
+    file: UploadFile = File(..., description="Fichier audio à transcrire"),
+    language: str = Form(default="fr", description="Code langue (fr, en, es, etc.)"),
+    summary_type: Literal["structured", "bullet_points", "short"] = Form(
+        default="structured", description="Type de résumé"
+    ),
+    include_timestamps: bool = Form(default=False, description="Inclure les segments horodatés"),
+    model: Optional[str] = Form(
+        default=None,
+        description="Modèle Whisper imposé, chargé à la demande (sinon choisi selon la durée)",
+    ),
+) -> PipelineResponse:
+    """
+    Transcrit et résume un fichier audio
+    
+    Args:
+        file: Fichier audio
+        language: Code langue ISO 639-1 (transcription et résumé)
+        summary_type: Type de résumé (structured, bullet_points, short)
+        include_timestamps: Inclure les segments horodatés dans la réponse
+        model: Modèle Whisper imposé (taille, ex. base ou medium)
+    
+    Returns:
+        PipelineResponse avec la transcription et le résumé
+    """
+    file_path = None
+    
+    try:
+        logger.info(
+            f"📤 Received pipeline request: {file.filename} "
+            f"(lang: {language}, summary: {summary_type})"
+        )
+        _ensure_transcription_ready()
+        model = _requested_model(model)
+        
+        stored = await file_handler.ingest_upload(file)
+        file_path = stored.file_path
+        ticket = _admission_ticket(request, stored.size_bytes, file.filename)
+        
+        result = await meeting_pipeline.run(
+            file_path, language, summary_type, content_hash=stored.sha256, model=model
+        )
+        if ticket is not None:
+            ticket.release(result["transcription"])
+        
+        summary = result["summary"]
+        response = PipelineResponse(
+            id=stored.file_id,
+            transcription=_build_transcription_response(
+                stored.file_id, result["transcription"], include_timestamps
+            ),
+            summary=_build_summary_response(summary) if summary else None,
+            summary_error=result["summary_error"],
+            overlapped_summary_parts=result["overlapped_summary_parts"],
+            processing_time_seconds=result["processing_time"]
+        )
+        
+        logger.info(f"✅ Pipeline completed: {stored.file_id}")
+        return response
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Pipeline failed: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Erreur lors de la transcription: {str(e)}"
+        )
+    finally:
+        # Nettoyage du fichier temporaire (RGPD compliance)
+        if file_path:
+            await file_handler.delete_file(file_path)
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=TranscriptionJobResponse,
+    responses={404: {"model": ErrorResponse}},
+    summary="Retourne l'état d'un job de transcription",
+    description="Statut, progression et résultat (une fois terminé) d'un job"
+)
+async def get_transcription_job(
+    job_id: str,
+    include_timestamps: bool = Query(default=False, description="Inclure les segments horodatés")
+) -> TranscriptionJobResponse:
+    """État d'un job de transcription"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job introuvable: {job_id}")
+    
+    return _build_job_response(job, include_timestamps)
+
+
+@router.get(
+    "/jobs/{job_id}/export",
+    responses={
+        200: {"content": {"application/x-subrip": {}, "text/vtt": {}, "application/json": {}}},
+        404: {"model": ErrorResponse},
+        409: {"model": ErrorResponse}
+    },
+    summary="Exporte les segments d'un job en sous-titres",
+    description="""
+    Génère un fichier SRT, WebVTT ou JSON à partir des segments horodatés
+    d'un job terminé. Le fichier est produit en streaming.
+    """
+)
+async def export_transcription_job(
+    job_id: str,
+    export_format: Literal["srt", "vtt", "json"] = Query(
+        default="srt", alias="format", description="srt, vtt ou json"
+    ),
+) -> StreamingResponse:
+    """Export des segments d'un job terminé"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job introuvable: {job_id}")
+    if job.status != TranscriptionStatus.COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Job non terminé (statut: {job.status.value})")
+    
+    timeline = job.result.get("segments")
+    if timeline is None:
+        raise HTTPException(status_code=404, detail="Aucun segment horodaté pour ce job")
+    
+    exporter, media_type = EXPORT_FORMATS[export_format]
+    return StreamingResponse(
+        exporter(timeline),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{job_id}.{export_format}"'}
+    )
+
+
+@router.get(
+    "/models",
+    summary="Modèles Whisper locaux",
+    description="""
+    Modèles pouvant être imposés (champ `model`), modèles chargés avec leur
+    mémoire et leurs hits, paliers de routage et derniers chargements/évictions.
+    """
+)
+async def list_models():
+    """Modèles Whisper disponibles et chargés"""
+    return {
+        "allowed": model_router.allowed_models,
+        "routing": model_router.stats(),
+        **azure_service.model_registry.stats()
+    }
+
+
+@router.get(
+    "/stats",
+    summary="Statistiques du moteur de transcription",
+    description="Pool d'inférence, file de jobs et cache des transcriptions"
+)
+async def transcription_stats():
+    """Statistiques du moteur de transcription"""
+    return {
+        "model": azure_service.model_info(),
+        "models": azure_service.model_registry.stats(),
+        "routing": model_router.stats(),
+        "batching": azure_service.batching_stats(),
+        "preprocessing": audio_preprocessor.stats(),
+        "executor": inference_executor.stats(),
+        "jobs": job_manager.stats(),
+        "admission": admission_controller.stats(),
+        "cache": transcription_cache.stats(),
+        "uploads": upload_session_manager.stats(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
 @router.get(
     "/health",
     summary="Vérifie la disponibilité du service de transcription",
-    description="Teste la connexion à Azure OpenAI Whisper"
+    description="État de la connexion à Azure OpenAI (dernière sonde en arrière-plan)"
 )
 async def transcription_health():
     """Health check du service de transcription"""
     try:
-        is_connected = await azure_service.check_connection()
+        is_connected = await health_monitor.get_azure_status()
         
         return JSONResponse(
             status_code=200 if is_connected else 503,
@@ -104,8 +799,12 @@ async def transcription_health():
                 "service": "transcription",
                 "status": "operational" if is_connected else "unavailable",
                 "azure_whisper": is_connected,
-                "timestamp": datetime.utcnow().isoformat()
-            }
+                "checked_at": (
+                    health_monitor.checked_at.isoformat() if health_monitor.checked_at else None
+                ),
+                "age_seconds": health_monitor.age_seconds,
+                "timestamp": datetime.utcnow().isoformat(),
+            },
         )
     except Exception as e:
         logger.error(f"❌ Health check failed: {e}")
@@ -118,3 +817,122 @@ async def transcription_health():
                 "timestamp": datetime.utcnow().isoformat()
             }
         )
+
+
+def _build_transcription_response(
+    file_id: str,
+    result: Dict[str, Any],
+    include_timestamps: bool = False
+) -> TranscriptionResponse:
+    """Construit la réponse API à partir du résultat du service"""
+    with STAGE_DURATION.labels(stage="serialization").time():
+        timeline = result.get("segments")
+        segments = None
+        if include_timestamps and timeline is not None:
+            # Colonnes déjà typées : pas de revalidation élément par élément
+            segments = TranscriptionSegments.model_construct(**timeline.to_columns())
+        
+        return TranscriptionResponse(
+            id=file_id,
+            text=result["text"],
+            language=result["language"],
+            duration_seconds=result.get("duration"),
+            word_count=result["word_count"],
+            processing_time_seconds=result["processing_time"],
+            model=result.get("model"),
+            cached=result.get("cached", False),
+            segments=segments,
+            created_at=datetime.utcnow()
+        )
+
+
+def _upload_session(upload_id: str) -> UploadSession:
+    """Session d'upload reprenable (404 si inconnue ou expirée)"""
+    session = upload_session_manager.get(upload_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Upload introuvable ou expiré")
+    return session
+
+
+def _admit_upload_session(session: UploadSession) -> Optional[AdmissionTicket]:
+    """
+    Ticket d'admission d'un upload reprenable, à la finalisation
+    
+    Le middleware ne voit que des blocs : la durée est estimée ici d'après la
+    taille du fichier complet. None si le contrôle d'admission est désactivé.
+    """
+    if not settings.ADMISSION_CONTROL_ENABLED:
+        return None
+    try:
+        return admission_controller.admit(
+            admission_controller.estimate_audio_seconds(session.size_bytes, session.filename)
+        )
+    except AdmissionRejectedError as e:
+        raise HTTPException(
+            status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)}
+        )
+
+
+def _build_upload_session_response(session: UploadSession) -> UploadSessionResponse:
+    """Construit la réponse API d'une session d'upload"""
+    return UploadSessionResponse(
+        id=session.id,
+        filename=session.filename,
+        size_bytes=session.size_bytes,
+        received_bytes=session.received_bytes,
+        complete=session.is_complete,
+        created_at=session.created_at,
+        expires_at=session.expires_at
+    )
+
+
+def _build_summary_response(result: Dict[str, Any]) -> SummaryResponse:
+    """Construit le résumé de la réponse du pipeline"""
+    with STAGE_DURATION.labels(stage="serialization").time():
+        return SummaryResponse(
+            id=str(uuid.uuid4()),
+            summary=result["summary"],
+            key_points=result.get("key_points", []),
+            decisions=result.get("decisions", []),
+            action_items=result.get("action_items", []),
+            participants=result.get("participants", []),
+            processing_time_seconds=result["processing_time"],
+            cached=result.get("cached", False),
+            created_at=datetime.utcnow()
+        )
+
+
+def _build_draft_response(
+    draft: Dict[str, Any], include_timestamps: bool = False
+) -> TranscriptionDraft:
+    """Construit la transcription provisoire d'un job en mode deux passes"""
+    segments = None
+    if include_timestamps:
+        segments = TranscriptionSegments.model_construct(**draft["segments"].to_columns())
+    
+    return TranscriptionDraft(
+        text=draft["text"],
+        model=draft["model"],
+        refined_until=round(draft["refined_until"], 3),
+        segments=segments
+    )
+
+
+def _build_job_response(
+    job: TranscriptionJob, include_timestamps: bool = False
+) -> TranscriptionJobResponse:
+    """Construit la réponse API d'un job"""
+    return TranscriptionJobResponse(
+        id=job.id,
+        status=job.status,
+        progress=round(job.progress, 3),
+        filename=job.filename,
+        result=(
+            _build_transcription_response(job.id, job.result, include_timestamps)
+            if job.result else None
+        ),
+        draft=_build_draft_response(job.draft, include_timestamps) if job.draft else None,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at
+    )
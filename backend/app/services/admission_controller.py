@@ -0,0 +1,210 @@
+"""
+Contrôle d'admission des transcriptions
+Limite les transcriptions en attente (nombre et durée d'audio) et calcule
+le Retry-After à partir du débit mesuré
+"""
+
+from app.config import settings
+from app.utils.metrics import ADMISSION_REJECTED
+from pathlib import Path
+import logging
+import math
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Octets par seconde d'audio des formats non compressés (WAV 16 kHz mono 16 bits)
+BYTES_PER_AUDIO_SECOND_BY_EXTENSION = {
+    "wav": 32000,
+    "flac": 24000,
+}
+
+# Poids de la dernière mesure dans la moyenne mobile de la vitesse
+SPEED_SMOOTHING = 0.2
+
+
+class AdmissionRejectedError(Exception):
+    """Transcription refusée : serveur saturé"""
+
+    def __init__(self, message: str, retry_after: int, reason: str):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class AdmissionTicket:
+    """
+    Place réservée par une transcription acceptée
+
+    La place est rendue par release() (idempotent). Un ticket détaché
+    (detach) est libéré par son nouveau propriétaire : flux ou job.
+    """
+
+    def __init__(self, controller: "AdmissionController", audio_seconds: float):
+        self._controller = controller
+        self.audio_seconds = audio_seconds
+        self.admitted_at = time.monotonic()
+        self.detached = False
+        self.released = False
+
+    def resize(self, audio_seconds: float) -> None:
+        """Corrige la durée estimée (taille réelle du fichier connue)"""
+        if not self.released:
+            self._controller.outstanding_audio_seconds += audio_seconds - self.audio_seconds
+            self.audio_seconds = audio_seconds
+
+    def detach(self) -> "AdmissionTicket":
+        """Transfère la libération au code qui poursuit le traitement"""
+        self.detached = True
+        return self
+
+    def release(self, result: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Rend la place réservée
+
+        Args:
+            result: Résultat de la transcription, mesure le débit (hors cache)
+        """
+        if self.released:
+            return
+        self.released = True
+        self._controller._release(self)
+
+        if result and not result.get("cached"):
+            self._controller.record_completion(
+                result.get("duration"), result.get("processing_time")
+            )
+
+
+class AdmissionController:
+    """
+    Admission des transcriptions selon la profondeur de file et l'audio en attente
+
+    Le débit de vidage est la vitesse moyenne mesurée (secondes d'audio
+    traitées par seconde et par transcription) multipliée par le nombre
+    de transcriptions traitées en parallèle. Le Retry-After est le temps
+    nécessaire pour libérer assez de place pour la requête refusée.
+    """
+
+    def __init__(self):
+        self.pending = 0
+        self.outstanding_audio_seconds = 0.0
+        self.admitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self._speed: Optional[float] = None
+
+    @staticmethod
+    def estimate_audio_seconds(size_bytes: int, filename: Optional[str] = None) -> float:
+        """Durée d'audio estimée d'après la taille du fichier (avant décodage)"""
+        extension = Path(filename or "").suffix.lower().lstrip(".")
+        bytes_per_second = BYTES_PER_AUDIO_SECOND_BY_EXTENSION.get(
+            extension, settings.ADMISSION_BYTES_PER_AUDIO_SECOND
+        )
+        return max(size_bytes, 0) / bytes_per_second
+
+    @property
+    def speed(self) -> float:
+        """Secondes d'audio traitées par seconde, pour une transcription"""
+        return self._speed or settings.ADMISSION_INITIAL_SPEED
+
+    def drain_rate(self) -> float:
+        """Secondes d'audio traitées par seconde par l'ensemble du service"""
+        active = min(max(self.pending, 1), settings.transcription_slots)
+        return self.speed * active
+
+    def retry_after(self, excess_audio_seconds: float) -> int:
+        """Secondes avant que `excess_audio_seconds` d'audio en attente soient traitées"""
+        seconds = math.ceil(max(excess_audio_seconds, 0.0) / self.drain_rate())
+        return min(max(seconds, 1), settings.ADMISSION_MAX_RETRY_AFTER_SECONDS)
+
+    def estimated_wait_seconds(self) -> int:
+        """Temps estimé pour traiter tout l'audio en attente"""
+        return self.retry_after(self.outstanding_audio_seconds)
+
+    def admit(self, audio_seconds: float) -> AdmissionTicket:
+        """
+        Réserve une place pour une transcription
+
+        Une requête est toujours acceptée si rien n'est en attente, même si
+        son audio dépasse le budget.
+
+        Raises:
+            AdmissionRejectedError: Si la file ou le budget d'audio est plein
+        """
+        if self.pending:
+            if self.pending >= settings.ADMISSION_MAX_PENDING:
+                # Place libérée quand assez de transcriptions en attente sont terminées
+                to_finish = self.pending - settings.ADMISSION_MAX_PENDING + 1
+                average = self.outstanding_audio_seconds / self.pending
+                self._reject(
+                    "queue_full",
+                    f"Trop de transcriptions en cours ({self.pending})",
+                    self.retry_after(average * to_finish)
+                )
+
+            excess = (
+                self.outstanding_audio_seconds
+                + audio_seconds
+                - settings.ADMISSION_MAX_AUDIO_SECONDS
+            )
+            if excess > 0:
+                self._reject(
+                    "audio_backlog",
+                    f"Trop d'audio en attente ({self.outstanding_audio_seconds:.0f}s)",
+                    self.retry_after(excess)
+                )
+
+        self.pending += 1
+        self.outstanding_audio_seconds += audio_seconds
+        self.admitted += 1
+        return AdmissionTicket(self, audio_seconds)
+
+    def _reject(self, reason: str, message: str, retry_after: int) -> None:
+        self.rejected += 1
+        ADMISSION_REJECTED.labels(reason=reason).inc()
+        logger.warning(f"🚦 Transcription rejected ({reason}), retry after {retry_after}s")
+        raise AdmissionRejectedError(
+            f"{message}, réessayez dans {retry_after}s", retry_after, reason
+        )
+
+    def _release(self, ticket: AdmissionTicket) -> None:
+        self.pending -= 1
+        self.outstanding_audio_seconds = max(
+            self.outstanding_audio_seconds - ticket.audio_seconds, 0.0
+        )
+
+    def record_completion(
+        self, audio_seconds: Optional[float], processing_seconds: Optional[float]
+    ) -> None:
+        """Met à jour la vitesse mesurée avec une transcription terminée"""
+        if not audio_seconds or not processing_seconds:
+            return
+
+        speed = audio_seconds / processing_seconds
+        if self._speed is None:
+            self._speed = speed
+        else:
+            self._speed += SPEED_SMOOTHING * (speed - self._speed)
+        self.completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne l'occupation et le débit estimé"""
+        return {
+            "enabled": settings.ADMISSION_CONTROL_ENABLED,
+            "pending": self.pending,
+            "max_pending": settings.ADMISSION_MAX_PENDING,
+            "outstanding_audio_seconds": round(self.outstanding_audio_seconds, 1),
+            "max_audio_seconds": settings.ADMISSION_MAX_AUDIO_SECONDS,
+            "speed": round(self.speed, 3),
+            "drain_rate": round(self.drain_rate(), 3),
+            "estimated_wait_seconds": self.estimated_wait_seconds() if self.pending else 0,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "completed": self.completed
+        }
+
+
+# Instance globale
+admission_controller = AdmissionController()
@@ -0,0 +1,174 @@
+"""
+Prétraitement audio : décodage unique des uploads
+Convertit chaque fichier une seule fois en PCM float32 16 kHz mono, en memmap
+"""
+
+from pathlib import Path
+from app.utils.audio_chunker import SAMPLING_RATE
+from app.utils.file_handler import PCM_SIDECAR_SUFFIX
+from app.utils.metrics import STAGE_DURATION
+import asyncio
+import logging
+import numpy as np
+import os
+import threading
+import wave
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Import conditionnel du décodeur de faster-whisper (PyAV)
+try:
+    from faster_whisper.audio import decode_audio
+    DECODER_AVAILABLE = True
+except ImportError:
+    DECODER_AVAILABLE = False
+
+try:
+    import av
+    PROBE_AVAILABLE = True
+except ImportError:
+    PROBE_AVAILABLE = False
+
+
+class AudioPreprocessor:
+    """
+    Décodage des uploads vers un fichier .npy à côté de l'original
+
+    Le tableau est relu en memmap par la transcription, le découpage et
+    le calcul de durée ; il est supprimé avec l'upload (file_handler).
+    Les WAV déjà en 16 kHz mono 16 bits sont lus directement, sans décodeur.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.decoded = 0
+        self.wav_passthrough = 0
+        self.reused = 0
+
+    @staticmethod
+    def sidecar_path(file_path: str) -> Path:
+        """Chemin du fichier PCM associé à un upload"""
+        return Path(f"{file_path}{PCM_SIDECAR_SUFFIX}")
+
+    async def prepare(self, file_path: str) -> np.ndarray:
+        """
+        Retourne l'audio décodé (décodage dans un thread si nécessaire)
+
+        Hors du pool d'inférence : ses threads sont réservés aux décodages
+        Whisper qui ont obtenu une réplique.
+        """
+        return await asyncio.to_thread(self.load, file_path)
+
+    def load(self, file_path: str) -> np.ndarray:
+        """
+        Retourne l'audio PCM float32 16 kHz mono d'un upload (bloquant)
+
+        Args:
+            file_path: Chemin de l'upload
+
+        Returns:
+            Tableau en lecture seule, adossé au fichier .npy
+        """
+        sidecar = self.sidecar_path(file_path)
+        if sidecar.exists():
+            with self._lock:
+                self.reused += 1
+            return np.load(sidecar, mmap_mode="r")
+
+        with STAGE_DURATION.labels(stage="decode").time():
+            samples = self._read_pcm_wav(file_path)
+            if samples is not None:
+                with self._lock:
+                    self.wav_passthrough += 1
+            else:
+                if not DECODER_AVAILABLE:
+                    raise RuntimeError("faster-whisper is not installed, cannot decode audio")
+                samples = decode_audio(file_path, sampling_rate=SAMPLING_RATE)
+                with self._lock:
+                    self.decoded += 1
+
+        # Écriture atomique : un lecteur concurrent ne voit jamais un fichier partiel
+        part_path = Path(f"{sidecar}.{threading.get_ident()}.part")
+        try:
+            pcm = np.lib.format.open_memmap(
+                part_path, mode="w+", dtype=np.float32, shape=samples.shape
+            )
+            pcm[:] = samples
+            pcm.flush()
+            del pcm
+            os.replace(part_path, sidecar)
+        finally:
+            if part_path.exists():
+                part_path.unlink()
+
+        logger.info(
+            f"🎚️ Audio prepared: {Path(file_path).name} ({len(samples) / SAMPLING_RATE:.1f}s)"
+        )
+        return np.load(sidecar, mmap_mode="r")
+
+    def probe_duration(self, file_path: str) -> Optional[float]:
+        """
+        Durée d'un upload sans le décoder (bloquant, lecture des en-têtes)
+
+        Returns:
+            Durée en secondes, None si le conteneur ne l'indique pas
+        """
+        sidecar = self.sidecar_path(file_path)
+        if sidecar.exists():
+            return self.duration(np.load(sidecar, mmap_mode="r"))
+
+        try:
+            with wave.open(str(file_path), "rb") as wav:
+                return wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError, OSError):
+            pass
+
+        if not PROBE_AVAILABLE:
+            return None
+        try:
+            with av.open(str(file_path)) as container:
+                if container.duration:
+                    return container.duration / av.time_base
+                stream = next(iter(container.streams.audio), None)
+                if stream is not None and stream.duration and stream.time_base:
+                    return float(stream.duration * stream.time_base)
+        except Exception as e:
+            logger.debug(f"Could not probe duration of {file_path}: {e}")
+        return None
+
+    @staticmethod
+    def duration(audio: np.ndarray) -> float:
+        """Durée en secondes d'un audio préparé"""
+        return len(audio) / SAMPLING_RATE
+
+    @staticmethod
+    def _read_pcm_wav(file_path: str) -> Optional[np.ndarray]:
+        """Lit un WAV PCM 16 bits 16 kHz mono sans décodeur, None pour tout autre format"""
+        try:
+            with wave.open(str(file_path), "rb") as wav:
+                if (
+                    wav.getnchannels() != 1
+                    or wav.getframerate() != SAMPLING_RATE
+                    or wav.getsampwidth() != 2
+                    or wav.getcomptype() != "NONE"
+                ):
+                    return None
+                frames = wav.readframes(wav.getnframes())
+        except (wave.Error, EOFError, OSError):
+            return None
+
+        return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne le nombre de décodages évités"""
+        with self._lock:
+            return {
+                "decoded": self.decoded,
+                "wav_passthrough": self.wav_passthrough,
+                "reused": self.reused
+            }
+
+
+# Instance globale
+audio_preprocessor = AudioPreprocessor()
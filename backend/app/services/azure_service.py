@@ -3,22 +3,80 @@ Service Azure OpenAI pour transcription et résumé
 Gère les appels à Whisper (local ou OpenAI) et GPT-4 (Azure)
 """
 
-from openai import AzureOpenAI, OpenAI
+from openai import AsyncAzureOpenAI, AsyncOpenAI
+from contextlib import asynccontextmanager
+from pathlib import Path
 from app.config import settings
+from app.services.inference_executor import inference_executor
+from app.services.model_pool import WhisperModelPool, pin_current_thread
+from app.services.model_registry import ModelRegistry
+from app.services.micro_batcher import MicroBatcher
+from app.services.model_router import RoutingDecision, model_router
+from app.services.audio_preprocessor import audio_preprocessor
+from app.services.transcription_cache import transcription_cache
+from app.services.summary_cache import summary_cache
+from app.utils.text_chunker import estimate_tokens, chunk_text
+from app.utils.retry import is_retryable, get_retry_after, compute_backoff
+from app.utils.audio_chunker import SAMPLING_RATE, AudioChunk, plan_chunks, deduplicate_boundary
+from app.utils.segment_timeline import SegmentTimeline
+from app.utils.metrics import (
+    STAGE_DURATION, TRANSCRIPTION_RTF, TRANSCRIPTION_AUDIO_SECONDS,
+    AZURE_REQUESTS, AZURE_ERRORS, AZURE_RETRIES, error_label
+)
+import asyncio
+import bisect
+import functools
+import httpx
 import logging
+import numpy as np
+import os
+import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Callable, AsyncIterator, Awaitable, Set, List, Union
 
 logger = logging.getLogger(__name__)
 
 # Import conditionnel de faster-whisper
 try:
-    from faster_whisper import WhisperModel
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+    from faster_whisper.vad import VadOptions, get_speech_timestamps, merge_segments
     FASTER_WHISPER_AVAILABLE = True
 except ImportError:
     FASTER_WHISPER_AVAILABLE = False
     logger.warning("⚠️ faster-whisper not installed, local transcription unavailable")
 
+# Préchauffage du modèle : une seconde de silence à 16 kHz
+WARMUP_SAMPLES = 16000
+
+# Options de décodage Whisper local (font partie de la clé de cache)
+LOCAL_DECODE_OPTIONS = {
+    "beam_size": 5,
+    "vad_filter": True  # Voice Activity Detection pour meilleure qualité
+}
+
+# Brouillon du mode deux passes : décodage glouton, le plus rapide
+DRAFT_DECODE_OPTIONS = {
+    "beam_size": 1,
+    "vad_filter": True
+}
+
+# Silence minimum (ms) pour placer une coupe entre deux blocs
+CHUNK_MIN_SILENCE_MS = 500
+
+# Durée maximum d'un clip dans un lot (fenêtre d'entrée de Whisper)
+BATCH_CLIP_SECONDS = 30
+
+# Décodage des lots : pipeline batché sur les zones de parole (VAD) des clips ;
+# résultat différent du décodage séquentiel, donc clé de cache distincte
+BATCH_DECODE_OPTIONS = {
+    "beam_size": 5,
+    "batched": True
+}
+
+
+class TranscriptionCancelledError(Exception):
+    """Le décodage a été interrompu (client déconnecté)"""
+
 
 class AzureOpenAIService:
     """Service pour interagir avec Azure OpenAI et Whisper local"""
@@ -26,50 +84,195 @@ class AzureOpenAIService:
     def __init__(self):
         """Initialise les clients Azure OpenAI, OpenAI et Whisper local"""
         try:
+            # Pool de connexions HTTP partagé par les clients asynchrones
+            self.http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                timeout=httpx.Timeout(settings.HTTP_TIMEOUT_SECONDS, connect=10.0)
+            )
+            
+            # Limite des requêtes Azure/OpenAI simultanées
+            self._request_semaphore = asyncio.Semaphore(settings.AZURE_MAX_CONCURRENT_REQUESTS)
+            
             # Client Azure OpenAI pour GPT-4 (résumé)
-            self.azure_client = AzureOpenAI(
+            # Les nouvelles tentatives sont gérées par _call_with_retries
+            self.azure_client = AsyncAzureOpenAI(
                 api_key=settings.AZURE_OPENAI_API_KEY,
                 api_version=settings.AZURE_OPENAI_API_VERSION,
-                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT
+                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
+                http_client=self.http_client,
+                max_retries=0
             )
             logger.info("✅ Azure OpenAI client initialized successfully")
             
             # Client OpenAI standard pour Whisper (transcription)
             if settings.USE_OPENAI_WHISPER:
-                self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
+                self.openai_client = AsyncOpenAI(
+                    api_key=settings.OPENAI_API_KEY,
+                    http_client=self.http_client,
+                    max_retries=0
+                )
                 logger.info("✅ OpenAI client initialized for Whisper")
             else:
                 self.openai_client = None
             
-            # Modèle Whisper local avec faster-whisper
-            if settings.USE_LOCAL_WHISPER:
-                if not FASTER_WHISPER_AVAILABLE:
-                    error_msg = "faster-whisper is not installed. Install it with: pip install faster-whisper==1.1.0"
-                    logger.error(f"❌ {error_msg}")
-                    raise ImportError(error_msg)
-                    
-                logger.info(f"🔄 Loading Whisper model '{settings.WHISPER_MODEL_SIZE}'...")
-                try:
-                    self.whisper_model = WhisperModel(
-                        settings.WHISPER_MODEL_SIZE,
-                        device="cpu",  # Utilise CPU (changez en "cuda" si GPU disponible)
-                        compute_type="int8"  # Optimisation pour CPU
-                    )
-                    logger.info("✅ Local Whisper model loaded successfully")
-                except Exception as model_error:
-                    logger.error(f"❌ Failed to load Whisper model: {model_error}")
-                    raise
-            else:
-                self.whisper_model = None
+            # Modèles Whisper locaux chargés à la demande (éviction LRU) ; le modèle
+            # par défaut est chargé en arrière-plan au démarrage (load_models)
+            self.model_registry = ModelRegistry(self._load_whisper_model)
+            self.micro_batchers: Dict[str, MicroBatcher] = {}
+            self.model_status = "not_loaded" if settings.USE_LOCAL_WHISPER else "disabled"
+            self.model_error: Optional[str] = None
+            self.model_load_seconds: Optional[float] = None
+            self._model_load_task: Optional[asyncio.Task] = None
                 
         except Exception as e:
             logger.error(f"❌ Failed to initialize clients: {e}")
             raise
     
+    async def _run_on_replica(self, pool: WhisperModelPool, func: Callable[..., Any], *args) -> Any:
+        """
+        Soumet un décodage à l'exécuteur une fois une réplique du pool réservée
+        
+        L'exécuteur étant partagé par tous les modèles, un thread ne doit jamais
+        attendre une réplique : il bloquerait les décodages des autres modèles.
+        Si l'appelant est annulé, la réservation dure jusqu'à la fin du décodage
+        déjà lancé dans son thread.
+        """
+        release = await pool.reserve()
+        try:
+            job = asyncio.ensure_future(inference_executor.run(func, pool, *args))
+        except BaseException:
+            release()
+            raise
+        
+        def on_done(done: "asyncio.Future[Any]") -> None:
+            release()
+            if not done.cancelled():
+                done.exception()  # Évite « exception never retrieved » après une annulation
+        
+        job.add_done_callback(on_done)
+        return await asyncio.shield(job)
+    
+    @property
+    def model_pool(self) -> WhisperModelPool:
+        """Pool du modèle par défaut (WHISPER_MODEL_SIZE)"""
+        return self.pool_for(settings.WHISPER_MODEL_SIZE)
+    
+    def pool_for(self, model: Optional[str]) -> WhisperModelPool:
+        """
+        Pool de répliques d'un modèle du registre (vide s'il n'est pas chargé)
+        
+        À appeler depuis l'event loop : les threads d'inférence reçoivent le
+        pool résolu et ne consultent jamais le registre.
+        """
+        return self.model_registry.pool(model or settings.WHISPER_MODEL_SIZE)
+    
+    def _batcher_for(self, model: str) -> MicroBatcher:
+        """Micro-batcher d'un modèle : les lots ne mélangent pas les modèles"""
+        if model not in self.micro_batchers:
+            self.micro_batchers[model] = MicroBatcher(
+                functools.partial(self._decode_batch, model=model),
+                max_batch_size=settings.WHISPER_BATCH_MAX_SIZE,
+                max_wait_ms=settings.WHISPER_BATCH_MAX_WAIT_MS
+            )
+        return self.micro_batchers[model]
+    
+    def batching_stats(self) -> Dict[str, Any]:
+        """Statistiques des micro-batchers, par modèle"""
+        return {model: batcher.stats() for model, batcher in self.micro_batchers.items()}
+    
+    @property
+    def whisper_model(self) -> Optional["WhisperModel"]:
+        """Modèle de la première réplique (None tant qu'aucune n'est chargée)"""
+        return self.model_pool.primary
+    
+    @whisper_model.setter
+    def whisper_model(self, model: Optional["WhisperModel"]) -> None:
+        """Remplace le pool par une réplique unique"""
+        self.model_pool.clear()
+        if model is not None:
+            self.model_pool.add(model)
+    
+    def start_model_loading(self) -> None:
+        """Lance le chargement du modèle Whisper en tâche de fond (idempotent)"""
+        if settings.USE_LOCAL_WHISPER and self._model_load_task is None:
+            self._model_load_task = asyncio.create_task(self.load_models())
+    
+    async def load_models(self) -> None:
+        """
+        Charge les répliques du modèle Whisper par défaut et les préchauffe
+        
+        Le chargement s'exécute dans des threads dédiés : l'API répond aux
+        health checks et aux résumés pendant ce temps. Le service est prêt
+        dès la première réplique chargée ; les suivantes s'ajoutent au pool.
+        Les autres modèles sont chargés par le registre à leur première demande.
+        """
+        if not FASTER_WHISPER_AVAILABLE:
+            self.model_status = "failed"
+            self.model_error = (
+                "faster-whisper is not installed. "
+                "Install it with: pip install faster-whisper==1.1.0"
+            )
+            logger.error(f"❌ {self.model_error}")
+            return
+        
+        self.model_status = "loading"
+        start_time = time.time()
+        
+        try:
+            await self.model_registry.ensure(settings.WHISPER_MODEL_SIZE)
+        except Exception as model_error:
+            self.model_status = "failed"
+            self.model_error = str(model_error)
+            logger.error(f"❌ Failed to load Whisper model: {model_error}")
+            return
+        
+        self.model_load_seconds = round(time.time() - start_time, 2)
+        self.model_status = "ready"
+        logger.info(
+            f"✅ Local Whisper model loaded and warmed up in {self.model_load_seconds:.2f}s"
+        )
+        
+        # Répliques suivantes
+        await self.model_registry.wait_loaded(settings.WHISPER_MODEL_SIZE)
+    
+    def _load_whisper_model(
+        self,
+        cpu_ids: Optional[Set[int]] = None,
+        model_size: Optional[str] = None
+    ) -> "WhisperModel":
+        """Charge une réplique et décode une seconde de silence (bloquant, dans un thread)"""
+        # Les threads CTranslate2 créés ici héritent de l'affinité de la réplique
+        with pin_current_thread(cpu_ids):
+            model = WhisperModel(
+                model_size or settings.WHISPER_MODEL_SIZE,
+                device="cpu",  # Utilise CPU (changez en "cuda" si GPU disponible)
+                compute_type="int8",  # Optimisation pour CPU
+                cpu_threads=settings.WHISPER_THREADS_PER_REPLICA,
+                num_workers=1  # Le parallélisme vient des répliques
+            )
+            
+            # Préchauffage : le premier décodage initialise les buffers CTranslate2
+            segments, _ = model.transcribe(
+                np.zeros(WARMUP_SAMPLES, dtype=np.float32),
+                language="fr",
+                beam_size=1,
+                vad_filter=False
+            )
+            list(segments)
+        return model
+    
     async def transcribe_audio(
         self, 
         audio_file_path: str, 
-        language: Optional[str] = "fr"
+        language: Optional[str] = "fr",
+        progress_callback: Optional[Callable[[float], None]] = None,
+        content_hash: Optional[str] = None,
+        model: Optional[str] = None,
+        draft_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        segment_callback: Optional[Callable[[float, float, str], None]] = None
     ) -> Dict[str, Any]:
         """
         Transcrit un fichier audio avec Whisper (local ou OpenAI)
@@ -77,6 +280,13 @@ class AzureOpenAIService:
         Args:
             audio_file_path: Chemin vers le fichier audio
             language: Code langue (fr, en, etc.)
+            progress_callback: Appelé avec la progression (0-1) à chaque segment décodé
+            content_hash: SHA-256 du fichier audio, active le cache des transcriptions
+            model: Modèle Whisper local imposé (sinon choisi selon la durée)
+            draft_callback: Active le mode deux passes (Whisper local) : appelé avec le
+                brouillon (WHISPER_DRAFT_MODEL) puis à chaque segment affiné qui le remplace
+            segment_callback: Appelé dans l'event loop avec chaque segment final (début,
+                fin, texte), dans l'ordre chronologique, dès que possible (Whisper local)
         
         Returns:
             Dict contenant le texte transcrit et les métadonnées
@@ -86,42 +296,102 @@ class AzureOpenAIService:
         try:
             logger.info(f"🎤 Starting transcription for: {audio_file_path}")
             
-            # Option 1: Whisper local avec faster-whisper
+            # Modèle local choisi d'après la durée, avant tout décodage
+            decision = None
             if settings.USE_LOCAL_WHISPER and self.whisper_model:
-                segments, info = self.whisper_model.transcribe(
-                    audio_file_path,
-                    language=language,
-                    beam_size=5,
-                    vad_filter=True  # Voice Activity Detection pour meilleure qualité
-                )
+                decision = await self._route_transcription(audio_file_path, model)
+            
+            # Transcription déjà en cache pour ce contenu audio
+            requested_language = language
+            cache_key = self._transcription_cache_key(
+                content_hash, language,
+                decision.model if decision else None,
+                self._local_decode_options(language, decision.duration) if decision else None
+            )
+            cached = await self._get_cached_transcription(cache_key, audio_file_path)
+            if cached:
+                cached["processing_time"] = time.time() - start_time
+                return cached
+            
+            # Option 1: Whisper local avec faster-whisper
+            if decision:
+                # Décodage unique en PCM 16 kHz, réutilisé par tous les modes
+                audio = await audio_preprocessor.prepare(audio_file_path)
+                draft = None
+                if draft_callback is not None:
+                    # Brouillon rapide sur le même audio décodé, livré avant la passe finale
+                    draft = await self._transcribe_draft(audio, language, decision.model)
+                    if draft:
+                        draft_callback(draft)
+                        language = language or draft["language"]
                 
-                # Reconstruction du texte complet
-                text = " ".join([segment.text for segment in segments])
-                duration = info.duration
-                detected_language = info.language
+                async with self._local_model(decision) as decision:
+                    inference_start = time.perf_counter()
+                    with STAGE_DURATION.labels(stage="inference").time():
+                        if draft:
+                            timeline, duration, detected_language = await self._refine_draft(
+                                audio,
+                                language,
+                                draft,
+                                draft_callback,
+                                progress_callback,
+                                decision.model,
+                            )
+                        else:
+                            decoded = await self._transcribe_local_auto(
+                                audio, language, progress_callback, model=decision.model,
+                                segment_callback=segment_callback
+                            )
+                            timeline, duration, detected_language = decoded
+                self._record_transcription_metrics(
+                    decision.model, time.perf_counter() - inference_start, duration
+                )
                 
                 processing_time = time.time() - start_time
                 
                 result = {
-                    "text": text,
+                    "text": timeline.text,
                     "language": detected_language,
                     "duration": duration,
                     "processing_time": processing_time,
-                    "word_count": len(text.split())
+                    "word_count": len(timeline.text.split()),
+                    "model": decision.model,
+                    "segments": timeline
                 }
                 
                 logger.info(f"✅ Local transcription completed in {processing_time:.2f}s - {result['word_count']} words")
+                # Clé du modèle (repli éventuel) et du mode de décodage réellement utilisés
+                decode_options = (
+                    LOCAL_DECODE_OPTIONS if draft
+                    else self._local_decode_options(language, duration)
+                )
+                await self._cache_transcription(
+                    self._transcription_cache_key(
+                        content_hash, requested_language, decision.model, decode_options
+                    ),
+                    result
+                )
                 return result
             
             # Option 2: OpenAI API Whisper
             elif settings.USE_OPENAI_WHISPER and self.openai_client:
-                with open(audio_file_path, "rb") as audio_file:
-                    transcript = self.openai_client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
-                        language=language,
-                        response_format="verbose_json"
+                # Le fichier est relu (de manière asynchrone) à chaque tentative
+                inference_start = time.perf_counter()
+                with STAGE_DURATION.labels(stage="inference").time():
+                    transcript = await self._call_with_retries(
+                        lambda: self.openai_client.audio.transcriptions.create(
+                            model="whisper-1",
+                            file=Path(audio_file_path),
+                            language=language,
+                            response_format="verbose_json"
+                        ),
+                        operation="transcription"
                     )
+                self._record_transcription_metrics(
+                    "whisper-1",
+                    time.perf_counter() - inference_start,
+                    getattr(transcript, "duration", None),
+                )
                 
                 processing_time = time.time() - start_time
                 
@@ -130,10 +400,13 @@ class AzureOpenAIService:
                     "language": transcript.language if hasattr(transcript, 'language') else language,
                     "duration": transcript.duration if hasattr(transcript, 'duration') else None,
                     "processing_time": processing_time,
-                    "word_count": len(transcript.text.split())
+                    "word_count": len(transcript.text.split()),
+                    "model": "whisper-1",
+                    "segments": self._openai_segments(transcript)
                 }
                 
                 logger.info(f"✅ OpenAI transcription completed in {processing_time:.2f}s - {result['word_count']} words")
+                await self._cache_transcription(cache_key, result)
                 return result
             
             else:
@@ -151,6 +424,637 @@ class AzureOpenAIService:
             logger.error(f"❌ Transcription failed: {str(e)}")
             raise Exception(f"Erreur lors de la transcription: {str(e)}")
     
+    async def _route_transcription(
+        self,
+        audio_file_path: str,
+        override: Optional[str] = None
+    ) -> RoutingDecision:
+        """Choisit le modèle local d'après la durée sondée (sans décoder l'audio)"""
+        duration = None
+        if not override:
+            duration = await asyncio.to_thread(audio_preprocessor.probe_duration, audio_file_path)
+        return model_router.route(duration, override)
+    
+    @asynccontextmanager
+    async def _local_model(self, decision: RoutingDecision) -> AsyncIterator[RoutingDecision]:
+        """
+        Charge au besoin le modèle choisi et le protège de l'éviction pendant le décodage
+        
+        Un palier dont le modèle ne peut pas être chargé se rabat sur le
+        modèle par défaut ; un modèle imposé par la requête lève l'erreur.
+        """
+        try:
+            await self.model_registry.ensure(decision.model)
+        except RuntimeError as e:
+            if decision.reason == "override" or decision.model == settings.WHISPER_MODEL_SIZE:
+                raise
+            logger.warning(f"⚠️ {e}, falling back to '{settings.WHISPER_MODEL_SIZE}'")
+            decision = RoutingDecision(settings.WHISPER_MODEL_SIZE, "fallback", decision.duration)
+        
+        model_router.record(decision)
+        async with self.model_registry.use(decision.model):
+            yield decision
+    
+    def _transcribe_local(
+        self,
+        pool: WhisperModelPool,
+        audio: Union[str, np.ndarray],
+        language: Optional[str],
+        progress_callback: Optional[Callable[[float], None]] = None,
+        segment_callback: Optional[Callable[[Any, float], None]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[SegmentTimeline, float, str]:
+        """
+        Décodage bloquant avec faster-whisper (exécuté dans le pool d'inférence)
+        
+        Args:
+            pool: Répliques du modèle à utiliser (résolues dans l'event loop)
+            audio: Audio PCM 16 kHz préparé (ou chemin vers le fichier audio)
+            language: Code langue
+            progress_callback: Appelé avec la progression (0-1) à chaque segment
+            segment_callback: Appelé avec chaque segment décodé et la progression
+            options: Options de décodage (défaut : LOCAL_DECODE_OPTIONS)
+        
+        Returns:
+            Tuple (segments, durée, langue détectée)
+        """
+        # La réplique reste empruntée jusqu'à la fin du générateur de segments
+        with pool.acquire() as model:
+            segments, info = model.transcribe(
+                audio,
+                language=language,
+                **(options or LOCAL_DECODE_OPTIONS)
+            )
+            
+            # Le générateur de segments est consommé ici, hors de l'event loop
+            decoded = []
+            for segment in segments:
+                decoded.append((segment.start, segment.end, segment.text))
+                progress = min(segment.end / info.duration, 1.0) if info.duration else 0.0
+                if progress_callback:
+                    progress_callback(progress)
+                if segment_callback:
+                    segment_callback(segment, progress)
+        
+        return SegmentTimeline.from_segments(decoded), info.duration, info.language
+    
+    async def _transcribe_draft(
+        self,
+        audio: np.ndarray,
+        language: Optional[str],
+        final_model: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Brouillon du mode deux passes (WHISPER_DRAFT_MODEL, décodage glouton)
+        
+        None si le modèle final est déjà celui du brouillon ou si le brouillon
+        échoue : la transcription continue alors en une passe.
+        
+        Returns:
+            Dict (model, language, text, segments, refined_until, processing_time)
+        """
+        draft_model = settings.WHISPER_DRAFT_MODEL
+        if not draft_model or draft_model == final_model:
+            return None
+        
+        draft_start = time.perf_counter()
+        try:
+            async with self.model_registry.use(draft_model) as pool:
+                timeline, _, detected_language = await self._run_on_replica(
+                    pool, self._transcribe_local, audio, language, None, None, DRAFT_DECODE_OPTIONS
+                )
+        except Exception as e:
+            logger.warning(f"⚠️ Draft transcription failed, continuing in one pass: {e}")
+            return None
+        
+        draft_seconds = time.perf_counter() - draft_start
+        logger.info(f"📝 Draft transcription ready in {draft_seconds:.2f}s ('{draft_model}')")
+        return {
+            "model": draft_model,
+            "language": detected_language,
+            "text": timeline.text,
+            "segments": timeline,
+            "refined_until": 0.0,
+            "processing_time": draft_seconds
+        }
+    
+    async def _refine_draft(
+        self,
+        audio: np.ndarray,
+        language: Optional[str],
+        draft: Dict[str, Any],
+        draft_callback: Callable[[Dict[str, Any]], None],
+        progress_callback: Optional[Callable[[float], None]] = None,
+        model: Optional[str] = None
+    ) -> Tuple[SegmentTimeline, float, str]:
+        """
+        Passe finale du mode deux passes
+        
+        Décodage séquentiel : chaque segment affiné remplace le brouillon
+        jusqu'à sa fin, et le brouillon mis à jour est transmis à draft_callback
+        (dans l'event loop).
+        
+        Returns:
+            Tuple (segments, durée, langue détectée)
+        """
+        loop = asyncio.get_running_loop()
+        refined: List[Tuple[float, float, str]] = []
+        
+        def on_segment(segment, progress: float) -> None:
+            """Remplace le début du brouillon (appelé depuis le thread d'inférence)"""
+            refined.append((segment.start, segment.end, segment.text))
+            provisional = draft["segments"].merge_refined(SegmentTimeline.from_segments(refined))
+            loop.call_soon_threadsafe(draft_callback, {
+                **draft,
+                "text": provisional.text,
+                "segments": provisional,
+                "refined_until": segment.end
+            })
+        
+        return await self._run_on_replica(
+            self.pool_for(model),
+            self._transcribe_local,
+            audio,
+            language,
+            progress_callback,
+            on_segment,
+        )
+    
+    async def _transcribe_local_auto(
+        self,
+        audio: np.ndarray,
+        language: Optional[str],
+        progress_callback: Optional[Callable[[float], None]] = None,
+        model: Optional[str] = None,
+        segment_callback: Optional[Callable[[float, float, str], None]] = None
+    ) -> Tuple[SegmentTimeline, float, str]:
+        """
+        Choisit le mode de décodage local selon la durée de l'audio
+        
+        - clip court avec langue connue : lot partagé avec d'autres requêtes
+        - long enregistrement (plusieurs répliques) : blocs décodés en parallèle
+        - sinon : décodage séquentiel sur une réplique
+        
+        Returns:
+            Tuple (segments, durée, langue détectée)
+        """
+        duration = audio_preprocessor.duration(audio)
+        
+        if self._local_decode_options(language, duration) is BATCH_DECODE_OPTIONS:
+            model = model or settings.WHISPER_MODEL_SIZE
+            timeline = await self._batcher_for(model).submit(audio, language)
+            if progress_callback:
+                progress_callback(1.0)
+            if segment_callback:
+                for segment in timeline:
+                    segment_callback(*segment)
+            return timeline, duration, language
+        
+        if settings.PARALLEL_CHUNKING_ENABLED and len(self.pool_for(model)) > 1:
+            # Long enregistrement découpé aux silences et décodé sur plusieurs répliques
+            return await self._transcribe_local_chunked(
+                audio, language, progress_callback, model, segment_callback
+            )
+        
+        # Décodage dans le pool d'inférence pour ne pas bloquer l'event loop
+        return await self._run_on_replica(
+            self.pool_for(model), self._transcribe_local, audio, language, progress_callback,
+            self._forward_segments(segment_callback)
+        )
+    
+    @staticmethod
+    def _local_decode_options(
+        language: Optional[str],
+        duration: Optional[float]
+    ) -> Dict[str, Any]:
+        """Options du mode de décodage local : lot pour un clip court de langue connue"""
+        if (
+            settings.WHISPER_BATCHING_ENABLED
+            and language
+            and duration is not None
+            and duration <= settings.WHISPER_BATCH_MAX_AUDIO_SECONDS
+        ):
+            return BATCH_DECODE_OPTIONS
+        return LOCAL_DECODE_OPTIONS
+    
+    @staticmethod
+    def _forward_segments(
+        segment_callback: Optional[Callable[[float, float, str], None]]
+    ) -> Optional[Callable[[Any, float], None]]:
+        """Transmet à l'event loop les segments décodés dans le thread d'inférence"""
+        if segment_callback is None:
+            return None
+        loop = asyncio.get_running_loop()
+        return lambda segment, _: loop.call_soon_threadsafe(
+            segment_callback, segment.start, segment.end, segment.text
+        )
+    
+    async def _decode_batch(
+        self,
+        audios: List[np.ndarray],
+        language: str,
+        model: Optional[str] = None
+    ) -> List[SegmentTimeline]:
+        """Décode un lot de clips (appelé par le micro-batcher du modèle)"""
+        return await self._run_on_replica(
+            self.pool_for(model), self._transcribe_batch, audios, language
+        )
+    
+    def _transcribe_batch(
+        self,
+        pool: WhisperModelPool,
+        audios: List[np.ndarray],
+        language: str
+    ) -> List[SegmentTimeline]:
+        """
+        Décode plusieurs clips en un seul appel au pipeline batché (pool d'inférence)
+        
+        Les clips sont concaténés ; leurs zones de parole (VAD, 30 s maximum)
+        forment les clip_timestamps du pipeline. Chaque segment décodé est
+        rendu au clip qui contient son milieu.
+        
+        Returns:
+            Segments de chaque clip (horodatages relatifs au clip), dans l'ordre des clips
+        """
+        vad_options = VadOptions(
+            max_speech_duration_s=BATCH_CLIP_SECONDS, min_silence_duration_ms=160
+        )
+        clip_timestamps = []
+        clip_starts = []
+        offset = 0
+        
+        for audio in audios:
+            speech_timestamps = get_speech_timestamps(audio, vad_options)
+            for clip in merge_segments(speech_timestamps, vad_options):
+                clip_timestamps.append(
+                    {"start": clip["start"] + offset, "end": clip["end"] + offset}
+                )
+            clip_starts.append(offset)
+            offset += len(audio)
+        
+        if not clip_timestamps:
+            return [SegmentTimeline.from_segments([]) for _ in audios]
+        
+        clip_segments: List[List[Tuple[float, float, str]]] = [[] for _ in audios]
+        with pool.acquire() as model:
+            segments, _ = BatchedInferencePipeline(model).transcribe(
+                np.concatenate(audios),
+                language=language,
+                clip_timestamps=clip_timestamps,
+                batch_size=settings.WHISPER_BATCH_MAX_SIZE,
+                beam_size=BATCH_DECODE_OPTIONS["beam_size"]
+            )
+            for segment in segments:
+                midpoint = (segment.start + segment.end) / 2 * SAMPLING_RATE
+                index = bisect.bisect_right(clip_starts, midpoint) - 1
+                clip_offset = clip_starts[index] / SAMPLING_RATE
+                clip_segments[index].append(
+                    (segment.start - clip_offset, segment.end - clip_offset, segment.text)
+                )
+        
+        return [SegmentTimeline.from_segments(segments) for segments in clip_segments]
+    
+    async def _transcribe_local_chunked(
+        self,
+        audio: np.ndarray,
+        language: Optional[str],
+        progress_callback: Optional[Callable[[float], None]] = None,
+        model: Optional[str] = None,
+        segment_callback: Optional[Callable[[float, float, str], None]] = None
+    ) -> Tuple[SegmentTimeline, float, str]:
+        """
+        Transcrit un long enregistrement par blocs décodés en parallèle
+        
+        L'audio est découpé aux silences détectés par le VAD ; chaque bloc
+        emprunte une réplique libre du modèle. Sans langue imposée, le premier
+        bloc est décodé seul pour détecter la langue des suivants. Les segments
+        sont transmis à segment_callback dès que tous les blocs qui les
+        précèdent sont décodés.
+        
+        Returns:
+            Tuple (segments, durée, langue détectée)
+        """
+        pool = self.pool_for(model)
+        # VAD hors du pool d'inférence : ses threads sont réservés aux décodages
+        chunks = await asyncio.to_thread(self._plan_local_chunks, audio)
+        duration = audio_preprocessor.duration(audio)
+        
+        if len(chunks) < 2:
+            # Enregistrement court : décodage en un bloc
+            return await self._run_on_replica(
+                pool, self._transcribe_local, audio, language, progress_callback,
+                self._forward_segments(segment_callback)
+            )
+        
+        logger.info(f"✂️ Splitting {duration:.0f}s of audio into {len(chunks)} chunks")
+        done_seconds = 0.0
+        decoded: Dict[int, List[Tuple[float, float, str]]] = {}
+        emitted_chunks = 0
+        emitted_segments = 0
+        
+        def emit_decoded_prefix() -> None:
+            """Transmet les segments des blocs décodés sans trou depuis le début"""
+            nonlocal emitted_chunks, emitted_segments
+            if emitted_chunks not in decoded:
+                return
+            while emitted_chunks in decoded:
+                emitted_chunks += 1
+            # Le recollage d'un préfixe ne modifie pas les segments déjà transmis
+            stitched = self._stitch_chunks(
+                chunks[:emitted_chunks], [decoded[index] for index in range(emitted_chunks)]
+            )
+            for segment in stitched[emitted_segments:]:
+                segment_callback(*segment)
+            emitted_segments = len(stitched)
+        
+        async def decode(index: int, chunk_language: Optional[str]):
+            nonlocal done_seconds
+            chunk = chunks[index]
+            result = await self._run_on_replica(
+                pool, self._transcribe_chunk, audio[chunk.start:chunk.end], chunk_language
+            )
+            done_seconds += (chunk.end - chunk.start) / SAMPLING_RATE
+            if progress_callback:
+                progress_callback(min(done_seconds / duration, 1.0))
+            if segment_callback:
+                decoded[index] = result[0]
+                emit_decoded_prefix()
+            return result
+        
+        results = []
+        remaining = range(len(chunks))
+        if language is None:
+            results.append(await decode(0, None))
+            language = results[0][1]
+            remaining = range(1, len(chunks))
+        results += await asyncio.gather(*(decode(index, language) for index in remaining))
+        
+        segments = self._stitch_chunks(chunks, [chunk_segments for chunk_segments, _ in results])
+        return SegmentTimeline.from_segments(segments), duration, results[0][1]
+    
+    def _plan_local_chunks(self, audio: np.ndarray) -> List[AudioChunk]:
+        """Choisit les points de coupe dans les silences (exécuté dans un thread)"""
+        if len(audio) < settings.PARALLEL_CHUNKING_MIN_AUDIO_SECONDS * SAMPLING_RATE:
+            return [AudioChunk(0, len(audio))]
+        
+        speech_timestamps = get_speech_timestamps(
+            audio, VadOptions(min_silence_duration_ms=CHUNK_MIN_SILENCE_MS)
+        )
+        return plan_chunks(
+            speech_timestamps,
+            total_samples=len(audio),
+            target_samples=settings.PARALLEL_CHUNK_TARGET_SECONDS * SAMPLING_RATE,
+            overlap_samples=int(settings.PARALLEL_CHUNK_OVERLAP_SECONDS * SAMPLING_RATE)
+        )
+    
+    def _transcribe_chunk(
+        self,
+        pool: WhisperModelPool,
+        audio: np.ndarray,
+        language: Optional[str]
+    ) -> Tuple[List[Tuple[float, float, str]], str]:
+        """Décode un bloc sur une réplique libre ; horodatages relatifs au bloc"""
+        with pool.acquire() as model:
+            segments, info = model.transcribe(audio, language=language, **LOCAL_DECODE_OPTIONS)
+            chunk_segments = [(segment.start, segment.end, segment.text) for segment in segments]
+        return chunk_segments, info.language
+    
+    @staticmethod
+    def _stitch_chunks(
+        chunks: List[AudioChunk],
+        chunk_segments: List[List[Tuple[float, float, str]]]
+    ) -> List[Tuple[float, float, str]]:
+        """
+        Recolle les segments des blocs avec des horodatages globaux
+        
+        Après une coupe franche (chevauchement), les mots répétés au début
+        du bloc suivant sont retirés.
+        """
+        stitched: List[Tuple[float, float, str]] = []
+        
+        for chunk, segments in zip(chunks, chunk_segments):
+            offset = chunk.start / SAMPLING_RATE
+            segments = [(start + offset, end + offset, text) for start, end, text in segments]
+            
+            if chunk.overlap and stitched and segments:
+                previous_text = " ".join(text for _, _, text in stitched[-3:])
+                start, end, text = segments[0]
+                text = deduplicate_boundary(previous_text, text)
+                segments = ([(start, end, text)] if text.strip() else []) + segments[1:]
+            
+            stitched.extend(segments)
+        
+        return stitched
+    
+    @staticmethod
+    def _record_transcription_metrics(
+        model: str,
+        inference_seconds: float,
+        duration: Optional[float]
+    ) -> None:
+        """Enregistre le facteur temps réel d'une transcription (hors cache)"""
+        if not duration:
+            return
+        TRANSCRIPTION_RTF.labels(model=model).observe(inference_seconds / duration)
+        TRANSCRIPTION_AUDIO_SECONDS.labels(model=model).inc(duration)
+    
+    @staticmethod
+    def _openai_segments(transcript: Any) -> Optional[SegmentTimeline]:
+        """Segments de la réponse verbose_json de l'API OpenAI (None si absents)"""
+        segments = getattr(transcript, "segments", None)
+        if not isinstance(segments, list):
+            return None
+        
+        def field(segment: Any, name: str) -> Any:
+            return segment[name] if isinstance(segment, dict) else getattr(segment, name)
+        
+        return SegmentTimeline.from_segments(
+            (field(segment, "start"), field(segment, "end"), field(segment, "text"))
+            for segment in segments
+        )
+    
+    def _transcription_cache_key(
+        self,
+        content_hash: Optional[str],
+        language: Optional[str],
+        model: Optional[str] = None,
+        decode_options: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """Clé de cache (hash audio, langue, modèle, options) ou None si cache inactif"""
+        if not content_hash or not settings.TRANSCRIPTION_CACHE_ENABLED:
+            return None
+        
+        if settings.USE_LOCAL_WHISPER and self.whisper_model:
+            return transcription_cache.make_key(
+                content_hash, language, model or settings.WHISPER_MODEL_SIZE,
+                decode_options or LOCAL_DECODE_OPTIONS
+            )
+        return transcription_cache.make_key(content_hash, language, "openai/whisper-1", {})
+    
+    async def _get_cached_transcription(
+        self,
+        cache_key: Optional[str],
+        audio_file_path: str
+    ) -> Optional[Dict[str, Any]]:
+        """Retourne la transcription en cache, marquée comme telle"""
+        if cache_key is None:
+            return None
+        
+        audio_bytes = os.path.getsize(audio_file_path) if os.path.exists(audio_file_path) else 0
+        cached = await transcription_cache.get(cache_key, audio_bytes=audio_bytes)
+        if cached:
+            cached["cached"] = True
+            if cached.get("segments"):
+                cached["segments"] = SegmentTimeline.from_dict(cached["segments"])
+            logger.info(f"💾 Transcription served from cache ({cached['word_count']} words)")
+        return cached
+    
+    async def _cache_transcription(self, cache_key: Optional[str], result: Dict[str, Any]) -> None:
+        """Enregistre une transcription dans le cache (une erreur n'est pas bloquante)"""
+        if cache_key is None:
+            return
+        
+        segments = result.get("segments")
+        if segments is not None:
+            result = {**result, "segments": segments.to_dict()}
+        
+        try:
+            await transcription_cache.put(cache_key, result)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not cache transcription: {e}")
+    
+    async def stream_transcription(
+        self,
+        audio_file_path: str,
+        language: Optional[str] = "fr",
+        content_hash: Optional[str] = None,
+        model: Optional[str] = None,
+        two_pass: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Transcrit un fichier audio en émettant chaque segment dès son décodage
+        
+        Avec l'API OpenAI (pas de décodage incrémental) ou un résultat en
+        cache, seul l'événement final est émis. En mode deux passes, un
+        brouillon complet (événement "draft") précède les segments définitifs.
+        
+        Args:
+            audio_file_path: Chemin vers le fichier audio
+            language: Code langue (fr, en, etc.)
+            content_hash: SHA-256 du fichier audio, active le cache des transcriptions
+            model: Modèle Whisper local imposé (sinon choisi selon la durée)
+            two_pass: Émet d'abord le brouillon de WHISPER_DRAFT_MODEL
+        
+        Yields:
+            Événements "draft" (deux passes), "segment" puis un événement final "done" (ou "error")
+        """
+        start_time = time.time()
+        
+        if not (settings.USE_LOCAL_WHISPER and self.whisper_model):
+            try:
+                result = await self.transcribe_audio(
+                    audio_file_path, language, content_hash=content_hash
+                )
+                result.pop("segments", None)
+                yield {"type": "done", **result}
+            except Exception as e:
+                yield {"type": "error", "detail": str(e)}
+            return
+        
+        decision = await self._route_transcription(audio_file_path, model)
+        requested_language = language
+        cache_key = self._transcription_cache_key(content_hash, language, decision.model)
+        cached = await self._get_cached_transcription(cache_key, audio_file_path)
+        if cached:
+            cached["processing_time"] = time.time() - start_time
+            # Pas de segments en cache à rejouer : seul le résultat final est émis
+            cached.pop("segments", None)
+            yield {"type": "done", **cached}
+            return
+        
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        cancelled = threading.Event()
+        
+        def on_segment(segment, progress: float) -> None:
+            """Transmet le segment à l'event loop (appelé depuis le thread d'inférence)"""
+            if cancelled.is_set():
+                raise TranscriptionCancelledError("Client disconnected")
+            loop.call_soon_threadsafe(events.put_nowait, {
+                "type": "segment",
+                "start": round(segment.start, 3),
+                "end": round(segment.end, 3),
+                "text": segment.text,
+                "progress": round(progress, 4)
+            })
+        
+        logger.info(f"🎤 Starting streaming transcription for: {audio_file_path}")
+        try:
+            audio = await audio_preprocessor.prepare(audio_file_path)
+        except Exception as e:
+            logger.error(f"❌ Audio preprocessing failed: {e}")
+            yield {"type": "error", "detail": str(e)}
+            return
+        
+        if two_pass:
+            draft = await self._transcribe_draft(audio, language, decision.model)
+            if draft:
+                language = language or draft["language"]
+                yield {
+                    "type": "draft",
+                    "model": draft["model"],
+                    "language": draft["language"],
+                    "text": draft["text"],
+                    "segments": draft["segments"].to_columns()
+                }
+        
+        try:
+            # Une réplique encore occupée après une déconnexion protège aussi
+            # le modèle de l'éviction
+            async with self._local_model(decision) as decision:
+                inference_start = time.perf_counter()
+                decode_task = asyncio.ensure_future(self._run_on_replica(
+                    self.pool_for(decision.model), self._transcribe_local,
+                    audio, language, None, on_segment
+                ))
+                decode_task.add_done_callback(lambda _: events.put_nowait(None))
+                
+                while True:
+                    event = await events.get()
+                    if event is None:
+                        break
+                    yield event
+                
+                timeline, duration, detected_language = decode_task.result()
+            inference_seconds = time.perf_counter() - inference_start
+            STAGE_DURATION.labels(stage="inference").observe(inference_seconds)
+            self._record_transcription_metrics(decision.model, inference_seconds, duration)
+            processing_time = time.time() - start_time
+            logger.info(f"✅ Streaming transcription completed in {processing_time:.2f}s")
+            result = {
+                "text": timeline.text,
+                "language": detected_language,
+                "duration": duration,
+                "processing_time": processing_time,
+                "word_count": len(timeline.text.split()),
+                "model": decision.model,
+                "segments": timeline
+            }
+            # Modèle réellement utilisé (repli éventuel), décodage séquentiel
+            await self._cache_transcription(
+                self._transcription_cache_key(content_hash, requested_language, decision.model),
+                result
+            )
+            # Les segments ont déjà été émis un par un
+            result.pop("segments")
+            yield {"type": "done", **result}
+        except Exception as e:
+            logger.error(f"❌ Streaming transcription failed: {str(e)}")
+            yield {"type": "error", "detail": f"Erreur lors de la transcription: {str(e)}"}
+        finally:
+            # Interrompt le décodage si le client s'est déconnecté
+            cancelled.set()
+    
     async def generate_summary(
         self, 
         transcription_text: str, 
@@ -173,34 +1077,275 @@ class AzureOpenAIService:
         try:
             logger.info(f"📝 Starting summarization (type: {summary_type})")
             
-            # Prompt adapté selon le type de résumé
-            system_prompt = self._get_summary_prompt(summary_type, language)
+            # Résumé déjà généré pour cette transcription
+            cache_key = None
+            if settings.SUMMARY_CACHE_ENABLED:
+                cache_key = summary_cache.make_key(
+                    transcription_text, summary_type, language, settings.AZURE_GPT4_DEPLOYMENT_NAME
+                )
+                cached = summary_cache.get(cache_key)
+                if cached:
+                    cached["processing_time"] = time.time() - start_time
+                    cached["cached"] = True
+                    logger.info("💾 Summary served from cache")
+                    return cached
+            
+            with STAGE_DURATION.labels(stage="summarization").time():
+                if estimate_tokens(transcription_text) > settings.SUMMARY_CHUNK_MAX_TOKENS:
+                    # Transcription longue : résumés partiels en parallèle puis fusion
+                    summary_text = await self._map_reduce_summary(
+                        transcription_text, summary_type, language
+                    )
+                else:
+                    # Prompt adapté selon le type de résumé
+                    system_prompt = self._get_summary_prompt(summary_type, language)
+                    
+                    # Appel à GPT-4 via Azure
+                    summary_text = await self._chat_completion(
+                        system_prompt, transcription_text, max_tokens=2000
+                    )
             
-            # Appel à GPT-4 via Azure
-            response = self.azure_client.chat.completions.create(
+            processing_time = time.time() - start_time
+            
+            # Parse du résumé structuré
+            parsed_summary = self._parse_structured_summary(summary_text)
+            parsed_summary["processing_time"] = processing_time
+            
+            if cache_key:
+                summary_cache.put(cache_key, parsed_summary)
+            
+            logger.info(f"✅ Summary generated in {processing_time:.2f}s")
+            return parsed_summary
+            
+        except Exception as e:
+            logger.error(f"❌ Summarization failed: {str(e)}")
+            raise Exception(f"Erreur lors de la génération du résumé: {str(e)}")
+    
+    async def _call_with_retries(
+        self,
+        request: Callable[[], Awaitable[Any]],
+        operation: str = "request"
+    ) -> Any:
+        """
+        Exécute une requête Azure/OpenAI avec limite de concurrence et nouvelles tentatives
+        
+        Les erreurs transitoires (429, 5xx, connexion, timeout) sont retentées
+        jusqu'à AZURE_MAX_RETRIES fois avec un backoff exponentiel et du jitter,
+        en respectant l'en-tête Retry-After du serveur.
+        
+        Args:
+            request: Fonction créant la coroutine de la requête (rappelée à chaque tentative)
+            operation: Étiquette des métriques (chat, transcription)
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self._request_semaphore:
+                    AZURE_REQUESTS.labels(operation=operation).inc()
+                    return await request()
+            except Exception as e:
+                AZURE_ERRORS.labels(operation=operation, error=error_label(e)).inc()
+                if attempt >= settings.AZURE_MAX_RETRIES or not is_retryable(e):
+                    raise
+                
+                delay = compute_backoff(
+                    attempt,
+                    settings.AZURE_RETRY_BASE_DELAY_SECONDS,
+                    settings.AZURE_RETRY_MAX_DELAY_SECONDS,
+                    retry_after=get_retry_after(e)
+                )
+                attempt += 1
+                AZURE_RETRIES.labels(operation=operation).inc()
+                logger.warning(
+                    f"⚠️ Azure OpenAI request failed ({e.__class__.__name__}), "
+                    f"retry {attempt}/{settings.AZURE_MAX_RETRIES} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+    
+    async def _chat_completion(self, system_prompt: str, user_content: str, max_tokens: int) -> str:
+        """Appel GPT-4 via Azure"""
+        response = await self._call_with_retries(
+            lambda: self.azure_client.chat.completions.create(
                 model=settings.AZURE_GPT4_DEPLOYMENT_NAME,
                 messages=[
                     {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": transcription_text}
+                    {"role": "user", "content": user_content}
                 ],
                 temperature=0.3,
-                max_tokens=2000
+                max_tokens=max_tokens
+            ),
+            operation="chat"
+        )
+        return response.choices[0].message.content
+    
+    async def _map_reduce_summary(
+        self,
+        transcription_text: str,
+        summary_type: str,
+        language: str
+    ) -> str:
+        """
+        Résume une transcription trop longue pour un seul appel
+        
+        Map : chaque bloc (découpé aux frontières de phrases) est résumé en
+        parallèle, dans la limite de SUMMARY_MAP_CONCURRENCY appels simultanés.
+        Reduce : les résumés partiels sont fusionnés au format demandé.
+        
+        Returns:
+            Texte du résumé final
+        """
+        chunks = chunk_text(transcription_text, settings.SUMMARY_CHUNK_MAX_TOKENS)
+        logger.info(f"🧩 Map step: summarizing {len(chunks)} chunks")
+        partial_summaries = await self._map_summaries(chunks, language)
+        return await self._reduce_summaries(partial_summaries, summary_type, language)
+    
+    async def _map_summaries(self, chunks: List[str], language: str) -> List[str]:
+        """Résume des blocs en parallèle (SUMMARY_MAP_CONCURRENCY appels simultanés)"""
+        semaphore = asyncio.Semaphore(settings.SUMMARY_MAP_CONCURRENCY)
+        
+        async def summarize_chunk(chunk: str, index: int) -> str:
+            async with semaphore:
+                return await self.summarize_part(chunk, language, index, len(chunks))
+        
+        return await asyncio.gather(*[
+            summarize_chunk(chunk, index)
+            for index, chunk in enumerate(chunks, start=1)
+        ])
+    
+    async def summarize_part(
+        self,
+        text: str,
+        language: str = "fr",
+        index: int = 1,
+        total: Optional[int] = None
+    ) -> str:
+        """
+        Résume un extrait de transcription (étape map)
+        
+        Args:
+            text: Extrait à résumer
+            language: Langue du résumé
+            index: Position de l'extrait (à partir de 1)
+            total: Nombre d'extraits (None si encore inconnu, transcription en cours)
+        
+        Returns:
+            Résumé partiel, à fusionner avec generate_summary_from_parts
+        """
+        return await self._chat_completion(
+            self._get_map_prompt(language, index, total), text, max_tokens=1000
+        )
+    
+    async def _reduce_summaries(
+        self,
+        partial_summaries: List[str],
+        summary_type: str,
+        language: str
+    ) -> str:
+        """
+        Fusionne des résumés partiels au format demandé (étape reduce)
+        
+        Si les résumés partiels sont eux-mêmes trop longs, ils sont à nouveau
+        résumés (deux fois au plus) avant la fusion.
+        """
+        max_tokens = settings.SUMMARY_CHUNK_MAX_TOKENS
+        
+        for round_index in range(3):
+            text = "\n\n".join(
+                f"### {index}/{len(partial_summaries)}\n{partial}"
+                for index, partial in enumerate(partial_summaries, start=1)
             )
+            if round_index == 2 or estimate_tokens(text) <= max_tokens:
+                break
+            chunks = chunk_text(text, max_tokens)
+            logger.info(f"🧩 Map step: summarizing {len(chunks)} chunks")
+            partial_summaries = await self._map_summaries(chunks, language)
+        
+        logger.info("🧩 Reduce step: merging partial summaries")
+        return await self._chat_completion(
+            self._get_reduce_prompt(summary_type, language), text, max_tokens=2000
+        )
+    
+    async def generate_summary_from_parts(
+        self,
+        transcription_text: str,
+        partial_summaries: List[str],
+        summary_type: str = "structured",
+        language: str = "fr"
+    ) -> Dict[str, Any]:
+        """
+        Génère le résumé final à partir de résumés partiels déjà calculés
+        
+        Utilisé quand les extraits ont été résumés pendant la transcription
+        (summarize_part) : seule l'étape reduce reste à faire.
+        
+        Args:
+            transcription_text: Transcription complète (clé du cache des résumés)
+            partial_summaries: Résumés partiels, dans l'ordre chronologique
+            summary_type: Type de résumé (structured, bullet_points, short)
+            language: Langue du résumé
+        
+        Returns:
+            Dict contenant le résumé et les éléments structurés
+        """
+        start_time = time.time()
+        
+        try:
+            with STAGE_DURATION.labels(stage="summarization").time():
+                summary_text = await self._reduce_summaries(
+                    partial_summaries, summary_type, language
+                )
             
-            summary_text = response.choices[0].message.content
             processing_time = time.time() - start_time
-            
-            # Parse du résumé structuré
             parsed_summary = self._parse_structured_summary(summary_text)
             parsed_summary["processing_time"] = processing_time
             
-            logger.info(f"✅ Summary generated in {processing_time:.2f}s")
+            if settings.SUMMARY_CACHE_ENABLED:
+                summary_cache.put(
+                    summary_cache.make_key(
+                        transcription_text,
+                        summary_type,
+                        language,
+                        settings.AZURE_GPT4_DEPLOYMENT_NAME,
+                    ),
+                    parsed_summary,
+                )
+            
+            logger.info(
+                f"✅ Summary merged from {len(partial_summaries)} parts in {processing_time:.2f}s"
+            )
             return parsed_summary
             
         except Exception as e:
             logger.error(f"❌ Summarization failed: {str(e)}")
             raise Exception(f"Erreur lors de la génération du résumé: {str(e)}")
     
+    def _get_map_prompt(self, language: str, index: int, total: Optional[int]) -> str:
+        """Prompt de résumé d'un bloc de transcription (étape map)"""
+        prompt = self._get_summary_prompt("structured", language)
+        position = f"{index}/{total}" if total else str(index)
+        if language == "en":
+            return prompt + (
+                f"\n\nThis text is part {position} of a longer meeting: "
+                "summarize only this part."
+            )
+        return prompt + (
+            f"\n\nCe texte est l'extrait {position} d'une réunion plus longue : "
+            "résume uniquement cet extrait."
+        )
+    
+    def _get_reduce_prompt(self, summary_type: str, language: str) -> str:
+        """Prompt de fusion des résumés partiels (étape reduce)"""
+        prompt = self._get_summary_prompt(summary_type, language)
+        if language == "en":
+            return prompt + (
+                "\n\nThe text is a series of partial summaries of the same meeting, "
+                "in chronological order: merge them into one summary without duplicates."
+            )
+        return prompt + (
+            "\n\nLe texte fourni est une suite de résumés partiels d'une même réunion, "
+            "dans l'ordre chronologique : fusionne-les en un résumé unique sans doublons."
+        )
+    
     def _get_summary_prompt(self, summary_type: str, language: str) -> str:
         """Retourne le prompt système selon le type de résumé"""
         
@@ -303,19 +1448,38 @@ Be precise, concise and professional."""
         
         return result
     
+    def model_info(self) -> Dict[str, Any]:
+        """Retourne l'état de chargement du modèle Whisper local"""
+        return {
+            "status": "ready" if self.whisper_model is not None else self.model_status,
+            "size": settings.WHISPER_MODEL_SIZE if settings.USE_LOCAL_WHISPER else None,
+            "replicas": len(self.model_pool),
+            "loaded_models": self.model_registry.loaded_models(),
+            "load_seconds": self.model_load_seconds,
+            "error": self.model_error
+        }
+    
+    @property
+    def transcription_available(self) -> bool:
+        """Indique si un moteur de transcription (local ou OpenAI) est prêt"""
+        return bool(
+            (settings.USE_LOCAL_WHISPER and self.whisper_model is not None)
+            or (settings.USE_OPENAI_WHISPER and self.openai_client is not None)
+        )
+    
     async def check_connection(self) -> bool:
         """Vérifie la connexion à Azure OpenAI"""
         try:
-            # Test simple avec un appel minimal
-            response = self.azure_client.chat.completions.create(
-                model=settings.AZURE_GPT4_DEPLOYMENT_NAME,
-                messages=[{"role": "user", "content": "test"}],
-                max_tokens=5
-            )
+            # Sonde légère : liste des modèles (aucun token consommé)
+            await self.azure_client.models.list()
             return True
         except Exception as e:
             logger.error(f"❌ Azure OpenAI connection check failed: {e}")
             return False
+    
+    async def aclose(self) -> None:
+        """Ferme le pool de connexions HTTP"""
+        await self.http_client.aclose()
 
 
 # Instance globale du service
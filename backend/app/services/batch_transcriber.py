@@ -0,0 +1,184 @@
+"""
+Transcription par lots
+Plusieurs fichiers (ou une archive zip) transcrits avec une concurrence bornée
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from fastapi import HTTPException, UploadFile
+from app.config import settings
+from app.services.admission_controller import admission_controller, AdmissionTicket
+from app.services.azure_service import azure_service
+from app.utils.file_handler import file_handler, StoredUpload
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchItem:
+    """Fichier d'un lot : sauvegardé, ou refusé à la validation"""
+    index: int
+    filename: str
+    stored: Optional[StoredUpload] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+
+
+class BatchTranscriber:
+    """Validation puis transcription des fichiers d'un lot"""
+
+    async def ingest(self, uploads: List[UploadFile]) -> List[BatchItem]:
+        """
+        Valide et sauvegarde les fichiers d'un lot (archives zip dépliées)
+
+        Un fichier refusé (format, taille, archive invalide) devient un
+        élément en erreur, sans interrompre le lot.
+
+        Raises:
+            HTTPException: Si le lot dépasse BATCH_MAX_FILES fichiers
+        """
+        items: List[BatchItem] = []
+
+        async def add(upload: UploadFile) -> None:
+            if len(items) >= settings.BATCH_MAX_FILES:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Trop de fichiers dans le lot. Maximum: {settings.BATCH_MAX_FILES}"
+                )
+            item = BatchItem(index=len(items), filename=upload.filename or "")
+            items.append(item)
+            try:
+                item.stored = await file_handler.ingest_upload(upload)
+            except HTTPException as e:
+                item.error, item.status_code = e.detail, e.status_code
+
+        try:
+            for upload in uploads:
+                if Path(upload.filename or "").suffix.lower() != ".zip":
+                    await add(upload)
+                    continue
+
+                members = file_handler.iter_archive(upload)
+                try:
+                    while True:
+                        try:
+                            member = await members.__anext__()
+                        except StopAsyncIteration:
+                            break
+                        except HTTPException as e:
+                            # Archive refusée : un seul élément en erreur
+                            items.append(BatchItem(
+                                index=len(items), filename=upload.filename or "",
+                                error=e.detail, status_code=e.status_code
+                            ))
+                            break
+                        await add(member)
+                finally:
+                    await members.aclose()
+        except BaseException:
+            await self.cleanup(items)
+            raise
+
+        return items
+
+    async def run(
+        self,
+        items: List[BatchItem],
+        language: Optional[str] = "fr",
+        model: Optional[str] = None,
+        ticket: Optional[AdmissionTicket] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Transcrit les fichiers d'un lot, BATCH_MAX_CONCURRENT à la fois
+
+        Les événements sont émis dans l'ordre de fin de traitement : un
+        événement `file` par fichier (résultat ou erreur), puis `done`. Le
+        fichier temporaire est supprimé dès sa transcription terminée.
+
+        Args:
+            items: Fichiers validés par ingest
+            language: Code langue (None pour détection automatique)
+            model: Modèle Whisper imposé (sinon choisi selon la durée)
+            ticket: Ticket d'admission, réduit à l'audio restant au fil du lot
+        """
+        start_time = time.time()
+        semaphore = asyncio.Semaphore(max(1, settings.BATCH_MAX_CONCURRENT))
+        remaining_seconds = {
+            item.index: admission_controller.estimate_audio_seconds(
+                item.stored.size_bytes, item.filename
+            )
+            for item in items
+            if item.stored is not None
+        }
+        if ticket is not None:
+            ticket.resize(sum(remaining_seconds.values()))
+
+        async def transcribe(item: BatchItem) -> Dict[str, Any]:
+            event: Dict[str, Any] = {"type": "file", "index": item.index, "filename": item.filename}
+            if item.stored is None:
+                return {
+                    **event,
+                    "status": "failed",
+                    "status_code": item.status_code,
+                    "error": item.error,
+                }
+
+            try:
+                async with semaphore:
+                    result = await azure_service.transcribe_audio(
+                        item.stored.file_path,
+                        language,
+                        content_hash=item.stored.sha256,
+                        model=model,
+                    )
+                return {**event, "status": "completed", "id": item.stored.file_id, "result": result}
+            except Exception as e:
+                logger.error(f"❌ Batch transcription failed for {item.filename}: {e}")
+                return {
+                    **event,
+                    "status": "failed",
+                    "status_code": 500,
+                    "error": f"Erreur lors de la transcription: {e}",
+                }
+            finally:
+                await file_handler.delete_file(item.stored.file_path)
+                remaining_seconds.pop(item.index, None)
+                if ticket is not None:
+                    ticket.resize(sum(remaining_seconds.values()))
+
+        tasks = [asyncio.create_task(transcribe(item)) for item in items]
+        completed = 0
+        try:
+            for next_event in asyncio.as_completed(tasks):
+                event = await next_event
+                completed += event["status"] == "completed"
+                yield event
+        finally:
+            # Client déconnecté : les transcriptions restantes sont abandonnées
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.info(f"✅ Batch completed: {completed}/{len(items)} files")
+        yield {
+            "type": "done",
+            "total": len(items),
+            "completed": completed,
+            "failed": len(items) - completed,
+            "processing_time": time.time() - start_time
+        }
+
+    @staticmethod
+    async def cleanup(items: List[BatchItem]) -> None:
+        """Supprime les fichiers temporaires d'un lot non transcrit"""
+        for item in items:
+            if item.stored is not None:
+                await file_handler.delete_file(item.stored.file_path)
+
+
+# Instance globale
+batch_transcriber = BatchTranscriber()
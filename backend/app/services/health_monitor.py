@@ -0,0 +1,97 @@
+"""
+Surveillance de l'état des dépendances externes
+Sonde Azure OpenAI en arrière-plan ; les health checks lisent le dernier résultat
+"""
+
+from app.config import settings
+from app.services.azure_service import azure_service
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+    """Sonde périodique d'Azure OpenAI avec résultat mis en cache"""
+
+    def __init__(self, interval_seconds: int):
+        self.interval_seconds = interval_seconds
+        self.azure_connected: Optional[bool] = None
+        self.checked_at: Optional[datetime] = None
+        self.latency_ms: Optional[float] = None
+        self._checked_monotonic: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        # Une seule sonde à la demande tant qu'aucun résultat n'est en cache
+        self._first_probe_lock = asyncio.Lock()
+
+    async def refresh(self) -> bool:
+        """Sonde Azure OpenAI et met à jour l'état en cache"""
+        start_time = time.perf_counter()
+        connected = await azure_service.check_connection()
+        self.latency_ms = round((time.perf_counter() - start_time) * 1000, 1)
+
+        if connected != self.azure_connected:
+            if connected:
+                logger.info("✅ Azure OpenAI connection: OK")
+            else:
+                logger.warning("⚠️ Azure OpenAI connection: FAILED")
+
+        self.azure_connected = connected
+        self.checked_at = datetime.utcnow()
+        self._checked_monotonic = time.monotonic()
+        return connected
+
+    async def get_azure_status(self) -> bool:
+        """
+        Retourne le dernier état connu (sonde une fois si jamais sondé)
+
+        Les appels concurrents sans résultat en cache attendent la même sonde.
+        """
+        if self.azure_connected is None:
+            async with self._first_probe_lock:
+                if self.azure_connected is None:
+                    return await self.refresh()
+        return self.azure_connected
+
+    @property
+    def age_seconds(self) -> Optional[float]:
+        """Âge du dernier résultat de sonde"""
+        if self._checked_monotonic is None:
+            return None
+        return round(time.monotonic() - self._checked_monotonic, 3)
+
+    def start(self) -> None:
+        """Démarre la sonde périodique (idempotent)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Arrête la sonde périodique"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"❌ Health probe failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Retourne l'état en cache d'Azure OpenAI"""
+        return {
+            "connected": self.azure_connected,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+            "age_seconds": self.age_seconds,
+            "latency_ms": self.latency_ms
+        }
+
+
+# Instance globale
+health_monitor = HealthMonitor(interval_seconds=settings.HEALTH_CHECK_INTERVAL_SECONDS)
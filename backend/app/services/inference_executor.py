@@ -0,0 +1,134 @@
+"""
+Exécuteur dédié à l'inférence Whisper locale
+Exécute le décodage faster-whisper hors de l'event loop asyncio
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from app.config import settings
+import asyncio
+import functools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceExecutor:
+    """
+    Pool de threads dédié au décodage Whisper
+
+    CTranslate2 libère le GIL pendant l'inférence : un pool de threads permet
+    donc de décoder en parallèle tout en partageant le modèle déjà chargé,
+    sans dupliquer sa mémoire dans plusieurs processus.
+    """
+
+    def __init__(self, max_workers: int, history_size: int = 100):
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        # Historique (attente, exécution) des derniers jobs
+        self._history: deque = deque(maxlen=history_size)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Crée le pool à la première utilisation"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="whisper-inference"
+            )
+            logger.info(f"⚙️ Inference executor started ({self.max_workers} workers)")
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Exécute une fonction bloquante dans le pool et attend son résultat
+
+        Args:
+            func: Fonction bloquante (décodage Whisper)
+            *args, **kwargs: Arguments transmis à la fonction
+
+        Returns:
+            Résultat de la fonction
+        """
+        loop = asyncio.get_running_loop()
+        submitted_at = time.perf_counter()
+
+        with self._lock:
+            self._queued += 1
+
+        call = functools.partial(func, *args, **kwargs)
+        return await loop.run_in_executor(
+            self._get_executor(),
+            functools.partial(self._timed_call, call, submitted_at)
+        )
+
+    def _timed_call(self, call: Callable[[], Any], submitted_at: float) -> Any:
+        """Exécute le job dans un thread du pool en mesurant attente et durée"""
+        started_at = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+
+        try:
+            result = call()
+        except Exception:
+            with self._lock:
+                self._running -= 1
+                self._failed += 1
+            raise
+
+        finished_at = time.perf_counter()
+        wait_time = started_at - submitted_at
+        run_time = finished_at - started_at
+
+        with self._lock:
+            self._running -= 1
+            self._completed += 1
+            self._history.append((wait_time, run_time))
+
+        logger.info(f"⏱️ Inference job done (wait: {wait_time:.2f}s, run: {run_time:.2f}s)")
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne l'état du pool et les temps des derniers jobs"""
+        with self._lock:
+            history = list(self._history)
+            stats = {
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+            }
+
+        if history:
+            stats["avg_wait_seconds"] = round(sum(w for w, _ in history) / len(history), 3)
+            stats["avg_run_seconds"] = round(sum(r for _, r in history) / len(history), 3)
+            stats["last_job"] = {
+                "wait_seconds": round(history[-1][0], 3),
+                "run_seconds": round(history[-1][1], 3)
+            }
+        else:
+            stats["avg_wait_seconds"] = None
+            stats["avg_run_seconds"] = None
+            stats["last_job"] = None
+
+        return stats
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Arrête le pool (les jobs en cours se terminent)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+            logger.info("🛑 Inference executor stopped")
+
+
+# Instance globale
+inference_executor = InferenceExecutor(max_workers=settings.whisper_executor_workers)
@@ -0,0 +1,237 @@
+"""
+Gestionnaire de jobs de transcription asynchrones
+File d'attente bornée traitée par un nombre limité de workers
+"""
+
+from dataclasses import dataclass, field
+from app.config import settings
+from app.models.schemas import TranscriptionStatus
+from app.services.admission_controller import AdmissionTicket
+from app.services.azure_service import azure_service
+from app.utils.file_handler import file_handler
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFullError(Exception):
+    """La file d'attente des jobs est pleine"""
+
+
+@dataclass
+class TranscriptionJob:
+    """État d'un job de transcription"""
+    id: str
+    file_path: str
+    language: Optional[str]
+    filename: Optional[str] = None
+    content_hash: Optional[str] = None
+    admission: Optional[AdmissionTicket] = None
+    model: Optional[str] = None
+    two_pass: bool = False
+    status: TranscriptionStatus = TranscriptionStatus.PENDING
+    progress: float = 0.0
+    result: Optional[Dict[str, Any]] = None
+    draft: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+
+    def set_status(self, status: TranscriptionStatus) -> None:
+        """Met à jour le statut et l'horodatage"""
+        self.status = status
+        self.updated_at = datetime.utcnow()
+
+    def set_progress(self, progress: float) -> None:
+        """Met à jour la progression (appelé depuis le thread d'inférence)"""
+        self.progress = max(self.progress, min(progress, 1.0))
+        self.updated_at = datetime.utcnow()
+
+    def set_draft(self, draft: Dict[str, Any]) -> None:
+        """Met à jour la transcription provisoire (mode deux passes)"""
+        self.draft = draft
+        self.updated_at = datetime.utcnow()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (TranscriptionStatus.COMPLETED, TranscriptionStatus.FAILED)
+
+
+class JobManager:
+    """Planificateur borné des jobs de transcription"""
+
+    def __init__(self, max_concurrent: int, max_queue_size: int):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue_size = max_queue_size
+        self.jobs: Dict[str, TranscriptionJob] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Démarre les workers (idempotent)"""
+        if self._workers:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._workers = [
+            asyncio.create_task(self._worker(i)) for i in range(self.max_concurrent)
+        ]
+        logger.info(f"⚙️ Job manager started ({self.max_concurrent} workers)")
+
+    async def stop(self) -> None:
+        """
+        Arrête les workers
+
+        Les jobs en cours sont interrompus et les jobs encore en file
+        abandonnés : tous passent en échec, leur fichier est supprimé et
+        leur ticket d'admission libéré.
+        """
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                job = self._queue.get_nowait()
+                self._fail(job, "Job abandonné (arrêt du service)")
+                await self._cleanup(job)
+        self._queue = None
+
+    def submit(
+        self,
+        job_id: str,
+        file_path: str,
+        language: Optional[str] = "fr",
+        filename: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        admission: Optional[AdmissionTicket] = None,
+        model: Optional[str] = None,
+        two_pass: bool = False
+    ) -> TranscriptionJob:
+        """
+        Ajoute un job à la file d'attente
+
+        Le ticket d'admission éventuel est libéré à la fin du job ; sans
+        modèle imposé, le modèle est choisi selon la durée de l'audio. En
+        mode deux passes, un brouillon est disponible avant le résultat final.
+
+        Raises:
+            JobQueueFullError: Si la file d'attente est pleine
+        """
+        self.start()
+        self.purge_expired()
+
+        job = TranscriptionJob(
+            id=job_id,
+            file_path=file_path,
+            language=language,
+            filename=filename,
+            content_hash=content_hash,
+            admission=admission,
+            model=model,
+            two_pass=two_pass
+        )
+
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise JobQueueFullError(
+                f"File d'attente pleine ({self.max_queue_size} jobs en attente)"
+            )
+
+        self.jobs[job.id] = job
+        logger.info(f"📥 Job queued: {job.id} (queue: {self._queue.qsize()})")
+        return job
+
+    def get(self, job_id: str) -> Optional[TranscriptionJob]:
+        """Retourne un job par son ID"""
+        self.purge_expired()
+        return self.jobs.get(job_id)
+
+    def purge_expired(self, hours: Optional[int] = None) -> int:
+        """Supprime les jobs terminés plus anciens que la durée de rétention (RGPD)"""
+        if hours is None:
+            hours = settings.AUTO_DELETE_FILES_AFTER_HOURS
+
+        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        expired = [
+            job_id for job_id, job in self.jobs.items()
+            if job.is_finished and job.updated_at < cutoff_time
+        ]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+        return len(expired)
+
+    async def _worker(self, worker_index: int) -> None:
+        """Traite les jobs de la file un par un"""
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._process(job)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job: TranscriptionJob) -> None:
+        """Transcrit le fichier d'un job et supprime le fichier temporaire"""
+        job.set_status(TranscriptionStatus.PROCESSING)
+        logger.info(f"🎬 Job started: {job.id}")
+
+        try:
+            job.result = await azure_service.transcribe_audio(
+                job.file_path,
+                job.language,
+                progress_callback=job.set_progress,
+                content_hash=job.content_hash,
+                model=job.model,
+                draft_callback=job.set_draft if job.two_pass else None
+            )
+            job.draft = None
+            job.progress = 1.0
+            job.set_status(TranscriptionStatus.COMPLETED)
+            logger.info(f"✅ Job completed: {job.id}")
+        except asyncio.CancelledError:
+            self._fail(job, "Transcription interrompue (arrêt du service)")
+            raise
+        except Exception as e:
+            self._fail(job, str(e))
+        finally:
+            await self._cleanup(job)
+
+    def _fail(self, job: TranscriptionJob, error: str) -> None:
+        """Passe un job en échec"""
+        job.error = error
+        job.set_status(TranscriptionStatus.FAILED)
+        logger.error(f"❌ Job failed: {job.id} - {error}")
+
+    async def _cleanup(self, job: TranscriptionJob) -> None:
+        """Libère le ticket d'admission et supprime le fichier temporaire d'un job"""
+        # Ticket libéré avant toute attente : garanti même si l'arrêt interrompt le nettoyage
+        if job.admission is not None:
+            job.admission.release(job.result)
+        # Nettoyage du fichier temporaire (RGPD compliance)
+        await file_handler.delete_file(job.file_path)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne le nombre de jobs par statut et la profondeur de file"""
+        counts = {status.value: 0 for status in TranscriptionStatus}
+        for job in self.jobs.values():
+            counts[job.status.value] += 1
+
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue_size": self.max_queue_size,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "jobs": counts
+        }
+
+
+# Instance globale
+job_manager = JobManager(
+    max_concurrent=settings.JOB_MAX_CONCURRENT,
+    max_queue_size=settings.JOB_QUEUE_MAX_SIZE
+)
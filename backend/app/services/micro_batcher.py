@@ -0,0 +1,113 @@
+"""
+Regroupement dynamique des transcriptions courtes (micro-batching)
+Les clips arrivés dans une courte fenêtre sont décodés en un seul lot
+"""
+
+from dataclasses import dataclass, field
+from app.utils.segment_timeline import SegmentTimeline
+import asyncio
+import logging
+import numpy as np
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingClip:
+    """Clip en attente de décodage et futur de son appelant"""
+    audio: np.ndarray
+    future: asyncio.Future
+
+
+@dataclass
+class _LanguageQueue:
+    """Clips en attente pour une langue et minuterie de déclenchement"""
+    clips: List[_PendingClip] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher:
+    """
+    Planificateur de lots pour le moteur Whisper local
+
+    Les clips sont regroupés par langue. Un lot part dès qu'il atteint
+    max_batch_size clips, ou max_wait_ms après l'arrivée de son premier clip.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[List[np.ndarray], str], Awaitable[List[SegmentTimeline]]],
+        max_batch_size: int,
+        max_wait_ms: int
+    ):
+        self.run_batch = run_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max_wait_ms / 1000
+        self._queues: Dict[str, _LanguageQueue] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.clips = 0
+
+    async def submit(self, audio: np.ndarray, language: str) -> SegmentTimeline:
+        """
+        Ajoute un clip au prochain lot de sa langue et attend ses segments
+
+        Args:
+            audio: Audio mono 16 kHz (float32)
+            language: Code langue (les lots ne mélangent pas les langues)
+
+        Returns:
+            Segments transcrits du clip (horodatages relatifs au clip)
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._queues.setdefault(language, _LanguageQueue())
+        pending = _PendingClip(audio=audio, future=loop.create_future())
+        queue.clips.append(pending)
+
+        if len(queue.clips) >= self.max_batch_size:
+            self._dispatch(language)
+        elif queue.timer is None:
+            queue.timer = loop.call_later(self.max_wait_seconds, self._dispatch, language)
+
+        return await pending.future
+
+    def _dispatch(self, language: str) -> None:
+        """Retire le lot en attente et lance son décodage"""
+        queue = self._queues.pop(language, None)
+        if queue is None:
+            return
+        if queue.timer is not None:
+            queue.timer.cancel()
+        task = asyncio.create_task(self._run(queue.clips, language))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, clips: List[_PendingClip], language: str) -> None:
+        """Décode un lot et transmet à chaque appelant son résultat"""
+        self.batches += 1
+        self.clips += len(clips)
+        logger.info(f"📦 Decoding batch of {len(clips)} clips ({language})")
+
+        try:
+            timelines = await self.run_batch([clip.audio for clip in clips], language)
+        except Exception as e:
+            for clip in clips:
+                if not clip.future.done():
+                    clip.future.set_exception(e)
+            return
+
+        for clip, timeline in zip(clips, timelines):
+            if not clip.future.done():
+                clip.future.set_result(timeline)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne la taille moyenne des lots décodés"""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": int(self.max_wait_seconds * 1000),
+            "pending": sum(len(queue.clips) for queue in self._queues.values()),
+            "batches": self.batches,
+            "clips": self.clips,
+            "avg_batch_size": round(self.clips / self.batches, 2) if self.batches else None
+        }
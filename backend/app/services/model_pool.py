@@ -0,0 +1,230 @@
+"""
+Pool de répliques du modèle Whisper local
+Répartit les décodages concurrents sur plusieurs instances du modèle
+"""
+
+from contextlib import contextmanager
+from app.config import settings
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Jeton déposé dans la file pour réveiller les threads en attente lors d'un clear
+_CLOSED = object()
+
+
+class ModelReplica:
+    """Instance du modèle avec ses cœurs attribués et ses compteurs d'utilisation"""
+
+    def __init__(self, index: int, model: Any, cpu_ids: Optional[Set[int]] = None):
+        self.index = index
+        self.model = model
+        self.cpu_ids = cpu_ids
+        self.busy = False
+        self.jobs = 0
+        self.busy_seconds = 0.0
+        self._busy_since: Optional[float] = None
+
+    def stats(self, uptime_seconds: float) -> Dict[str, Any]:
+        """Retourne l'utilisation de la réplique depuis sa création"""
+        busy_seconds = self.busy_seconds
+        if self._busy_since is not None:
+            busy_seconds += time.monotonic() - self._busy_since
+
+        return {
+            "index": self.index,
+            "busy": self.busy,
+            "jobs": self.jobs,
+            "busy_seconds": round(busy_seconds, 3),
+            "utilization": round(busy_seconds / uptime_seconds, 3) if uptime_seconds > 0 else 0.0,
+            "cpu_ids": sorted(self.cpu_ids) if self.cpu_ids else None
+        }
+
+
+class WhisperModelPool:
+    """
+    Ensemble de répliques du modèle Whisper
+
+    Chaque décodage emprunte une réplique libre et la rend à la fin ;
+    les threads d'inférence attendent si toutes les répliques sont occupées.
+    La file des répliques libres est la même pendant toute la vie du pool.
+
+    Côté event loop, `reserve` limite les décodages soumis à l'exécuteur au
+    nombre de répliques : un thread d'inférence n'attend jamais une réplique
+    et ne bloque donc pas les décodages des autres modèles.
+    """
+
+    def __init__(self):
+        self.replicas: List[ModelReplica] = []
+        self._free: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._waiting = 0
+        # Une place par réplique, réservée dans l'event loop avant soumission
+        self._slots = asyncio.Semaphore(0)
+        self._created_at = time.monotonic()
+
+    def add(self, model: Any, cpu_ids: Optional[Set[int]] = None) -> ModelReplica:
+        """Ajoute une réplique chargée au pool"""
+        with self._lock:
+            replica = ModelReplica(len(self.replicas), model, cpu_ids)
+            self.replicas.append(replica)
+        self._free.put(replica)
+        self._slots.release()
+        return replica
+
+    def clear(self) -> bool:
+        """
+        Retire toutes les répliques ; False (sans rien retirer) si l'une est empruntée
+
+        Les threads en attente d'une réplique sont réveillés et échouent.
+        """
+        with self._lock:
+            if any(replica.busy for replica in self.replicas):
+                return False
+
+            self.replicas = []
+            while True:
+                try:
+                    self._free.get_nowait()
+                except queue.Empty:
+                    break
+            for _ in range(self._waiting):
+                self._free.put(_CLOSED)
+            self._created_at = time.monotonic()
+
+        # Les réservations en attente sont réveillées (en chaîne) et échouent
+        slots, self._slots = self._slots, asyncio.Semaphore(0)
+        slots.release()
+        return True
+
+    @property
+    def primary(self) -> Optional[Any]:
+        """Modèle de la première réplique (compatibilité avec `whisper_model`)"""
+        return self.replicas[0].model if self.replicas else None
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    async def reserve(self) -> Callable[[], None]:
+        """
+        Réserve une réplique avant de soumettre un décodage à l'exécuteur (event loop)
+
+        Returns:
+            Fonction qui libère la réservation, à appeler à la fin du décodage
+
+        Raises:
+            RuntimeError: Si aucune réplique n'est chargée ou si le pool est vidé pendant l'attente
+        """
+        slots = self._slots
+        if not self.replicas:
+            raise RuntimeError("Aucune réplique du modèle Whisper n'est chargée")
+
+        await slots.acquire()
+        if slots is not self._slots:
+            slots.release()
+            raise RuntimeError("Modèle Whisper déchargé pendant l'attente d'une réplique")
+
+        def release() -> None:
+            # Après un clear, l'ancien sémaphore n'a plus de répliques à prêter
+            if slots is self._slots:
+                slots.release()
+
+        return release
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """
+        Emprunte une réplique libre (bloquant, à appeler depuis un thread d'inférence)
+
+        Si la réplique a des cœurs attribués, le thread appelant y est épinglé
+        le temps du décodage : les threads de calcul créés par CTranslate2
+        héritent de cette affinité.
+        """
+        with self._lock:
+            if not self.replicas:
+                raise RuntimeError("Aucune réplique du modèle Whisper n'est chargée")
+            self._waiting += 1
+
+        try:
+            replica = self._free.get()
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+        with self._lock:
+            if replica is _CLOSED or replica not in self.replicas:
+                raise RuntimeError("Modèle Whisper déchargé pendant l'attente d'une réplique")
+            replica.busy = True
+            replica.jobs += 1
+            replica._busy_since = time.monotonic()
+
+        try:
+            with pin_current_thread(replica.cpu_ids):
+                yield replica.model
+        finally:
+            with self._lock:
+                replica.busy_seconds += time.monotonic() - replica._busy_since
+                replica._busy_since = None
+                replica.busy = False
+                # Une réplique retirée entre-temps (clear) n'est pas remise en service
+                if replica in self.replicas:
+                    self._free.put(replica)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne l'utilisation de chaque réplique"""
+        uptime_seconds = time.monotonic() - self._created_at
+        with self._lock:
+            replicas = [replica.stats(uptime_seconds) for replica in self.replicas]
+
+        return {
+            "replicas": len(replicas),
+            "busy": sum(1 for replica in replicas if replica["busy"]),
+            "threads_per_replica": settings.WHISPER_THREADS_PER_REPLICA,
+            "cpu_affinity": settings.WHISPER_CPU_AFFINITY,
+            "per_replica": replicas
+        }
+
+
+def plan_cpu_affinity(replicas: int, threads_per_replica: int) -> List[Optional[Set[int]]]:
+    """
+    Attribue à chaque réplique un groupe de cœurs disjoint
+
+    Retourne une liste de None si l'affinité n'est pas supportée (hors Linux)
+    ou si le nombre de cœurs disponibles est insuffisant.
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return [None] * replicas
+
+    available = sorted(os.sched_getaffinity(0))
+    if len(available) < replicas * threads_per_replica:
+        logger.warning(
+            f"⚠️ CPU affinity disabled: {replicas} replicas x {threads_per_replica} threads "
+            f"> {len(available)} available cores"
+        )
+        return [None] * replicas
+
+    return [
+        set(available[i * threads_per_replica:(i + 1) * threads_per_replica])
+        for i in range(replicas)
+    ]
+
+
+@contextmanager
+def pin_current_thread(cpu_ids: Optional[Set[int]]) -> Iterator[None]:
+    """Épingle le thread courant sur cpu_ids puis restaure son affinité (Linux uniquement)"""
+    if not cpu_ids or not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, cpu_ids)
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
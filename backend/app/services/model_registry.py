@@ -0,0 +1,316 @@
+"""
+Registre des modèles Whisper locaux
+Charge les modèles à la demande et évince le moins récemment utilisé
+quand le budget mémoire est dépassé
+"""
+
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from app.config import settings
+from app.services.model_pool import WhisperModelPool, plan_cpu_affinity
+from app.utils.metrics import MODEL_REGISTRY_EVENTS, MODEL_REGISTRY_LOOKUPS, MODEL_MEMORY_BYTES
+import asyncio
+import gc
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+# Mémoire d'une réplique int8 (CTranslate2) quand elle ne peut pas être mesurée
+ESTIMATED_MODEL_MB = {
+    "tiny": 75,
+    "base": 145,
+    "small": 490,
+    "medium": 1500,
+    "large-v3": 3100,
+}
+DEFAULT_ESTIMATED_MODEL_MB = 1500
+
+# Nombre d'événements (chargements, évictions) conservés pour /stats
+MAX_REGISTRY_EVENTS = 100
+
+
+def resident_memory_bytes() -> Optional[int]:
+    """Mémoire résidente du processus (Linux), None si indisponible"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def estimated_model_bytes(model_size: str, replicas: int = 1) -> int:
+    """Mémoire estimée d'un modèle et de ses répliques"""
+    return ESTIMATED_MODEL_MB.get(model_size, DEFAULT_ESTIMATED_MODEL_MB) * MB * max(replicas, 1)
+
+
+class ModelEntry:
+    """Modèle du registre : pool de répliques, mémoire et compteurs d'utilisation"""
+
+    def __init__(self, model_size: str):
+        self.model_size = model_size
+        self.pool = WhisperModelPool()
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.loaded_at: Optional[float] = None
+        self.last_used: Optional[float] = None
+        self.error: Optional[str] = None
+        self.loading: Optional[asyncio.Task] = None
+        # Signalé dès la première réplique chargée (ou à l'échec du chargement)
+        self.ready = asyncio.Event()
+
+    @property
+    def idle(self) -> bool:
+        """Ni utilisé par une transcription, ni en cours de chargement"""
+        return not self.in_use and self.loading is None and not self.pool.stats()["busy"]
+
+    @property
+    def status(self) -> str:
+        if self.pool:
+            return "ready"
+        return "loading" if self.loading is not None else "not_loaded"
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne l'état et l'utilisation du modèle"""
+        return {
+            "status": self.status,
+            "replicas": len(self.pool),
+            "memory_mb": round(self.memory_bytes / MB, 1),
+            "hits": self.hits,
+            "misses": self.misses,
+            "in_use": self.in_use,
+            "loaded_at": self.loaded_at,
+            "last_used": self.last_used
+        }
+
+
+class ModelRegistry:
+    """
+    Modèles Whisper chargés à la demande, du moins au plus récemment utilisé
+
+    Un modèle demandé et absent est chargé (répliques dans le pool
+    d'inférence) ; il est utilisable dès la première réplique. Avant chaque
+    chargement, les modèles inutilisés les plus anciens sont évincés tant
+    que la mémoire des modèles dépasserait WHISPER_MODEL_MEMORY_BUDGET_MB.
+    Le modèle par défaut (WHISPER_MODEL_SIZE) et les modèles en cours
+    d'utilisation ne sont jamais évincés.
+
+    Args:
+        load_replica: Charge une réplique (cpu_ids, taille) -> modèle, bloquant
+    """
+
+    def __init__(self, load_replica: Callable[[Optional[Set[int]], str], Any]):
+        self._load_replica = load_replica
+        self._entries: "OrderedDict[str, ModelEntry]" = OrderedDict()
+        # Un chargement à la fois : la mémoire mesurée revient au seul modèle chargé
+        self._load_lock = asyncio.Lock()
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=MAX_REGISTRY_EVENTS)
+
+    def pool(self, model_size: str) -> WhisperModelPool:
+        """
+        Pool de répliques d'un modèle (entrée vide créée au besoin)
+
+        Event loop uniquement : le registre est modifié sans verrou de thread.
+        """
+        entry = self._entries.get(model_size)
+        if entry is None:
+            entry = self._entries.setdefault(model_size, ModelEntry(model_size))
+        return entry.pool
+
+    def loaded_models(self) -> List[str]:
+        """Modèles ayant au moins une réplique chargée"""
+        return [size for size, entry in self._entries.items() if entry.pool]
+
+    @property
+    def memory_bytes(self) -> int:
+        """Mémoire attribuée aux modèles chargés"""
+        return sum(entry.memory_bytes for entry in self._entries.values())
+
+    async def ensure(self, model_size: str) -> WhisperModelPool:
+        """
+        Retourne le pool d'un modèle, chargé au besoin (première réplique)
+
+        Raises:
+            RuntimeError: Si le modèle ne peut pas être chargé
+        """
+        entry = self._entries.get(model_size)
+        if entry is not None and entry.pool:
+            entry.hits += 1
+            self._touch(entry)
+            MODEL_REGISTRY_LOOKUPS.labels(model=model_size, result="hit").inc()
+            return entry.pool
+
+        if entry is None:
+            entry = self._entries.setdefault(model_size, ModelEntry(model_size))
+        entry.misses += 1
+        MODEL_REGISTRY_LOOKUPS.labels(model=model_size, result="miss").inc()
+        if entry.loading is None:
+            entry.ready.clear()
+            entry.loading = asyncio.create_task(self._load(entry))
+
+        await entry.ready.wait()
+        if not entry.pool:
+            raise RuntimeError(f"Modèle Whisper '{model_size}' indisponible: {entry.error}")
+        self._touch(entry)
+        return entry.pool
+
+    async def wait_loaded(self, model_size: str) -> None:
+        """Attend la fin du chargement de toutes les répliques d'un modèle"""
+        entry = self._entries.get(model_size)
+        if entry is not None and entry.loading is not None:
+            await asyncio.shield(entry.loading)
+
+    @asynccontextmanager
+    async def use(self, model_size: str) -> AsyncIterator[WhisperModelPool]:
+        """Garde un modèle chargé (non évincé) pendant son utilisation"""
+        entry = self._entries.get(model_size)
+        pool = entry.pool if entry is not None and entry.pool else await self.ensure(model_size)
+        entry = self._entries[model_size]
+        entry.in_use += 1
+        try:
+            yield pool
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.time()
+
+    def _touch(self, entry: ModelEntry) -> None:
+        entry.last_used = time.time()
+        if entry.model_size in self._entries:
+            self._entries.move_to_end(entry.model_size)
+
+    async def _load(self, entry: ModelEntry) -> None:
+        """Charge les répliques d'un modèle et mesure leur mémoire"""
+        replicas = settings.whisper_replicas
+        threads = settings.WHISPER_THREADS_PER_REPLICA
+        if settings.WHISPER_CPU_AFFINITY:
+            cpu_sets = plan_cpu_affinity(replicas, threads)
+        else:
+            cpu_sets = [None] * replicas
+
+        try:
+            async with self._load_lock:
+                self._make_room(
+                    estimated_model_bytes(entry.model_size, replicas), keep=entry.model_size
+                )
+                logger.info(
+                    f"🔄 Loading Whisper model '{entry.model_size}' "
+                    f"({replicas} replicas x {threads} threads)..."
+                )
+                start_time = time.time()
+                rss_before = resident_memory_bytes()
+
+                for index, cpu_ids in enumerate(cpu_sets):
+                    try:
+                        # Hors du pool d'inférence, réservé aux décodages des modèles chargés
+                        model = await asyncio.to_thread(
+                            self._load_replica, cpu_ids, entry.model_size
+                        )
+                    except Exception as model_error:
+                        entry.error = str(model_error)
+                        logger.error(
+                            f"❌ Failed to load Whisper '{entry.model_size}' "
+                            f"replica {index}: {model_error}"
+                        )
+                        break
+
+                    entry.pool.add(model, cpu_ids)
+                    entry.ready.set()
+
+                if not entry.pool:
+                    self._record_event("load_failed", entry.model_size, error=entry.error)
+                    return
+
+                rss_after = resident_memory_bytes()
+                measured = (
+                    rss_after - rss_before
+                    if rss_before is not None and rss_after is not None
+                    else 0
+                )
+                # Mémoire non rendue au système après une éviction : la mesure peut être nulle
+                entry.memory_bytes = measured if measured > 0 else estimated_model_bytes(
+                    entry.model_size, len(entry.pool)
+                )
+                entry.loaded_at = time.time()
+                MODEL_MEMORY_BYTES.labels(model=entry.model_size).set(entry.memory_bytes)
+                self._record_event(
+                    "load", entry.model_size,
+                    replicas=len(entry.pool),
+                    memory_mb=round(entry.memory_bytes / MB, 1),
+                    seconds=round(time.time() - start_time, 2)
+                )
+                logger.info(
+                    f"✅ Whisper model pool '{entry.model_size}' ready "
+                    f"({len(entry.pool)}/{replicas} replicas, {entry.memory_bytes / MB:.0f} MB)"
+                )
+                self._make_room(0, keep=entry.model_size)
+        finally:
+            entry.loading = None
+            entry.ready.set()
+            if not entry.pool and self._entries.get(entry.model_size) is entry:
+                del self._entries[entry.model_size]
+
+    def _make_room(self, needed_bytes: int, keep: str) -> None:
+        """Évince les modèles inutilisés les plus anciens tant que le budget est dépassé"""
+        budget = settings.WHISPER_MODEL_MEMORY_BUDGET_MB * MB
+        if not budget:
+            return
+
+        while self.memory_bytes + needed_bytes > budget:
+            candidate = next(
+                (
+                    entry
+                    for entry in self._entries.values()
+                    if entry.pool
+                    and entry.idle
+                    and entry.model_size not in (keep, settings.WHISPER_MODEL_SIZE)
+                ),
+                None,
+            )
+            if candidate is None or not self.evict(candidate.model_size):
+                logger.warning(
+                    f"⚠️ Whisper model memory budget exceeded "
+                    f"({(self.memory_bytes + needed_bytes) / MB:.0f}/{budget / MB:.0f} MB), "
+                    f"nothing to evict"
+                )
+                return
+
+    def evict(self, model_size: str) -> bool:
+        """Décharge un modèle inutilisé ; False s'il est absent ou en cours d'utilisation"""
+        entry = self._entries.get(model_size)
+        # clear refuse de retirer une réplique empruntée entre-temps par un thread
+        if entry is None or not entry.idle or not entry.pool.clear():
+            return False
+
+        del self._entries[model_size]
+        gc.collect()
+        if entry.loaded_at is not None:
+            MODEL_MEMORY_BYTES.remove(model_size)
+        self._record_event("evict", model_size, memory_mb=round(entry.memory_bytes / MB, 1))
+        logger.info(
+            f"♻️ Whisper model '{model_size}' evicted ({entry.memory_bytes / MB:.0f} MB freed)"
+        )
+        return True
+
+    def _record_event(self, event: str, model_size: str, **details: Any) -> None:
+        MODEL_REGISTRY_EVENTS.labels(event=event, model=model_size).inc()
+        self.events.append({"event": event, "model": model_size, "at": time.time(), **details})
+
+    def busy_replicas(self) -> int:
+        """Répliques occupées, tous modèles confondus"""
+        return sum(entry.pool.stats()["busy"] for entry in list(self._entries.values()))
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne les modèles chargés, leur utilisation et les derniers événements"""
+        return {
+            "available": settings.whisper_available_models_list,
+            "memory_budget_mb": settings.WHISPER_MODEL_MEMORY_BUDGET_MB or None,
+            "memory_mb": round(self.memory_bytes / MB, 1),
+            "models": {size: entry.stats() for size, entry in self._entries.items()},
+            "events": list(self.events)
+        }
@@ -0,0 +1,166 @@
+"""
+Routage des transcriptions vers un palier de modèle Whisper
+Choisit le modèle selon la durée de l'audio, sondée avant le décodage
+"""
+
+from dataclasses import dataclass
+from app.config import settings
+from app.utils.metrics import MODEL_ROUTING
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelTier:
+    """Palier de routage : audio jusqu'à max_seconds (None = sans limite)"""
+    model: str
+    max_seconds: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class RoutingDecision:
+    """Modèle choisi pour une transcription et raison du choix"""
+    model: str
+    reason: str  # override, duration, default, fallback
+    duration: Optional[float] = None
+
+
+def parse_routing_rules(rules: str, default_model: str) -> List[ModelTier]:
+    """
+    Lit les paliers "durée_max:modèle,...,modèle"
+
+    Exemple : "60:base,1800:small,medium" -> base jusqu'à 1 min, small
+    jusqu'à 30 min, medium au-delà. Sans palier final sans limite, le
+    modèle par défaut couvre les durées restantes.
+
+    Raises:
+        ValueError: Si une règle est mal formée
+    """
+    tiers: List[ModelTier] = []
+
+    for rule in filter(None, (part.strip() for part in rules.split(","))):
+        if tiers and tiers[-1].max_seconds is None:
+            raise ValueError(f"Règle de routage après le palier sans limite : '{rule}'")
+
+        if ":" in rule:
+            max_seconds, model = (part.strip() for part in rule.split(":", 1))
+            try:
+                limit: Optional[float] = float(max_seconds)
+            except ValueError:
+                raise ValueError(f"Durée invalide dans la règle de routage : '{rule}'")
+            if tiers and limit <= tiers[-1].max_seconds:
+                raise ValueError(f"Les durées des paliers doivent être croissantes : '{rule}'")
+        else:
+            model, limit = rule, None
+
+        if not model:
+            raise ValueError(f"Modèle manquant dans la règle de routage : '{rule}'")
+        tiers.append(ModelTier(model, limit))
+
+    if not tiers or tiers[-1].max_seconds is not None:
+        tiers.append(ModelTier(default_model))
+    return tiers
+
+
+class ModelRouter:
+    """
+    Choix du modèle Whisper selon la durée de l'audio
+
+    Les paliers sont relus depuis la configuration (WHISPER_MODEL_ROUTING).
+    Une durée inconnue (sonde impossible) utilise WHISPER_MODEL_SIZE ; un
+    modèle imposé par la requête doit être routé ou chargeable à la demande
+    (WHISPER_AVAILABLE_MODELS).
+    """
+
+    def __init__(self):
+        self._rules: Optional[tuple] = None
+        self._tiers: List[ModelTier] = []
+
+    @property
+    def tiers(self) -> List[ModelTier]:
+        """Paliers de la configuration courante"""
+        rules = (settings.WHISPER_MODEL_ROUTING, settings.WHISPER_MODEL_SIZE)
+        if rules != self._rules:
+            self._tiers = parse_routing_rules(*rules)
+            self._rules = rules
+        return self._tiers
+
+    @property
+    def models(self) -> List[str]:
+        """Modèles des paliers, le modèle par défaut en premier"""
+        models = [settings.WHISPER_MODEL_SIZE]
+        for tier in self.tiers:
+            if tier.model not in models:
+                models.append(tier.model)
+        return models
+
+    @property
+    def allowed_models(self) -> List[str]:
+        """Modèles pouvant être imposés par une requête"""
+        models = self.models
+        return models + [
+            model for model in settings.whisper_available_models_list if model not in models
+        ]
+
+    def validate(self, model: Optional[str]) -> Optional[str]:
+        """
+        Vérifie un modèle imposé par la requête
+
+        Raises:
+            ValueError: Si le modèle n'est ni routé ni chargeable à la demande
+        """
+        if model and model not in self.allowed_models:
+            raise ValueError(
+                f"Modèle '{model}' non disponible. "
+                f"Modèles disponibles : {', '.join(self.allowed_models)}"
+            )
+        return model or None
+
+    def route(self, duration: Optional[float], override: Optional[str] = None) -> RoutingDecision:
+        """
+        Choisit le modèle d'une transcription
+
+        Args:
+            duration: Durée sondée de l'audio (None si inconnue)
+            override: Modèle imposé par la requête
+
+        Returns:
+            Modèle choisi et raison du choix
+        """
+        if override:
+            return RoutingDecision(self.validate(override), "override", duration)
+
+        if duration is None:
+            return RoutingDecision(settings.WHISPER_MODEL_SIZE, "default", duration)
+
+        for tier in self.tiers:
+            if tier.max_seconds is None or duration <= tier.max_seconds:
+                return RoutingDecision(tier.model, "duration", duration)
+
+    @staticmethod
+    def record(decision: RoutingDecision) -> None:
+        """Compte la décision de routage (modèle effectivement utilisé)"""
+        MODEL_ROUTING.labels(model=decision.model, reason=decision.reason).inc()
+        if decision.duration is not None:
+            logger.info(
+                f"🧭 {decision.duration:.0f}s of audio routed to '{decision.model}' "
+                f"({decision.reason})"
+            )
+        else:
+            logger.info(f"🧭 Audio routed to '{decision.model}' ({decision.reason})")
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne les paliers de routage"""
+        return {
+            "default": settings.WHISPER_MODEL_SIZE,
+            "tiers": [
+                {"max_seconds": tier.max_seconds, "model": tier.model}
+                for tier in self.tiers
+            ]
+        }
+
+
+# Instance globale
+model_router = ModelRouter()
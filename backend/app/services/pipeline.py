@@ -0,0 +1,161 @@
+"""
+Pipeline réunion : transcription puis résumé côté serveur
+Les extraits déjà transcrits sont résumés pendant le décodage de la suite
+"""
+
+from app.config import settings
+from app.services.azure_service import azure_service
+from app.utils.text_chunker import estimate_tokens, chunk_text
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# En dessous, la transcription n'est pas résumée (même seuil que /summary/generate)
+MIN_SUMMARY_CHARS = 50
+
+
+class IncrementalSummarizer:
+    """
+    Résumés partiels lancés au fil des segments transcrits
+
+    Les segments sont accumulés ; dès que le texte dépasse
+    SUMMARY_CHUNK_MAX_TOKENS, les blocs complets sont résumés (étape map)
+    pendant que la transcription continue. À la fin, le dernier bloc est
+    résumé et les résumés partiels fusionnés (étape reduce). Une
+    transcription courte est résumée en un seul appel.
+    """
+
+    def __init__(self, summary_type: str = "structured", language: str = "fr"):
+        self.summary_type = summary_type
+        self.language = language
+        self._buffer: List[str] = []
+        self._buffer_tokens = 0
+        self._parts: List[asyncio.Task] = []
+        self._semaphore = asyncio.Semaphore(settings.SUMMARY_MAP_CONCURRENCY)
+        # Résumés partiels lancés avant la fin de la transcription
+        self.early_parts = 0
+
+    def feed(self, start: float, end: float, text: str) -> None:
+        """Ajoute un segment transcrit (appelé dans l'event loop, dans l'ordre)"""
+        text = text.strip()
+        if not text:
+            return
+
+        self._buffer.append(text)
+        self._buffer_tokens += estimate_tokens(text + " ")
+        if self._buffer_tokens <= settings.SUMMARY_CHUNK_MAX_TOKENS:
+            return
+
+        # Le dernier bloc reste ouvert : il sera complété par les segments suivants
+        chunks = chunk_text(" ".join(self._buffer), settings.SUMMARY_CHUNK_MAX_TOKENS)
+        for chunk in chunks[:-1]:
+            self._start_part(chunk)
+        self._buffer = [chunks[-1]]
+        self._buffer_tokens = estimate_tokens(chunks[-1])
+
+    def _start_part(self, text: str) -> None:
+        index = len(self._parts) + 1
+        logger.info(f"🧩 Summarizing part {index} while transcription continues")
+        self._parts.append(asyncio.create_task(self._summarize_part(text, index)))
+
+    async def _summarize_part(self, text: str, index: int) -> str:
+        async with self._semaphore:
+            return await azure_service.summarize_part(text, self.language, index)
+
+    async def finish(self, transcription_text: str) -> Dict[str, Any]:
+        """
+        Termine le résumé une fois la transcription complète
+
+        Args:
+            transcription_text: Texte complet de la transcription
+
+        Returns:
+            Dict contenant le résumé et les éléments structurés
+        """
+        self.early_parts = len(self._parts)
+        if not self._parts:
+            # Aucun bloc complet pendant la transcription (ou résultat du cache)
+            return await azure_service.generate_summary(
+                transcription_text, self.summary_type, self.language
+            )
+
+        tail = " ".join(self._buffer)
+        if tail.strip():
+            self._start_part(tail)
+        partial_summaries = await asyncio.gather(*self._parts)
+        return await azure_service.generate_summary_from_parts(
+            transcription_text, list(partial_summaries), self.summary_type, self.language
+        )
+
+    def cancel(self) -> None:
+        """Abandonne les résumés partiels en cours (échec de la transcription)"""
+        for task in self._parts:
+            task.cancel()
+
+
+class MeetingPipeline:
+    """Enchaîne transcription et résumé en une seule requête"""
+
+    async def run(
+        self,
+        file_path: str,
+        language: Optional[str] = "fr",
+        summary_type: str = "structured",
+        content_hash: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Transcrit un fichier audio puis le résume
+
+        Args:
+            file_path: Chemin du fichier audio
+            language: Code langue (None pour détection automatique)
+            summary_type: Type de résumé (structured, bullet_points, short)
+            content_hash: Empreinte SHA-256 du fichier (cache des transcriptions)
+            model: Modèle Whisper imposé (sinon choisi selon la durée)
+
+        Returns:
+            Dict avec la transcription, le résumé (None si texte trop court
+            ou en cas d'échec, voir summary_error), le nombre de résumés partiels
+            anticipés et le temps total
+        """
+        start_time = time.time()
+        summarizer = IncrementalSummarizer(summary_type, language or "fr")
+
+        try:
+            transcription = await azure_service.transcribe_audio(
+                file_path, language, content_hash=content_hash, model=model,
+                segment_callback=summarizer.feed
+            )
+        except BaseException:
+            summarizer.cancel()
+            raise
+
+        summary = None
+        summary_error = None
+        if len(transcription["text"].strip()) >= MIN_SUMMARY_CHARS:
+            # Un échec du résumé ne fait pas perdre la transcription
+            try:
+                summary = await summarizer.finish(transcription["text"])
+            except Exception as e:
+                summarizer.cancel()
+                summary_error = str(e)
+                logger.error(f"❌ Pipeline summary failed: {summary_error}")
+        else:
+            summarizer.cancel()
+            logger.info("⏭️ Transcription too short, summary skipped")
+
+        return {
+            "transcription": transcription,
+            "summary": summary,
+            "summary_error": summary_error,
+            "overlapped_summary_parts": summarizer.early_parts,
+            "processing_time": time.time() - start_time
+        }
+
+
+# Instance globale
+meeting_pipeline = MeetingPipeline()
@@ -0,0 +1,94 @@
+"""
+Cache des résumés GPT
+Évite de renvoyer la même transcription à Azure OpenAI pour un même type de résumé
+"""
+
+from collections import OrderedDict
+from app.config import settings
+import copy
+import hashlib
+import json
+import logging
+import time
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryCache:
+    """Cache mémoire des résumés avec expiration (TTL) et plafond mémoire (LRU)"""
+
+    def __init__(self, ttl_seconds: int, max_size_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+        # clé -> (résultat, taille estimée, date d'insertion), du moins au plus récemment utilisé
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        transcription_text: str,
+        summary_type: str,
+        language: str,
+        deployment: str
+    ) -> str:
+        """Construit la clé à partir de la transcription normalisée et des paramètres"""
+        normalized_text = " ".join(transcription_text.split())
+        text_hash = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+        return f"{text_hash}:{summary_type}:{language}:{deployment}"
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._size_bytes -= size
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retourne une copie du résumé en cache, ou None"""
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry[2] > self.ttl_seconds:
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry[0])
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Enregistre un résumé et évince les plus anciens au-delà du plafond"""
+        size = len(json.dumps(result, ensure_ascii=False).encode("utf-8"))
+        if size > self.max_size_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (copy.deepcopy(result), size, time.time())
+        self._size_bytes += size
+
+        while self._size_bytes > self.max_size_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne le taux de succès et l'occupation mémoire"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self._size_bytes,
+            "max_size_bytes": self.max_size_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions
+        }
+
+
+# Instance globale
+summary_cache = SummaryCache(
+    ttl_seconds=settings.SUMMARY_CACHE_TTL_SECONDS,
+    max_size_bytes=settings.SUMMARY_CACHE_MAX_MB * 1024 * 1024
+)
@@ -0,0 +1,183 @@
+"""
+Cache des transcriptions adressé par le contenu audio
+Évite de relancer le décodage Whisper pour un fichier déjà transcrit
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from app.config import settings
+import aiofiles
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionCache:
+    """
+    Cache disque des transcriptions avec budget de taille (LRU) et expiration
+
+    Chaque entrée est un fichier JSON nommé par sa clé. L'index (taille, date
+    de création) est reconstruit depuis le disque au démarrage ; l'ordre LRU
+    est alors approximé par la date de création. Les entrées expirent après
+    AUTO_DELETE_FILES_AFTER_HOURS, comme les fichiers audio (RGPD).
+    """
+
+    def __init__(self, cache_dir: Path, max_size_bytes: int, ttl_hours: int):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.ttl_seconds = ttl_hours * 3600
+        # clé -> (taille en octets, date de création), du moins au plus récemment utilisé
+        self._index: "OrderedDict[str, tuple]" = OrderedDict()
+        self._size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.audio_bytes_saved = 0
+        self.audio_seconds_saved = 0.0
+        self._load_index()
+
+    @staticmethod
+    def make_key(
+        content_hash: str,
+        language: Optional[str],
+        model: str,
+        decode_options: Dict[str, Any]
+    ) -> str:
+        """Construit la clé à partir du hash audio, de la langue, du modèle et des options"""
+        payload = json.dumps(
+            [content_hash, language or "auto", model, decode_options],
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load_index(self) -> None:
+        """Reconstruit l'index depuis les fichiers présents sur disque"""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+
+        for created_at, key, size in sorted(entries):
+            self._index[key] = (size, created_at)
+            self._size_bytes += size
+
+        removed = self.purge_expired()
+        self._evict()
+
+        if self._index:
+            logger.info(
+                f"💾 Transcription cache loaded: {len(self._index)} entries ({removed} expired)"
+            )
+
+    def _remove(self, key: str) -> None:
+        size, _ = self._index.pop(key)
+        self._size_bytes -= size
+        try:
+            self._entry_path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _is_expired(self, created_at: float) -> bool:
+        return time.time() - created_at > self.ttl_seconds
+
+    def _evict(self) -> None:
+        """Supprime les entrées les moins récemment utilisées au-delà du budget"""
+        while self._size_bytes > self.max_size_bytes and self._index:
+            key = next(iter(self._index))
+            self._remove(key)
+            self.evictions += 1
+
+    async def get(self, key: str, audio_bytes: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Retourne la transcription en cache, ou None
+
+        Args:
+            key: Clé construite avec make_key
+            audio_bytes: Taille du fichier audio (pour les statistiques)
+        """
+        entry = self._index.get(key)
+        if entry is None or self._is_expired(entry[1]):
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        try:
+            async with aiofiles.open(self._entry_path(key), "r", encoding="utf-8") as cache_file:
+                result = json.loads(await cache_file.read())
+        except Exception as e:
+            logger.warning(f"⚠️ Unreadable cache entry {key[:12]}: {e}")
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._index.move_to_end(key)
+        self.hits += 1
+        self.audio_bytes_saved += audio_bytes
+        self.audio_seconds_saved += result.get("duration") or 0.0
+        return result
+
+    async def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Enregistre une transcription (écriture atomique)"""
+        data = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        if len(data) > self.max_size_bytes:
+            return
+
+        path = self._entry_path(key)
+        # Fichier temporaire propre à chaque écriture : deux put concurrents sur
+        # la même clé ne se partagent pas le même fichier avant le renommage
+        tmp_path = path.with_name(f"{key}.{uuid.uuid4().hex}.tmp")
+        try:
+            async with aiofiles.open(tmp_path, "wb") as cache_file:
+                await cache_file.write(data)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        if key in self._index:
+            self._size_bytes -= self._index.pop(key)[0]
+        self._index[key] = (len(data), time.time())
+        self._size_bytes += len(data)
+        self._evict()
+
+    def purge_expired(self) -> int:
+        """Supprime les entrées expirées (conformité RGPD)"""
+        expired = [
+            key for key, (_, created_at) in self._index.items() if self._is_expired(created_at)
+        ]
+        for key in expired:
+            self._remove(key)
+        return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne taux de succès, taille et volume économisé"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._index),
+            "size_bytes": self._size_bytes,
+            "max_size_bytes": self.max_size_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+            "audio_bytes_saved": self.audio_bytes_saved,
+            "audio_seconds_saved": round(self.audio_seconds_saved, 1)
+        }
+
+
+# Instance globale
+transcription_cache = TranscriptionCache(
+    cache_dir=Path(settings.TEMP_FOLDER) / "cache" / "transcriptions",
+    max_size_bytes=settings.TRANSCRIPTION_CACHE_MAX_MB * 1024 * 1024,
+    ttl_hours=settings.AUTO_DELETE_FILES_AFTER_HOURS
+)
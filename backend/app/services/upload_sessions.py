@@ -0,0 +1,216 @@
+"""
+Uploads reprenables des gros fichiers audio
+Les blocs sont écrits directement dans le dossier temporaire, à leur position
+"""
+
+from dataclasses import dataclass, field
+from fastapi import HTTPException
+from app.config import settings
+from app.utils.file_handler import file_handler, StoredUpload
+import aiofiles
+import asyncio
+import hashlib
+import logging
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class UploadOffsetError(Exception):
+    """Bloc envoyé à une position différente de la taille déjà reçue"""
+
+    def __init__(self, received_bytes: int):
+        super().__init__(f"Position invalide : {received_bytes} octets déjà reçus")
+        self.received_bytes = received_bytes
+
+
+@dataclass
+class UploadSession:
+    """État d'un upload reprenable"""
+    id: str
+    filename: str
+    size_bytes: int
+    part_path: str
+    received_bytes: int = 0
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    # Empreinte calculée au fil des blocs : aucune relecture à la finalisation
+    hasher: Any = field(default_factory=hashlib.sha256, repr=False)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    @property
+    def is_complete(self) -> bool:
+        return self.received_bytes == self.size_bytes
+
+    @property
+    def expires_at(self) -> datetime:
+        return self.updated_at + timedelta(hours=settings.UPLOAD_SESSION_EXPIRE_HOURS)
+
+
+class UploadSessionManager:
+    """
+    Sessions d'upload reprenables
+
+    Protocole : création de la session (nom et taille annoncés), envoi des
+    blocs dans l'ordre avec leur position (PUT), puis finalisation avec
+    l'empreinte SHA-256 du fichier. Après une coupure, le client reprend à
+    la position renvoyée par la session. Les sessions sont conservées en
+    mémoire (perdues au redémarrage, comme les jobs).
+    """
+
+    def __init__(self):
+        self.sessions: Dict[str, UploadSession] = {}
+
+    async def create(self, filename: str, size_bytes: int) -> UploadSession:
+        """
+        Ouvre une session d'upload
+
+        Raises:
+            HTTPException: Si le fichier annoncé est refusé ou trop de sessions sont ouvertes
+        """
+        await self.purge_expired()
+        file_handler.validate_declared_upload(filename, size_bytes)
+        if len(self.sessions) >= settings.UPLOAD_SESSION_MAX:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Trop d'uploads en cours ({len(self.sessions)}), réessayez plus tard"
+            )
+
+        session_id = str(uuid.uuid4())
+        part_path = file_handler.temp_folder / f"{session_id}.upload.part"
+        part_path.touch()
+        session = UploadSession(session_id, filename, size_bytes, str(part_path))
+        self.sessions[session_id] = session
+
+        logger.info(f"📦 Upload session created: {session_id} ({filename}, {size_bytes} bytes)")
+        return session
+
+    def get(self, session_id: str) -> Optional[UploadSession]:
+        """Retourne une session ouverte"""
+        return self.sessions.get(session_id)
+
+    async def write(
+        self, session: UploadSession, offset: int, chunks: AsyncIterator[bytes]
+    ) -> UploadSession:
+        """
+        Écrit un bloc à sa position dans le fichier partiel
+
+        Les octets sont comptés au fil de l'écriture : après une coupure, la
+        session reprend après le dernier octet écrit.
+
+        Raises:
+            UploadOffsetError: Si la position ne suit pas les octets déjà reçus
+            HTTPException: Si un autre bloc est en cours d'écriture, si l'upload
+                est finalisé ou abandonné, ou si le fichier dépasse la taille annoncée
+        """
+        if session.lock.locked():
+            raise HTTPException(
+                status_code=409, detail="Un bloc est déjà en cours d'envoi pour cet upload"
+            )
+
+        async with session.lock:
+            if self.sessions.get(session.id) is not session:
+                raise HTTPException(status_code=404, detail="Upload introuvable ou expiré")
+            if offset != session.received_bytes:
+                raise UploadOffsetError(session.received_bytes)
+
+            async with aiofiles.open(session.part_path, "r+b") as part_file:
+                await part_file.seek(offset)
+                try:
+                    async for chunk in chunks:
+                        if session.received_bytes + len(chunk) > session.size_bytes:
+                            raise HTTPException(
+                                status_code=413,
+                                detail=(
+                                    f"Bloc au-delà de la taille annoncée "
+                                    f"({session.size_bytes} octets)"
+                                ),
+                            )
+                        await part_file.write(chunk)
+                        session.hasher.update(chunk)
+                        session.received_bytes += len(chunk)
+                finally:
+                    # Octets au-delà de la position reçue (bloc précédent interrompu)
+                    await part_file.truncate(session.received_bytes)
+                    session.updated_at = datetime.utcnow()
+
+        return session
+
+    async def finalize(self, session: UploadSession, sha256: str) -> StoredUpload:
+        """
+        Vérifie l'upload complet et le transmet au circuit d'upload classique
+
+        La session est retirée avant la publication : une seconde finalisation
+        ou un abandon concurrent reçoit un 404. Le fichier partiel est validé
+        puis renommé par le FileHandler (sans copie), hors de l'event loop.
+
+        Raises:
+            HTTPException: Si l'upload est inconnu, incomplet, en cours ou si l'empreinte diffère
+        """
+        if self.sessions.get(session.id) is not session:
+            raise HTTPException(status_code=404, detail="Upload introuvable ou expiré")
+        if session.lock.locked():
+            raise HTTPException(
+                status_code=409, detail="Un bloc est en cours d'envoi pour cet upload"
+            )
+        if not session.is_complete:
+            raise HTTPException(
+                status_code=409,
+                detail=(
+                    f"Upload incomplet : "
+                    f"{session.received_bytes}/{session.size_bytes} octets reçus"
+                ),
+            )
+
+        if sha256.strip().lower() != session.hasher.hexdigest():
+            # Fichier corrompu pendant le transfert : l'upload est à recommencer
+            await self.delete(session.id)
+            raise HTTPException(
+                status_code=400, detail="Empreinte SHA-256 différente du fichier reçu"
+            )
+
+        self.sessions.pop(session.id, None)
+        try:
+            return await asyncio.to_thread(
+                file_handler.adopt_upload,
+                session.part_path, session.filename, session.size_bytes, session.hasher.hexdigest()
+            )
+        finally:
+            Path(session.part_path).unlink(missing_ok=True)
+
+    async def delete(self, session_id: str) -> bool:
+        """Abandonne une session et supprime le fichier partiel"""
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            return False
+        await file_handler.delete_file(session.part_path)
+        return True
+
+    async def purge_expired(self) -> int:
+        """Supprime les sessions inactives depuis UPLOAD_SESSION_EXPIRE_HOURS (RGPD)"""
+        now = datetime.utcnow()
+        expired = [
+            session_id for session_id, session in self.sessions.items()
+            if session.expires_at < now and not session.lock.locked()
+        ]
+        for session_id in expired:
+            await self.delete(session_id)
+
+        if expired:
+            logger.info(f"🧹 {len(expired)} expired upload sessions deleted")
+        return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne les uploads en cours"""
+        return {
+            "sessions": len(self.sessions),
+            "received_bytes": sum(session.received_bytes for session in self.sessions.values()),
+            "max_sessions": settings.UPLOAD_SESSION_MAX
+        }
+
+
+# Instance globale
+upload_session_manager = UploadSessionManager()
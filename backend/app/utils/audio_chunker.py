@@ -0,0 +1,96 @@
+"""
+Découpage des longs enregistrements pour une transcription parallèle
+Choisit les points de coupe dans les silences et recolle les transcriptions
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+# Fréquence d'échantillonnage attendue par Whisper
+SAMPLING_RATE = 16000
+
+_NON_WORD = re.compile(r"[^\w]")
+
+
+class AudioChunk(NamedTuple):
+    """Bloc audio en échantillons ; overlap > 0 si la coupe précédente n'est pas un silence"""
+    start: int
+    end: int
+    overlap: int = 0
+
+
+def plan_chunks(
+    speech_timestamps: List[Dict[str, int]],
+    total_samples: int,
+    target_samples: int,
+    overlap_samples: int,
+    search_samples: Optional[int] = None
+) -> List[AudioChunk]:
+    """
+    Découpe l'audio en blocs d'environ target_samples échantillons
+
+    Chaque coupe est placée au milieu du plus long silence situé à
+    ±search_samples de la position visée. Sans silence disponible, la coupe
+    est franche et le bloc suivant reprend overlap_samples échantillons plus tôt.
+
+    Args:
+        speech_timestamps: Zones de parole détectées par le VAD ({"start", "end"} en échantillons)
+        total_samples: Longueur totale de l'audio
+        target_samples: Longueur visée par bloc
+        overlap_samples: Chevauchement en cas de coupe franche
+        search_samples: Fenêtre de recherche d'un silence (target / 4 par défaut)
+
+    Returns:
+        Liste de blocs contigus couvrant tout l'audio
+    """
+    if search_samples is None:
+        search_samples = target_samples // 4
+
+    gaps = [
+        (current["end"], following["start"])
+        for current, following in zip(speech_timestamps, speech_timestamps[1:])
+        if following["start"] > current["end"]
+    ]
+
+    chunks = []
+    start = 0
+    overlap = 0
+
+    while total_samples - start > target_samples + search_samples:
+        ideal = start + target_samples
+        candidates = [
+            gap for gap in gaps
+            if ideal - search_samples <= (gap[0] + gap[1]) // 2 <= ideal + search_samples
+        ]
+
+        if candidates:
+            silence_start, silence_end = max(candidates, key=lambda gap: gap[1] - gap[0])
+            cut = (silence_start + silence_end) // 2
+            chunks.append(AudioChunk(start, cut, overlap))
+            start, overlap = cut, 0
+        else:
+            chunks.append(AudioChunk(start, ideal, overlap))
+            start, overlap = ideal - overlap_samples, overlap_samples
+
+    chunks.append(AudioChunk(start, total_samples, overlap))
+    return chunks
+
+
+def deduplicate_boundary(previous_text: str, next_text: str, max_words: int = 20) -> str:
+    """
+    Retire du début de next_text les mots qui répètent la fin de previous_text
+
+    Utilisé après une coupe franche : la zone de chevauchement est transcrite
+    dans les deux blocs. La comparaison ignore la casse et la ponctuation.
+    """
+    previous_words = previous_text.split()
+    next_words = next_text.split()
+
+    def normalize(words: List[str]) -> List[str]:
+        return [_NON_WORD.sub("", word.lower()) for word in words]
+
+    for size in range(min(max_words, len(previous_words), len(next_words)), 0, -1):
+        if normalize(previous_words[-size:]) == normalize(next_words[:size]):
+            return " ".join(next_words[size:])
+
+    return next_text
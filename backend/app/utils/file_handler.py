@@ -4,18 +4,37 @@ Validation, conversion et nettoyage sécurisés
 """
 
 import os
+import asyncio
 import uuid
+import hashlib
+import zipfile
 import aiofiles
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import AsyncIterator, List, Optional, Tuple
 from fastapi import UploadFile, HTTPException
 from app.config import settings
+from app.utils.metrics import STAGE_DURATION
 import logging
 import magic  # python-magic-bin for file type detection
+import time
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Audio décodé (PCM float32 16 kHz) conservé à côté de l'upload
+PCM_SIDECAR_SUFFIX = ".pcm.npy"
+
+
+@dataclass
+class StoredUpload:
+    """Fichier uploadé sauvegardé dans le dossier temporaire"""
+    file_path: str
+    file_id: str
+    size_bytes: int
+    sha256: str
+    mime_type: Optional[str] = None
+
 
 class FileHandler:
     """Gestion sécurisée des fichiers audio"""
@@ -37,57 +56,252 @@ class FileHandler:
         Raises:
             HTTPException: Si validation échoue
         """
+        stored = await self.ingest_upload(upload_file)
+        return stored.file_path, stored.file_id
+    
+    async def ingest_upload(self, upload_file: UploadFile) -> StoredUpload:
+        """
+        Sauvegarde un fichier uploadé (durée mesurée : étape « upload »)
+        
+        Voir _ingest_upload.
+        """
+        with STAGE_DURATION.labels(stage="upload").time():
+            return await self._ingest_upload(upload_file)
+    
+    async def _ingest_upload(self, upload_file: UploadFile) -> StoredUpload:
+        """
+        Sauvegarde un fichier uploadé par blocs, avec une mémoire bornée
+        
+        La taille est vérifiée au fil de la lecture, le type MIME détecté sur
+        le premier bloc et le hash SHA-256 calculé incrémentalement. Les petits
+        fichiers restent en mémoire jusqu'à la fin de la validation ; au-delà de
+        UPLOAD_SPOOL_MAX_MEMORY_MB, les blocs sont écrits directement sur disque.
+        
+        Args:
+            upload_file: Fichier uploadé par l'utilisateur
+        
+        Returns:
+            StoredUpload avec chemin, ID, taille, hash et type MIME
+        
+        Raises:
+            HTTPException: Si validation échoue
+        """
+        part_path = None
+        # Extension puis type MIME : une seule mesure de l'étape « validation »
+        validation_start = time.perf_counter()
+        validation_seconds = None
+        
         try:
-            # Validation du fichier
-            await self._validate_file(upload_file)
+            # Validation de l'extension avant toute lecture
+            file_extension = self._validate_extension(upload_file.filename or "")
+            validation_seconds = time.perf_counter() - validation_start
             
-            # Génération d'un ID unique
+            # Génération d'un ID unique et d'un chemin de sauvegarde sécurisé
             file_id = str(uuid.uuid4())
+            safe_filename = f"{file_id}.{file_extension}"
+            file_path = self.temp_folder / safe_filename
             
-            # Extraction de l'extension
-            original_filename = upload_file.filename or "audio.mp3"
-            file_extension = Path(original_filename).suffix.lower()
+            hasher = hashlib.sha256()
+            buffer = bytearray()
+            part_file = None
+            mime_type = None
+            file_size = 0
             
-            # Chemin de sauvegarde sécurisé
-            safe_filename = f"{file_id}{file_extension}"
-            file_path = self.temp_folder / safe_filename
+            try:
+                while True:
+                    chunk = await upload_file.read(settings.upload_chunk_size_bytes)
+                    if not chunk:
+                        break
+                    
+                    file_size += len(chunk)
+                    if file_size > settings.max_file_size_bytes:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=(
+                                f"Fichier trop volumineux. "
+                                f"Maximum: {settings.MAX_FILE_SIZE_MB} MB"
+                            ),
+                        )
+                    
+                    if mime_type is None:
+                        mime_start = time.perf_counter()
+                        try:
+                            mime_type = self._check_mime_type(chunk, upload_file.filename or "")
+                        finally:
+                            validation_seconds += time.perf_counter() - mime_start
+                    
+                    hasher.update(chunk)
+                    
+                    if part_file is not None:
+                        await part_file.write(chunk)
+                        continue
+                    
+                    buffer += chunk
+                    if len(buffer) > settings.upload_spool_max_memory_bytes:
+                        # Bascule sur disque : le buffer mémoire ne grossit plus
+                        part_path = self.temp_folder / f"{safe_filename}.part"
+                        part_file = await aiofiles.open(part_path, 'wb')
+                        await part_file.write(buffer)
+                        buffer = bytearray()
+            finally:
+                if part_file is not None:
+                    await part_file.close()
             
-            # Sauvegarde asynchrone
-            async with aiofiles.open(file_path, 'wb') as out_file:
-                content = await upload_file.read()
-                await out_file.write(content)
+            if part_path is not None:
+                os.replace(part_path, file_path)
+                part_path = None
+            else:
+                async with aiofiles.open(file_path, 'wb') as out_file:
+                    await out_file.write(buffer)
             
-            logger.info(f"✅ File saved: {safe_filename} ({len(content)} bytes)")
-            return str(file_path), file_id
+            logger.info(f"✅ File saved: {safe_filename} ({file_size} bytes)")
+            return StoredUpload(
+                file_path=str(file_path),
+                file_id=file_id,
+                size_bytes=file_size,
+                sha256=hasher.hexdigest(),
+                mime_type=mime_type
+            )
             
         except HTTPException:
             raise
         except Exception as e:
             logger.error(f"❌ Failed to save file: {e}")
             raise HTTPException(status_code=500, detail=f"Erreur de sauvegarde: {str(e)}")
+        finally:
+            STAGE_DURATION.labels(stage="validation").observe(
+                validation_seconds
+                if validation_seconds is not None
+                else time.perf_counter() - validation_start
+            )
+            # Suppression du fichier partiel en cas d'échec
+            if part_path is not None and part_path.exists():
+                part_path.unlink()
     
-    async def _validate_file(self, upload_file: UploadFile) -> None:
+    def validate_declared_upload(self, filename: str, size_bytes: int) -> str:
         """
-        Valide un fichier uploadé
+        Valide un upload annoncé avant réception (upload reprenable)
+        
+        Returns:
+            Extension en minuscules, sans le point
         
-        Vérifie:
-        - Taille maximale
-        - Extension autorisée
-        - Type MIME
+        Raises:
+            HTTPException: Si l'extension ou la taille annoncée est refusée
         """
-        # Vérification de la taille
-        content = await upload_file.read()
-        file_size = len(content)
-        await upload_file.seek(0)  # Reset pour lecture ultérieure
+        with STAGE_DURATION.labels(stage="validation").time():
+            return self._validate_declared(filename, size_bytes)
+    
+    def _validate_declared(self, filename: str, size_bytes: int) -> str:
+        """Vérifie l'extension et la taille annoncée (sans mesure de durée)"""
+        file_extension = self._validate_extension(filename)
         
-        if file_size > settings.max_file_size_bytes:
+        if size_bytes > settings.max_file_size_bytes:
             raise HTTPException(
                 status_code=413,
                 detail=f"Fichier trop volumineux. Maximum: {settings.MAX_FILE_SIZE_MB} MB"
             )
+        return file_extension
+    
+    def adopt_upload(
+        self, part_path: str, filename: str, size_bytes: int, sha256: str
+    ) -> StoredUpload:
+        """
+        Valide un fichier reçu par blocs dans le dossier temporaire et le publie
         
-        # Vérification de l'extension
-        filename = upload_file.filename or ""
+        Le type MIME est détecté sur les premiers octets, puis le fichier est
+        renommé (sans copie) comme un upload classique. Bloquant : à appeler
+        dans un thread.
+        
+        Args:
+            part_path: Fichier partiel complet, dans le dossier temporaire
+            filename: Nom d'origine du fichier
+            size_bytes: Taille du fichier
+            sha256: Empreinte SHA-256 vérifiée du fichier
+        
+        Returns:
+            StoredUpload avec chemin, ID, taille, hash et type MIME
+        
+        Raises:
+            HTTPException: Si validation échoue
+        """
+        # Extension, taille puis type MIME : une seule mesure de l'étape « validation »
+        with STAGE_DURATION.labels(stage="validation").time():
+            file_extension = self._validate_declared(filename, size_bytes)
+            with open(part_path, "rb") as part_file:
+                head = part_file.read(2048)
+            mime_type = self._check_mime_type(head, filename)
+        
+        file_id = str(uuid.uuid4())
+        file_path = self.temp_folder / f"{file_id}.{file_extension}"
+        os.replace(part_path, file_path)
+        
+        logger.info(f"✅ File assembled: {file_path.name} ({size_bytes} bytes)")
+        return StoredUpload(
+            file_path=str(file_path),
+            file_id=file_id,
+            size_bytes=size_bytes,
+            sha256=sha256,
+            mime_type=mime_type
+        )
+    
+    async def iter_archive(self, upload_file: UploadFile) -> AsyncIterator[UploadFile]:
+        """
+        Parcourt les fichiers d'une archive zip sans l'extraire
+        
+        Chaque fichier est exposé comme un upload, à passer à ingest_upload
+        (mêmes validations, décompression lue par blocs). Les dossiers et les
+        fichiers cachés (métadonnées macOS) sont ignorés. Lecture du répertoire
+        et ouverture des membres dans un thread, hors de la boucle d'événements.
+        
+        Raises:
+            HTTPException: Si l'archive est invalide ou contient trop de fichiers
+        """
+        archive, members = await asyncio.to_thread(self._open_archive, upload_file)
+        try:
+            for info in members:
+                member = await asyncio.to_thread(archive.open, info)
+                try:
+                    yield UploadFile(
+                        file=member, filename=Path(info.filename).name, size=info.file_size
+                    )
+                finally:
+                    member.close()
+        finally:
+            archive.close()
+    
+    def _open_archive(
+        self, upload_file: UploadFile
+    ) -> Tuple[zipfile.ZipFile, List[zipfile.ZipInfo]]:
+        """Ouvre l'archive et liste les fichiers à transcrire (bloquant)"""
+        try:
+            archive = zipfile.ZipFile(upload_file.file)
+        except zipfile.BadZipFile:
+            raise HTTPException(status_code=400, detail="Archive zip invalide")
+        
+        try:
+            members = [
+                info for info in archive.infolist()
+                if not info.is_dir()
+                and not info.filename.startswith("__MACOSX/")
+                and not Path(info.filename).name.startswith(".")
+            ]
+            if len(members) > settings.BATCH_MAX_FILES:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Trop de fichiers dans l'archive. Maximum: {settings.BATCH_MAX_FILES}"
+                )
+        except BaseException:
+            archive.close()
+            raise
+        return archive, members
+    
+    def _validate_extension(self, filename: str) -> str:
+        """
+        Vérifie que l'extension est autorisée
+        
+        Returns:
+            Extension en minuscules, sans le point
+        """
         file_extension = Path(filename).suffix.lower().replace(".", "")
         
         if file_extension not in settings.allowed_extensions_list:
@@ -96,10 +310,18 @@ class FileHandler:
                 detail=f"Format non supporté. Formats acceptés: {', '.join(settings.allowed_extensions_list)}"
             )
         
-        # Vérification du type MIME (sécurité supplémentaire)
+        return file_extension
+    
+    def _check_mime_type(self, head: bytes, filename: str) -> Optional[str]:
+        """
+        Détecte le type MIME à partir des premiers octets (sécurité supplémentaire)
+        
+        Returns:
+            Type MIME détecté, ou None si la détection échoue
+        """
         try:
             mime = magic.Magic(mime=True)
-            file_type = mime.from_buffer(content[:2048])  # Lire les premiers octets
+            file_type = mime.from_buffer(head[:2048])  # Lire les premiers octets
             
             logger.info(f"📄 Detected MIME type: {file_type} for {filename}")
             
@@ -116,11 +338,14 @@ class FileHandler:
             if not is_valid_mime:
                 logger.warning(f"⚠️ Unusual MIME type: {file_type} for {filename}")
                 # On permet quand même si l'extension est correcte (flexibilité)
-                logger.info(f"✅ File accepted based on extension: {file_extension}")
+                logger.info(f"✅ File accepted based on extension: {Path(filename).suffix}")
+            
+            return file_type
         
         except Exception as e:
             logger.warning(f"⚠️ MIME type check failed: {e}")
             # Continue si la détection MIME échoue (on se fie à l'extension)
+            return None
     
     async def delete_file(self, file_path: str) -> bool:
         """
@@ -140,6 +365,11 @@ class FileHandler:
                 logger.error(f"❌ Attempted to delete file outside temp folder: {file_path}")
                 return False
             
+            # L'audio décodé suit le cycle de vie de l'upload
+            sidecar = Path(f"{path}{PCM_SIDECAR_SUFFIX}")
+            if sidecar.exists():
+                sidecar.unlink()
+            
             if path.exists():
                 path.unlink()
                 logger.info(f"🗑️ File deleted: {path.name}")
@@ -0,0 +1,103 @@
+"""
+Métriques Prometheus de Whispen
+Latence par étape du pipeline, files d'attente, erreurs Azure et facteur temps réel
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Étapes mesurées : upload, validation, decode, inference, summarization, serialization
+STAGE_DURATION = Histogram(
+    "whispen_stage_duration_seconds",
+    "Durée de chaque étape du traitement",
+    ["stage"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "whispen_http_request_duration_seconds",
+    "Durée des requêtes HTTP",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+)
+
+# Temps de traitement / durée audio (< 1 : plus rapide que le temps réel)
+TRANSCRIPTION_RTF = Histogram(
+    "whispen_transcription_real_time_factor",
+    "Facteur temps réel des transcriptions",
+    ["model"],
+    buckets=(0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 5)
+)
+
+TRANSCRIPTION_AUDIO_SECONDS = Counter(
+    "whispen_transcription_audio_seconds_total",
+    "Durée d'audio transcrite (hors cache)",
+    ["model"]
+)
+
+AZURE_REQUESTS = Counter(
+    "whispen_azure_requests_total",
+    "Requêtes Azure OpenAI / OpenAI (tentatives comprises)",
+    ["operation"]
+)
+
+AZURE_ERRORS = Counter(
+    "whispen_azure_errors_total",
+    "Erreurs des requêtes Azure OpenAI / OpenAI",
+    ["operation", "error"]
+)
+
+AZURE_RETRIES = Counter(
+    "whispen_azure_retries_total",
+    "Nouvelles tentatives après une erreur transitoire",
+    ["operation"]
+)
+
+MODEL_ROUTING = Counter(
+    "whispen_model_routing_total",
+    "Transcriptions locales par modèle Whisper choisi",
+    ["model", "reason"]
+)
+
+MODEL_REGISTRY_EVENTS = Counter(
+    "whispen_model_registry_events_total",
+    "Chargements, échecs et évictions des modèles Whisper",
+    ["event", "model"]
+)
+
+MODEL_REGISTRY_LOOKUPS = Counter(
+    "whispen_model_registry_lookups_total",
+    "Demandes d'un modèle Whisper (hit : déjà chargé, miss : chargement)",
+    ["model", "result"]
+)
+
+MODEL_MEMORY_BYTES = Gauge(
+    "whispen_model_memory_bytes",
+    "Mémoire résidente attribuée à chaque modèle Whisper chargé",
+    ["model"]
+)
+
+ADMISSION_REJECTED = Counter(
+    "whispen_admission_rejected_total",
+    "Transcriptions refusées par le contrôle d'admission",
+    ["reason"]
+)
+
+# Jauges lues au moment du scrape (voir main.py)
+JOB_QUEUE_DEPTH = Gauge("whispen_job_queue_depth", "Jobs de transcription en attente")
+JOBS_IN_FLIGHT = Gauge("whispen_jobs_in_flight", "Jobs de transcription en cours")
+INFERENCE_QUEUE_DEPTH = Gauge(
+    "whispen_inference_queue_depth", "Tâches en attente du pool d'inférence"
+)
+INFERENCE_RUNNING = Gauge("whispen_inference_running", "Tâches en cours dans le pool d'inférence")
+MODEL_REPLICAS_BUSY = Gauge("whispen_model_replicas_busy", "Répliques Whisper occupées")
+ADMISSION_PENDING = Gauge("whispen_admission_pending", "Transcriptions acceptées et non terminées")
+ADMISSION_OUTSTANDING_AUDIO_SECONDS = Gauge(
+    "whispen_admission_outstanding_audio_seconds",
+    "Audio accepté en attente de transcription (estimé)",
+)
+
+
+def error_label(error: Exception) -> str:
+    """Étiquette d'erreur : code HTTP si disponible, sinon nom de la classe"""
+    status_code = getattr(error, "status_code", None)
+    return str(status_code) if status_code else error.__class__.__name__
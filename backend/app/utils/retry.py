@@ -0,0 +1,69 @@
+"""
+Politique de nouvelles tentatives pour les appels Azure OpenAI / OpenAI
+Backoff exponentiel avec jitter, en respectant l'en-tête Retry-After
+"""
+
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import openai
+import random
+from typing import Optional
+
+
+def is_retryable(error: Exception) -> bool:
+    """Indique si l'erreur est transitoire (429, 5xx, connexion, timeout)"""
+    if isinstance(error, (openai.APIConnectionError, openai.APITimeoutError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    Retourne le délai demandé par le serveur, en secondes
+
+    Lit `retry-after-ms` (Azure OpenAI) puis `Retry-After` (secondes ou date HTTP).
+    """
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+
+    headers = response.headers
+    try:
+        if "retry-after-ms" in headers:
+            return max(0.0, float(headers["retry-after-ms"]) / 1000)
+        if "retry-after" in headers:
+            value = headers["retry-after"]
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                retry_at = parsedate_to_datetime(value)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+    return None
+
+
+def compute_backoff(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    retry_after: Optional[float] = None
+) -> float:
+    """
+    Calcule le délai avant la prochaine tentative
+
+    Args:
+        attempt: Numéro de la tentative échouée (0 pour la première)
+        base_delay: Délai de base en secondes
+        max_delay: Délai maximum en secondes
+        retry_after: Délai imposé par le serveur, prioritaire s'il est fourni
+
+    Returns:
+        Délai en secondes (« full jitter » entre 0 et le plafond exponentiel)
+    """
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
@@ -0,0 +1,159 @@
+"""
+Chronologie compacte des segments de transcription
+Tableaux parallèles (début, fin, offsets de texte) et exports SRT / WebVTT / JSON
+"""
+
+from array import array
+import json
+import numpy as np
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+# Séparateur entre deux segments dans le texte complet
+SEGMENT_SEPARATOR = " "
+
+
+class SegmentTimeline:
+    """
+    Segments stockés en colonnes plutôt qu'en liste d'objets
+
+    Le texte complet est conservé une seule fois ; le segment i correspond à
+    text[offsets[i]:offsets[i + 1]] (séparateur exclu). Les horodatages sont
+    en secondes (float64).
+    """
+
+    __slots__ = ("starts", "ends", "offsets", "text")
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, offsets: np.ndarray, text: str):
+        self.starts = starts
+        self.ends = ends
+        self.offsets = offsets
+        self.text = text
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Tuple[float, float, str]]) -> "SegmentTimeline":
+        """Construit la chronologie à partir de triplets (début, fin, texte)"""
+        starts = array("d")
+        ends = array("d")
+        offsets = array("q", [0])
+        parts: List[str] = []
+        position = 0
+
+        for start, end, segment_text in segments:
+            segment_text = segment_text.strip()
+            if not segment_text:
+                continue
+            if parts:
+                position += len(SEGMENT_SEPARATOR)
+            starts.append(start)
+            ends.append(end)
+            parts.append(segment_text)
+            position += len(segment_text)
+            offsets.append(position + len(SEGMENT_SEPARATOR))
+
+        return cls(
+            np.frombuffer(starts, dtype=np.float64).copy(),
+            np.frombuffer(ends, dtype=np.float64).copy(),
+            np.frombuffer(offsets, dtype=np.int64).copy(),
+            SEGMENT_SEPARATOR.join(parts)
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def segment_text(self, index: int) -> str:
+        """Texte du segment index"""
+        end = self.offsets[index + 1] - len(SEGMENT_SEPARATOR)
+        return self.text[self.offsets[index]:end]
+
+    def __iter__(self) -> Iterator[Tuple[float, float, str]]:
+        for index in range(len(self)):
+            yield float(self.starts[index]), float(self.ends[index]), self.segment_text(index)
+
+    def merge_refined(self, refined: "SegmentTimeline") -> "SegmentTimeline":
+        """
+        Brouillon dont le début est remplacé par les segments affinés
+
+        Les segments du brouillon qui commencent avant la fin du dernier
+        segment affiné sont retirés ; les suivants sont conservés.
+        """
+        if not len(refined):
+            return self
+        first_kept = int(np.searchsorted(self.starts, refined.ends[-1], side="left"))
+        return SegmentTimeline.from_segments(
+            list(refined) + [
+                (float(self.starts[index]), float(self.ends[index]), self.segment_text(index))
+                for index in range(first_kept, len(self))
+            ]
+        )
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Colonnes start / end / text pour la réponse API"""
+        return {
+            "start": np.round(self.starts, 3).tolist(),
+            "end": np.round(self.ends, 3).tolist(),
+            "text": [self.segment_text(index) for index in range(len(self))]
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Forme sérialisable en JSON (cache des transcriptions)"""
+        return {
+            "starts": self.starts.tolist(),
+            "ends": self.ends.tolist(),
+            "offsets": self.offsets.tolist(),
+            "text": self.text
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SegmentTimeline":
+        """Reconstruit une chronologie sérialisée par to_dict"""
+        return cls(
+            np.asarray(data["starts"], dtype=np.float64),
+            np.asarray(data["ends"], dtype=np.float64),
+            np.asarray(data["offsets"], dtype=np.int64),
+            data["text"]
+        )
+
+
+def _format_timestamp(seconds: float, decimal_marker: str) -> str:
+    milliseconds = int(round(seconds * 1000))
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    secs, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{decimal_marker}{milliseconds:03d}"
+
+
+def export_srt(timeline: SegmentTimeline) -> Iterator[str]:
+    """Génère le fichier SRT bloc par bloc"""
+    for index, (start, end, segment_text) in enumerate(timeline, start=1):
+        yield (
+            f"{index}\n"
+            f"{_format_timestamp(start, ',')} --> {_format_timestamp(end, ',')}\n"
+            f"{segment_text}\n\n"
+        )
+
+
+def export_vtt(timeline: SegmentTimeline) -> Iterator[str]:
+    """Génère le fichier WebVTT bloc par bloc"""
+    yield "WEBVTT\n\n"
+    for start, end, segment_text in timeline:
+        yield (
+            f"{_format_timestamp(start, '.')} --> {_format_timestamp(end, '.')}\n"
+            f"{segment_text}\n\n"
+        )
+
+
+def export_json(timeline: SegmentTimeline) -> Iterator[str]:
+    """Génère un tableau JSON de segments, un segment à la fois"""
+    yield "["
+    for index, (start, end, segment_text) in enumerate(timeline):
+        segment = {"start": round(start, 3), "end": round(end, 3), "text": segment_text}
+        yield ("," if index else "") + json.dumps(segment, ensure_ascii=False)
+    yield "]"
+
+
+# Exports disponibles : format -> (générateur, type MIME)
+EXPORT_FORMATS = {
+    "srt": (export_srt, "application/x-subrip"),
+    "vtt": (export_vtt, "text/vtt"),
+    "json": (export_json, "application/json"),
+}
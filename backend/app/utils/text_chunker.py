@@ -0,0 +1,105 @@
+"""
+Découpage de transcriptions longues
+Découpe un texte en blocs d'un nombre de tokens borné, aux frontières de phrases
+"""
+
+import logging
+import re
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Encodage tiktoken (dépendance optionnelle « tokens ») chargé à la première utilisation :
+# get_encoding peut télécharger le vocabulaire, ce qui n'a pas sa place à l'import
+TIKTOKEN_ENCODING = "o200k_base"
+_NOT_LOADED = object()
+_encoding: Any = _NOT_LOADED
+
+# Estimation prudente sans tiktoken (le français compte ~3,5 caractères par token)
+CHARS_PER_TOKEN = 3
+
+_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+")
+
+
+def _get_encoding() -> Optional[Any]:
+    """Charge l'encodage tiktoken une seule fois ; None si indisponible (estimation)"""
+    global _encoding
+    if _encoding is _NOT_LOADED:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+        except ImportError:
+            _encoding = None
+        except Exception as e:
+            logger.warning(f"⚠️ tiktoken encoding unavailable, token counts are estimated: {e}")
+            _encoding = None
+    return _encoding
+
+
+def estimate_tokens(text: str) -> int:
+    """Retourne le nombre de tokens du texte (exact avec tiktoken, estimé sinon)"""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def split_sentences(text: str) -> List[str]:
+    """Découpe un texte en phrases (ponctuation de fin suivie d'un espace)"""
+    return [sentence for sentence in _SENTENCE_END.split(text.strip()) if sentence]
+
+
+def _split_long_sentence(sentence: str, max_tokens: int) -> List[str]:
+    """Découpe par mots une phrase plus longue qu'un bloc (transcription sans ponctuation)"""
+    parts = []
+    current: List[str] = []
+    current_tokens = 0
+
+    for word in sentence.split():
+        word_tokens = estimate_tokens(word + " ")
+        if current and current_tokens + word_tokens > max_tokens:
+            parts.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(word)
+        current_tokens += word_tokens
+
+    if current:
+        parts.append(" ".join(current))
+    return parts
+
+
+def chunk_text(text: str, max_tokens: int) -> List[str]:
+    """
+    Regroupe les phrases en blocs d'au plus max_tokens tokens
+
+    Args:
+        text: Texte à découper
+        max_tokens: Nombre maximum de tokens par bloc
+
+    Returns:
+        Liste de blocs, dans l'ordre du texte
+    """
+    chunks = []
+    current: List[str] = []
+    current_tokens = 0
+
+    for sentence in split_sentences(text):
+        sentence_tokens = estimate_tokens(sentence + " ")
+
+        if sentence_tokens > max_tokens:
+            pieces = _split_long_sentence(sentence, max_tokens)
+        else:
+            pieces = [sentence]
+
+        for piece in pieces:
+            piece_tokens = sentence_tokens if len(pieces) == 1 else estimate_tokens(piece + " ")
+            if current and current_tokens + piece_tokens > max_tokens:
+                chunks.append(" ".join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece_tokens
+
+    if current:
+        chunks.append(" ".join(current))
+
+    return chunks
@@ -0,0 +1,4 @@
+"""
+Benchmarks Whispen
+Mesures reproductibles et hors ligne des chemins critiques (upload, transcription, résumé)
+"""
@@ -0,0 +1,108 @@
+"""
+Comparaison de deux rapports de benchmark
+Écarts de latence p50/p95, RTF et débit entre deux commits
+
+Usage (depuis backend/) :
+    python -m benchmarks.compare baseline.json candidate.json
+    python -m benchmarks.compare baseline.json candidate.json --threshold 10
+
+Avec --threshold, le code de sortie vaut 1 si une latence p50 (ou un RTF p50)
+se dégrade de plus du pourcentage indiqué.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# (libellé, chemin dans le résultat, une hausse est une dégradation)
+METRICS: List[Tuple[str, Tuple[str, str], bool]] = [
+    ("p50 ms", ("latency_ms", "p50"), True),
+    ("p95 ms", ("latency_ms", "p95"), True),
+    ("RTF p50", ("rtf", "p50"), True),
+]
+
+# Métriques surveillées par --threshold
+GATED_METRICS = {"p50 ms", "RTF p50"}
+
+
+def _value(result: Dict[str, Any], path: Tuple[str, str]) -> Optional[float]:
+    section = result.get(path[0])
+    return section.get(path[1]) if isinstance(section, dict) else None
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    candidate: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Compare les résultats de même nom
+
+    Returns:
+        Une ligne par (benchmark, métrique) présente dans les deux rapports,
+        avec l'écart relatif en pourcentage
+    """
+    baseline_results = {result["name"]: result for result in baseline["results"]}
+    rows = []
+
+    for result in candidate["results"]:
+        previous = baseline_results.get(result["name"])
+        if previous is None:
+            continue
+        for label, path, higher_is_worse in METRICS:
+            before, after = _value(previous, path), _value(result, path)
+            if before is None or after is None:
+                continue
+            change = (after - before) / before * 100 if before else 0.0
+            rows.append({
+                "name": result["name"],
+                "metric": label,
+                "baseline": before,
+                "candidate": after,
+                "change_percent": round(change, 1),
+                "regression_percent": round(change if higher_is_worse else -change, 1),
+            })
+
+    return rows
+
+
+def find_regressions(rows: List[Dict[str, Any]], threshold: float) -> List[Dict[str, Any]]:
+    """Lignes surveillées dont la dégradation dépasse le seuil (en %)"""
+    return [
+        row for row in rows
+        if row["metric"] in GATED_METRICS and row["regression_percent"] > threshold
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare deux rapports de benchmark Whispen")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument("--threshold", type=float, help="Dégradation maximum tolérée (%%)")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    candidate = json.loads(args.candidate.read_text(encoding="utf-8"))
+    rows = compare_reports(baseline, candidate)
+
+    print(
+        f"baseline {baseline['environment'].get('commit')} -> "
+        f"candidate {candidate['environment'].get('commit')}"
+    )
+    for row in rows:
+        print(
+            f"{row['name']:<40} {row['metric']:<8} "
+            f"{row['baseline']:>12.3f} -> {row['candidate']:>12.3f}  {row['change_percent']:+7.1f}%"
+        )
+
+    if args.threshold is not None:
+        regressions = find_regressions(rows, args.threshold)
+        for row in regressions:
+            print(f"❌ Regression: {row['name']} {row['metric']} {row['change_percent']:+.1f}%")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
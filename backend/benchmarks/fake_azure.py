@@ -0,0 +1,389 @@
+"""
+Faux service Azure OpenAI / OpenAI
+Chat completions (Azure et OpenAI) et transcription audio, avec latence,
+débit de tokens, erreurs 429 et streaming configurables
+
+Utilisable en mémoire (make_fake_azure_client) ou comme serveur HTTP local :
+    python -m benchmarks.fake_azure --port 8081 --latency-ms 200 --throttle-rate 0.05
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import random
+import re
+import socket
+import threading
+import time
+import uuid
+import wave
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+import httpx
+from fastapi import FastAPI, File, Form, Request, UploadFile
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from openai import AsyncAzureOpenAI
+from app.config import settings
+
+# Résumé structuré renvoyé par le faux GPT-4 (sections attendues par le parseur)
+FAKE_SUMMARY = """## Résumé
+Réunion de suivi du projet : avancement du backend et planification de la démo.
+
+## Points Clés
+- Le backend de transcription est stable
+- Les temps de réponse doivent être mesurés à chaque commit
+
+## Décisions
+- Adopter la suite de benchmarks avant chaque mise en production
+
+## Actions
+- Alice : préparer la démo pour vendredi
+- Bob : comparer les résultats de benchmark entre deux versions
+"""
+
+# Phrase répétée par la fausse transcription (environ 2,5 mots par seconde d'audio)
+FAKE_TRANSCRIPT_SENTENCE = "Bonjour à tous, nous commençons la réunion de suivi du projet."
+FAKE_SEGMENT_SECONDS = 5.0
+
+
+@dataclass
+class FakeAzureConfig:
+    """Comportement du faux service"""
+    latency_ms: float = 50.0  # Délai avant la réponse (ou le premier token en streaming)
+    tokens_per_second: float = 0.0  # Débit de génération (0 = instantané)
+    transcription_speed: float = 0.0  # Secondes d'audio traitées par seconde (0 = instantané)
+    throttle_rate: float = 0.0  # Proportion de requêtes rejetées en 429
+    max_concurrent_requests: int = 0  # Au-delà, 429 (0 = illimité)
+    retry_after_ms: int = 100  # En-tête retry-after-ms des 429
+    seed: int = 0
+
+
+def estimate_completion_tokens(content: str) -> int:
+    """Approximation utilisée pour l'usage et le débit (4 caractères par token)"""
+    return max(1, len(content) // 4)
+
+
+def chat_completion_payload(
+    request_body: Dict[str, Any], content: str = FAKE_SUMMARY
+) -> Dict[str, Any]:
+    """Réponse chat completion au format de l'API OpenAI"""
+    prompt_tokens = (
+        sum(len(message.get("content", "")) for message in request_body.get("messages", [])) // 4
+    )
+    completion_tokens = estimate_completion_tokens(content)
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request_body.get("model", "gpt-4"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop"
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+    }
+
+
+def transcription_payload(duration: float, language: Optional[str]) -> Dict[str, Any]:
+    """Réponse verbose_json de l'API de transcription"""
+    segments = []
+    start = 0.0
+    while start < duration:
+        end = min(start + FAKE_SEGMENT_SECONDS, duration)
+        segments.append({
+            "id": len(segments),
+            "start": round(start, 2),
+            "end": round(end, 2),
+            "text": f" {FAKE_TRANSCRIPT_SENTENCE}"
+        })
+        start = end
+    return {
+        "task": "transcribe",
+        "language": language or "fr",
+        "duration": round(duration, 2),
+        "text": "".join(segment["text"] for segment in segments).strip(),
+        "segments": segments
+    }
+
+
+def audio_duration(content: bytes) -> float:
+    """Durée d'un WAV d'après son en-tête ; sinon estimation à 128 kbit/s"""
+    try:
+        with wave.open(io.BytesIO(content), "rb") as wav:
+            return wav.getnframes() / wav.getframerate()
+    except (wave.Error, EOFError):
+        return len(content) / 16000
+
+
+def collapse_slashes(app: Callable) -> Callable:
+    """Tolère les chemins en « //openai/... » (endpoint configuré avec une barre finale)"""
+    async def asgi(scope, receive, send):
+        if scope["type"] == "http":
+            scope = {**scope, "path": re.sub(r"/{2,}", "/", scope["path"])}
+        await app(scope, receive, send)
+    return asgi
+
+
+class FakeAzureOpenAI:
+    """
+    Application ASGI imitant Azure OpenAI et l'API OpenAI
+
+    Routes servies :
+    - POST /openai/deployments/{deployment}/chat/completions (Azure)
+    - POST /v1/chat/completions (OpenAI)
+    - POST /v1/audio/transcriptions et /openai/deployments/{deployment}/audio/transcriptions
+    - GET /openai/models et /v1/models (sonde de santé)
+    - GET /fake/stats : compteurs du faux service
+    """
+
+    def __init__(self, config: Optional[FakeAzureConfig] = None):
+        self.config = config or FakeAzureConfig()
+        self._random = random.Random(self.config.seed)
+        self.requests = 0
+        self.throttled = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.app = collapse_slashes(self._build_app())
+
+    def stats(self) -> Dict[str, Any]:
+        """Compteurs depuis le démarrage"""
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "config": asdict(self.config)
+        }
+
+    def _admit(self) -> Optional[JSONResponse]:
+        """Compte la requête ; retourne une réponse 429 si elle est rejetée"""
+        self.requests += 1
+        over_capacity = (
+            self.config.max_concurrent_requests
+            and self.in_flight >= self.config.max_concurrent_requests
+        )
+        if over_capacity or self._random.random() < self.config.throttle_rate:
+            self.throttled += 1
+            return JSONResponse(
+                status_code=429,
+                content={"error": {
+                    "code": "429",
+                    "message": "Requests to the deployment have exceeded the rate limit."
+                }},
+                headers={
+                    "retry-after-ms": str(self.config.retry_after_ms),
+                    "retry-after": str(max(1, round(self.config.retry_after_ms / 1000)))
+                }
+            )
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return None
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+
+    def _generation_seconds(self, content: str) -> float:
+        if not self.config.tokens_per_second:
+            return 0.0
+        return estimate_completion_tokens(content) / self.config.tokens_per_second
+
+    async def _chat_completion(self, request: Request) -> Any:
+        body = await request.json()
+        rejected = self._admit()
+        if rejected is not None:
+            return rejected
+
+        if body.get("stream"):
+            # Le créneau est libéré à la fin du flux
+            return StreamingResponse(self._stream_chat(body), media_type="text/event-stream")
+
+        try:
+            await asyncio.sleep(
+                self.config.latency_ms / 1000 + self._generation_seconds(FAKE_SUMMARY)
+            )
+            return chat_completion_payload(body)
+        finally:
+            self._release()
+
+    async def _stream_chat(self, body: Dict[str, Any]) -> AsyncIterator[str]:
+        """Flux SSE : un chunk par mot, au rythme de tokens_per_second"""
+        try:
+            await asyncio.sleep(self.config.latency_ms / 1000)
+            completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+            words = FAKE_SUMMARY.split(" ")
+
+            for index, word in enumerate(words):
+                piece = word if index == 0 else f" {word}"
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": body.get("model", "gpt-4"),
+                    "choices": [
+                        {
+                            "index": 0,
+                            "delta": {"role": "assistant", "content": piece}
+                            if index == 0
+                            else {"content": piece},
+                            "finish_reason": None,
+                        }
+                    ],
+                }
+                yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                await asyncio.sleep(self._generation_seconds(piece))
+
+            chunk["choices"] = [{"index": 0, "delta": {}, "finish_reason": "stop"}]
+            yield f"data: {json.dumps(chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+        finally:
+            self._release()
+
+    async def _transcription(
+        self,
+        file: UploadFile,
+        language: Optional[str],
+        response_format: str
+    ) -> Any:
+        rejected = self._admit()
+        if rejected is not None:
+            return rejected
+
+        try:
+            duration = audio_duration(await file.read())
+            delay = self.config.latency_ms / 1000
+            if self.config.transcription_speed:
+                delay += duration / self.config.transcription_speed
+            await asyncio.sleep(delay)
+
+            payload = transcription_payload(duration, language)
+            if response_format == "text":
+                return PlainTextResponse(payload["text"])
+            if response_format == "verbose_json":
+                return payload
+            return {"text": payload["text"]}
+        finally:
+            self._release()
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI(title="Fake Azure OpenAI", docs_url=None, redoc_url=None)
+
+        @app.post("/openai/deployments/{deployment}/chat/completions")
+        @app.post("/v1/chat/completions")
+        async def chat_completions(request: Request):
+            return await self._chat_completion(request)
+
+        @app.post("/openai/deployments/{deployment}/audio/transcriptions")
+        @app.post("/v1/audio/transcriptions")
+        async def audio_transcriptions(
+            file: UploadFile = File(...),
+            model: str = Form(default="whisper-1"),
+            language: Optional[str] = Form(default=None),
+            response_format: str = Form(default="json")
+        ):
+            return await self._transcription(file, language, response_format)
+
+        @app.get("/openai/models")
+        @app.get("/v1/models")
+        async def list_models():
+            return {
+                "object": "list",
+                "data": [
+                    {
+                        "id": settings.AZURE_GPT4_DEPLOYMENT_NAME,
+                        "object": "model",
+                        "created": 0,
+                        "owned_by": "fake",
+                    },
+                    {"id": "whisper-1", "object": "model", "created": 0, "owned_by": "fake"},
+                ],
+            }
+
+        @app.get("/fake/stats")
+        async def fake_stats():
+            return self.stats()
+
+        return app
+
+
+def make_fake_azure_client(fake: FakeAzureOpenAI) -> AsyncAzureOpenAI:
+    """Client Azure OpenAI branché en mémoire sur le faux service (sans socket)"""
+    return AsyncAzureOpenAI(
+        api_key="benchmark",
+        api_version=settings.AZURE_OPENAI_API_VERSION,
+        azure_endpoint="https://benchmark.openai.azure.com/",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=fake.app)),
+        max_retries=0
+    )
+
+
+def free_port() -> int:
+    """Port TCP libre sur l'interface locale"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def serve_fake_azure(fake: FakeAzureOpenAI, port: Optional[int] = None) -> Iterator[str]:
+    """
+    Sert le faux service en HTTP dans un thread
+
+    Yields:
+        URL de base (http://127.0.0.1:port)
+    """
+    import uvicorn
+
+    port = port or free_port()
+    server = uvicorn.Server(uvicorn.Config(
+        fake.app, host="127.0.0.1", port=port, log_level="warning", access_log=False
+    ))
+    thread = threading.Thread(target=server.run, name="fake-azure", daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise RuntimeError(f"Fake Azure OpenAI server failed to start on port {port}")
+        time.sleep(0.01)
+
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Faux service Azure OpenAI / OpenAI")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=FakeAzureConfig.latency_ms)
+    parser.add_argument(
+        "--tokens-per-second", type=float, default=FakeAzureConfig.tokens_per_second
+    )
+    parser.add_argument(
+        "--transcription-speed", type=float, default=FakeAzureConfig.transcription_speed
+    )
+    parser.add_argument("--throttle-rate", type=float, default=FakeAzureConfig.throttle_rate)
+    parser.add_argument(
+        "--max-concurrent-requests", type=int, default=FakeAzureConfig.max_concurrent_requests
+    )
+    parser.add_argument("--retry-after-ms", type=int, default=FakeAzureConfig.retry_after_ms)
+    parser.add_argument("--seed", type=int, default=FakeAzureConfig.seed)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    config = FakeAzureConfig(**{key: value for key, value in vars(args).items() if key != "port"})
+    uvicorn.run(FakeAzureOpenAI(config).app, host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
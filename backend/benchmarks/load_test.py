@@ -0,0 +1,344 @@
+"""
+Test de charge de l'API complète
+Lance le faux Azure OpenAI et l'application (uvicorn), puis envoie des requêtes
+à plusieurs niveaux de concurrence : latences p50/p95/p99, débit et taux d'erreur
+
+Usage (depuis backend/) :
+    python -m benchmarks.load_test --concurrency 1 4 16 --requests 100 --output load.json
+    python -m benchmarks.load_test --scenario summary --throttle-rate 0.1 --tokens-per-second 400
+    python -m benchmarks.load_test --target http://127.0.0.1:8000  # API déjà démarrée
+
+La transcription passe par l'API OpenAI (USE_OPENAI_WHISPER) servie par le faux
+service : le chemin HTTP réel (client openai, pool httpx, retries) est exercé
+sans modèle Whisper local.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import httpx
+
+# Configuration minimale avant l'import de l'application (le faux service lit settings) :
+# les imports suivants viennent donc après (E402)
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://benchmark.openai.azure.com/")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from benchmarks.fake_azure import (  # noqa: E402
+    FakeAzureConfig, FakeAzureOpenAI, free_port, serve_fake_azure
+)
+from benchmarks.report import environment_info, latency_stats  # noqa: E402
+from benchmarks.run import synthetic_transcription  # noqa: E402
+from benchmarks.synthetic_audio import generate_speech_like, encode_audio  # noqa: E402
+
+logger = logging.getLogger("benchmarks")
+
+SCENARIOS = ("summary", "transcription", "job")
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Intervalle de consultation d'un job asynchrone
+JOB_POLL_INTERVAL_SECONDS = 0.1
+
+
+@dataclass
+class Outcome:
+    """Résultat d'une requête : code HTTP ou nom de l'exception réseau"""
+    latency: float
+    status: str
+
+    @property
+    def ok(self) -> bool:
+        return self.status.startswith("2")
+
+
+@dataclass
+class Payloads:
+    """Corps de requête partagés par tous les appels d'un scénario"""
+    audio: bytes = b""
+    transcription_text: str = ""
+    language: str = "fr"
+    summary_type: str = "structured"
+
+
+async def _summary(client: httpx.AsyncClient, payloads: Payloads, index: int) -> httpx.Response:
+    # Texte unique par requête : le cache des résumés ne fausse pas la mesure
+    return await client.post("/api/v1/summary/generate", json={
+        "transcription_text": f"{payloads.transcription_text} (requête {index})",
+        "summary_type": payloads.summary_type,
+        "language": payloads.language
+    })
+
+
+async def _transcription(
+    client: httpx.AsyncClient, payloads: Payloads, index: int
+) -> httpx.Response:
+    return await client.post(
+        "/api/v1/transcription/upload",
+        files={"file": (f"load-{index}.wav", payloads.audio, "audio/wav")},
+        data={"language": payloads.language}
+    )
+
+
+async def _job(client: httpx.AsyncClient, payloads: Payloads, index: int) -> httpx.Response:
+    """Création du job puis attente de son résultat (latence de bout en bout)"""
+    response = await client.post(
+        "/api/v1/transcription/jobs",
+        files={"file": (f"load-{index}.wav", payloads.audio, "audio/wav")},
+        data={"language": payloads.language}
+    )
+    if response.status_code != 202:
+        return response
+
+    job_url = f"/api/v1/transcription/jobs/{response.json()['id']}"
+    while True:
+        await asyncio.sleep(JOB_POLL_INTERVAL_SECONDS)
+        response = await client.get(job_url)
+        if response.status_code != 200:
+            return response
+        status = response.json()["status"]
+        if status == "completed":
+            return response
+        if status == "failed":
+            # Échec du job : compté comme une erreur serveur
+            return httpx.Response(500, request=response.request)
+
+
+SCENARIO_REQUESTS: Dict[str, Callable] = {
+    "summary": _summary,
+    "transcription": _transcription,
+    "job": _job,
+}
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    scenario: str,
+    payloads: Payloads,
+    concurrency: int,
+    requests: int
+) -> Dict[str, Any]:
+    """
+    Charge en boucle fermée : `concurrency` clients enchaînent les requêtes
+
+    Returns:
+        Latences, débit et répartition des statuts pour ce niveau
+    """
+    send = SCENARIO_REQUESTS[scenario]
+    outcomes: List[Outcome] = []
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        for index in counter:
+            start = time.perf_counter()
+            try:
+                response = await send(client, payloads, index)
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = e.__class__.__name__
+            outcomes.append(Outcome(time.perf_counter() - start, status))
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+
+    succeeded = [outcome.latency for outcome in outcomes if outcome.ok]
+    errors = len(outcomes) - len(succeeded)
+    return {
+        "name": f"load/{scenario}/c{concurrency}",
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "requests": len(outcomes),
+        "errors": errors,
+        "error_rate": round(errors / len(outcomes), 4) if outcomes else 0.0,
+        "status_counts": dict(Counter(outcome.status for outcome in outcomes)),
+        "latency_ms": latency_stats(succeeded) if succeeded else None,
+        "throughput": {
+            "requests_per_s": round(len(outcomes) / wall, 3),
+            "successes_per_s": round(len(succeeded) / wall, 3),
+        },
+    }
+
+
+def app_environment(azure_url: str, temp_folder: str) -> Dict[str, str]:
+    """Variables d'environnement de l'API : tous les appels externes vers le faux service"""
+    return {
+        **os.environ,
+        "AZURE_OPENAI_ENDPOINT": f"{azure_url}/",
+        "AZURE_OPENAI_API_KEY": "load-test",
+        "OPENAI_API_KEY": "load-test",
+        "OPENAI_BASE_URL": f"{azure_url}/v1",
+        "USE_OPENAI_WHISPER": "true",
+        "USE_LOCAL_WHISPER": "false",
+        "SUMMARY_CACHE_ENABLED": "false",
+        "TRANSCRIPTION_CACHE_ENABLED": "false",
+        "TEMP_FOLDER": temp_folder,
+    }
+
+
+@contextmanager
+def serve_app(azure_url: str, port: Optional[int] = None, show_logs: bool = False) -> Iterator[str]:
+    """
+    Démarre l'API dans un processus uvicorn séparé (journaux masqués par défaut)
+
+    Yields:
+        URL de base de l'API
+    """
+    port = port or free_port()
+    base_url = f"http://127.0.0.1:{port}"
+
+    with tempfile.TemporaryDirectory(prefix="whispen-load-") as temp_folder:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app",
+             "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+            cwd=BACKEND_DIR,
+            env=app_environment(azure_url, temp_folder),
+            stdout=None if show_logs else subprocess.DEVNULL,
+            stderr=None if show_logs else subprocess.DEVNULL
+        )
+        try:
+            deadline = time.monotonic() + 60
+            while True:
+                if process.poll() is not None:
+                    raise RuntimeError(f"API exited during startup (code {process.returncode})")
+                try:
+                    if httpx.get(f"{base_url}/health/live", timeout=1).status_code == 200:
+                        break
+                except httpx.HTTPError:
+                    pass
+                if time.monotonic() > deadline:
+                    raise RuntimeError("API did not become live within 60s")
+                time.sleep(0.2)
+
+            yield base_url
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+async def run_load_test(
+    args: argparse.Namespace, base_url: str, fake: Optional[FakeAzureOpenAI]
+) -> Dict[str, Any]:
+    """Exécute chaque scénario à chaque niveau de concurrence"""
+    payloads = Payloads(
+        audio=encode_audio(generate_speech_like(args.audio_seconds, seed=args.seed), "wav"),
+        transcription_text=synthetic_transcription(args.summary_words, args.seed),
+        language=args.language
+    )
+    report = {"environment": environment_info(args), "target": base_url, "results": []}
+
+    limits = httpx.Limits(
+        max_connections=max(args.concurrency), max_keepalive_connections=max(args.concurrency)
+    )
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        for scenario in args.scenario:
+            for concurrency in args.concurrency:
+                upstream_before = None
+                if fake:
+                    fake.peak_in_flight = fake.in_flight
+                    upstream_before = fake.stats()
+                result = await run_level(client, scenario, payloads, concurrency, args.requests)
+                if fake:
+                    upstream = fake.stats()
+                    result["upstream"] = {
+                        "requests": upstream["requests"] - upstream_before["requests"],
+                        "throttled": upstream["throttled"] - upstream_before["throttled"],
+                        "peak_in_flight": upstream["peak_in_flight"],
+                    }
+                report["results"].append(result)
+
+                latency = result["latency_ms"] or {}
+                logger.info(
+                    f"🚦 {result['name']}: p50 {latency.get('p50')} ms, "
+                    f"p95 {latency.get('p95')} ms, "
+                    f"{result['throughput']['requests_per_s']} req/s, "
+                    f"errors {result['error_rate']:.1%}"
+                )
+
+    return report
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Test de charge de l'API Whispen")
+    parser.add_argument(
+        "--scenario", nargs="+", choices=SCENARIOS, default=["summary", "transcription"]
+    )
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4, 16])
+    parser.add_argument(
+        "--requests", type=int, default=100, help="Requêtes par niveau de concurrence"
+    )
+    parser.add_argument("--timeout", type=float, default=120.0, help="Timeout client (s)")
+    parser.add_argument("--target", help="URL d'une API déjà démarrée (sinon lancée localement)")
+    parser.add_argument("--audio-seconds", type=float, default=30.0)
+    parser.add_argument("--summary-words", type=int, default=1500)
+    parser.add_argument("--language", default="fr")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--app-logs", action="store_true", help="Affiche les journaux de l'API lancée"
+    )
+    # Comportement du faux Azure OpenAI
+    parser.add_argument("--latency-ms", type=float, default=FakeAzureConfig.latency_ms)
+    parser.add_argument(
+        "--tokens-per-second", type=float, default=FakeAzureConfig.tokens_per_second
+    )
+    parser.add_argument(
+        "--transcription-speed", type=float, default=FakeAzureConfig.transcription_speed
+    )
+    parser.add_argument("--throttle-rate", type=float, default=FakeAzureConfig.throttle_rate)
+    parser.add_argument(
+        "--max-concurrent-requests", type=int, default=FakeAzureConfig.max_concurrent_requests
+    )
+    parser.add_argument("--retry-after-ms", type=int, default=FakeAzureConfig.retry_after_ms)
+    parser.add_argument("--output", help="Fichier JSON de sortie (défaut : sortie standard)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+
+    with ExitStack() as stack:
+        fake = None
+        base_url = args.target
+        if base_url is None:
+            fake = FakeAzureOpenAI(FakeAzureConfig(
+                latency_ms=args.latency_ms,
+                tokens_per_second=args.tokens_per_second,
+                transcription_speed=args.transcription_speed,
+                throttle_rate=args.throttle_rate,
+                max_concurrent_requests=args.max_concurrent_requests,
+                retry_after_ms=args.retry_after_ms,
+                seed=args.seed
+            ))
+            azure_url = stack.enter_context(serve_fake_azure(fake))
+            base_url = stack.enter_context(serve_app(azure_url, show_logs=args.app_logs))
+            logger.info(f"🧪 Fake Azure OpenAI on {azure_url}, API on {base_url}")
+
+        report = asyncio.run(run_load_test(args, base_url, fake))
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+        logger.info(f"✅ Results written to {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
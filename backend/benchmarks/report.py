@@ -0,0 +1,70 @@
+"""
+Éléments communs des rapports de benchmark
+Statistiques de latence, pic mémoire et contexte d'exécution
+"""
+
+import argparse
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def latency_stats(latencies: List[float]) -> Dict[str, float]:
+    """Statistiques de latence en millisecondes"""
+    values = np.asarray(latencies) * 1000
+    return {
+        "p50": round(float(np.percentile(values, 50)), 3),
+        "p95": round(float(np.percentile(values, 95)), 3),
+        "p99": round(float(np.percentile(values, 99)), 3),
+        "mean": round(float(values.mean()), 3),
+        "min": round(float(values.min()), 3),
+        "max": round(float(values.max()), 3),
+    }
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Pic de mémoire résidente du processus depuis son démarrage (Mo)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Octets sur macOS, kilo-octets sur Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def environment_info(args: argparse.Namespace) -> Dict[str, Any]:
+    """Contexte de la mesure : commit, machine, versions, paramètres"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    try:
+        import faster_whisper
+        faster_whisper_version = faster_whisper.__version__
+    except ImportError:
+        faster_whisper_version = None
+
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "faster_whisper": faster_whisper_version,
+        "parameters": {key: value for key, value in vars(args).items() if key != "output"},
+    }
@@ -0,0 +1,371 @@
+"""
+Suite de benchmarks des chemins critiques
+Upload, transcription Whisper locale et résumé GPT (faux Azure en mémoire)
+
+Usage (depuis backend/) :
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --suite upload summary --iterations 20
+    python -m benchmarks.run --suite transcription --models tiny base --durations 30 120
+
+Le résultat est un document JSON (voir benchmarks.compare pour comparer deux commits).
+Aucun appel réseau : seuls les modèles Whisper doivent être présents dans le
+cache Hugging Face (ou passés par chemin local à --models).
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+# Configuration minimale avant l'import de l'application (aucun service réel n'est appelé) :
+# les imports suivants viennent donc après (E402)
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://benchmark.openai.azure.com/")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("TEMP_FOLDER", os.path.join(tempfile.gettempdir(), "whispen-benchmarks"))
+# Modèles Whisper lus uniquement depuis le cache local
+os.environ.setdefault("HF_HUB_OFFLINE", "1")
+
+from fastapi import UploadFile  # noqa: E402
+from starlette.datastructures import Headers  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.services.audio_preprocessor import AudioPreprocessor  # noqa: E402
+from app.services.azure_service import AzureOpenAIService  # noqa: E402
+from app.utils.file_handler import FileHandler  # noqa: E402
+from benchmarks.fake_azure import (  # noqa: E402
+    FakeAzureConfig, FakeAzureOpenAI, make_fake_azure_client
+)
+from benchmarks.report import environment_info, latency_stats, peak_rss_mb  # noqa: E402
+from benchmarks.synthetic_audio import (  # noqa: E402
+    AUDIO_FORMATS, generate_speech_like, encode_audio
+)
+
+logger = logging.getLogger("benchmarks")
+
+SUITES = ("upload", "transcription", "summary")
+
+# Vocabulaire des transcriptions synthétiques à résumer
+WORDS = (
+    "le projet avance bien nous devons finaliser la démo pour vendredi "
+    "alice prépare les slides bob mesure les performances du backend "
+    "la transcription est plus rapide depuis la dernière version il reste "
+    "à valider le résumé automatique avec le client avant la mise en production"
+).split()
+
+CONTENT_TYPES = {"wav": "audio/wav", "mp3": "audio/mpeg", "flac": "audio/flac"}
+
+
+async def measure(
+    operation: Callable[[int], Awaitable[Any]],
+    iterations: int,
+    warmup: int = 0,
+    concurrency: int = 1
+) -> Dict[str, Any]:
+    """
+    Exécute une opération et mesure chaque appel
+
+    Args:
+        operation: Coroutine appelée avec le numéro d'itération
+        iterations: Appels mesurés
+        warmup: Appels préalables non mesurés
+        concurrency: Appels simultanés maximum
+
+    Returns:
+        Latences (s), durée totale (s) et valeurs renvoyées
+    """
+    for index in range(warmup):
+        await operation(-1 - index)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = [0.0] * iterations
+    results: List[Any] = [None] * iterations
+
+    async def timed(index: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            results[index] = await operation(index)
+            latencies[index] = time.perf_counter() - start
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(timed(index) for index in range(iterations)))
+    return {"latencies": latencies, "wall": time.perf_counter() - wall_start, "results": results}
+
+
+@contextmanager
+def override_settings(**values: Any) -> Iterator[None]:
+    """Modifie temporairement la configuration globale"""
+    previous = {key: getattr(settings, key) for key in values}
+    for key, value in values.items():
+        setattr(settings, key, value)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            setattr(settings, key, value)
+
+
+def make_upload(content: bytes, audio_format: str) -> UploadFile:
+    """UploadFile équivalent à celui construit par FastAPI"""
+    return UploadFile(
+        file=io.BytesIO(content),
+        filename=f"benchmark.{audio_format}",
+        headers=Headers({"content-type": CONTENT_TYPES[audio_format]})
+    )
+
+
+async def bench_upload(
+    args: argparse.Namespace,
+    file_handler: FileHandler,
+    samples: Dict[tuple, bytes]
+) -> List[Dict[str, Any]]:
+    """FileHandler.save_upload_file : validation, hash et écriture disque"""
+    results = []
+    for (audio_format, duration), content in samples.items():
+        async def upload(_: int) -> None:
+            file_path, _ = await file_handler.save_upload_file(make_upload(content, audio_format))
+            await file_handler.delete_file(file_path)
+
+        run = await measure(upload, args.iterations, args.warmup)
+        size_mb = len(content) / (1024 * 1024)
+        results.append({
+            "name": f"upload/{audio_format}/{duration}s",
+            "suite": "upload",
+            "format": audio_format,
+            "audio_seconds": duration,
+            "file_mb": round(size_mb, 3),
+            "iterations": args.iterations,
+            "latency_ms": latency_stats(run["latencies"]),
+            "throughput": {
+                "files_per_s": round(args.iterations / run["wall"], 3),
+                "mb_per_s": round(size_mb * args.iterations / run["wall"], 3),
+            },
+            "peak_rss_mb": peak_rss_mb(),
+        })
+        logger.info(f"📤 {results[-1]['name']}: p50 {results[-1]['latency_ms']['p50']} ms")
+    return results
+
+
+async def bench_transcription(
+    args: argparse.Namespace,
+    file_handler: FileHandler,
+    samples: Dict[tuple, bytes]
+) -> List[Dict[str, Any]]:
+    """AzureOpenAIService.transcribe_audio avec Whisper local, décodage compris"""
+    results = []
+    # Routage désactivé : chaque modèle est mesuré seul
+    with override_settings(
+        USE_LOCAL_WHISPER=True, USE_OPENAI_WHISPER=False, WHISPER_MODEL_ROUTING=""
+    ):
+        for model_size in args.models:
+            with override_settings(WHISPER_MODEL_SIZE=model_size):
+                results += await _bench_transcription_model(args, model_size, file_handler, samples)
+    return results
+
+
+async def _bench_transcription_model(
+    args: argparse.Namespace,
+    model_size: str,
+    file_handler: FileHandler,
+    samples: Dict[tuple, bytes]
+) -> List[Dict[str, Any]]:
+    """Mesures d'un modèle Whisper (chargé, mesuré puis libéré)"""
+    results = []
+    service = AzureOpenAIService()
+    load_start = time.perf_counter()
+    await service.load_models()
+    load_seconds = time.perf_counter() - load_start
+
+    if service.model_status != "ready":
+        # Modèle absent du cache local : pas de téléchargement pendant la mesure
+        logger.warning(f"⚠️ Model '{model_size}' skipped: {service.model_error}")
+        results.append({
+            "name": f"transcription/{model_size}",
+            "suite": "transcription",
+            "model": model_size,
+            "skipped": service.model_error,
+        })
+        await service.aclose()
+        return results
+
+    for (audio_format, duration), content in samples.items():
+        file_path, _ = await file_handler.save_upload_file(make_upload(content, audio_format))
+        sidecar = AudioPreprocessor.sidecar_path(file_path)
+
+        async def transcribe(_: int) -> Dict[str, Any]:
+            # Décodage à chaque itération, comme pour un nouvel upload
+            sidecar.unlink(missing_ok=True)
+            return await service.transcribe_audio(file_path, language=args.language)
+
+        try:
+            run = await measure(transcribe, args.iterations, args.warmup)
+        finally:
+            await file_handler.delete_file(file_path)
+
+        rtf = [latency / duration for latency in run["latencies"]]
+        results.append({
+            "name": f"transcription/{model_size}/{audio_format}/{duration}s",
+            "suite": "transcription",
+            "model": model_size,
+            "format": audio_format,
+            "audio_seconds": duration,
+            "iterations": args.iterations,
+            "model_load_seconds": round(load_seconds, 3),
+            "replicas": len(service.model_pool),
+            "latency_ms": latency_stats(run["latencies"]),
+            "rtf": {
+                "p50": round(float(np.percentile(rtf, 50)), 4),
+                "p95": round(float(np.percentile(rtf, 95)), 4),
+            },
+            "throughput": {
+                "audio_seconds_per_s": round(duration * args.iterations / run["wall"], 3),
+            },
+            "word_count": run["results"][-1]["word_count"],
+            "peak_rss_mb": peak_rss_mb(),
+        })
+        logger.info(f"🎤 {results[-1]['name']}: RTF p50 {results[-1]['rtf']['p50']}")
+
+    service.whisper_model = None
+    await service.aclose()
+
+    return results
+
+
+def synthetic_transcription(words: int, seed: int) -> str:
+    """Texte de réunion synthétique (phrases de 8 à 20 mots)"""
+    rng = np.random.default_rng(seed)
+    sentences = []
+    remaining = words
+    while remaining > 0:
+        length = min(remaining, int(rng.integers(8, 21)))
+        sentence = " ".join(WORDS[index] for index in rng.integers(len(WORDS), size=length))
+        sentences.append(sentence.capitalize() + ".")
+        remaining -= length
+    return " ".join(sentences)
+
+
+async def bench_summary(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """AzureOpenAIService.generate_summary contre le faux Azure (cache désactivé)"""
+    with override_settings(SUMMARY_CACHE_ENABLED=False):
+        return await _bench_summary(args)
+
+
+async def _bench_summary(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Mesures des résumés pour chaque longueur de transcription"""
+    fake = FakeAzureOpenAI(FakeAzureConfig(latency_ms=args.fake_latency_ms))
+    service = AzureOpenAIService()
+    await service.azure_client.close()
+    service.azure_client = make_fake_azure_client(fake)
+    results = []
+
+    try:
+        for words in args.summary_words:
+            text = synthetic_transcription(words, args.seed)
+
+            async def summarize(_: int) -> Dict[str, Any]:
+                return await service.generate_summary(text, "structured", args.language)
+
+            requests_before = fake.requests
+            run = await measure(
+                summarize, args.iterations, args.warmup, concurrency=args.concurrency
+            )
+            results.append({
+                "name": f"summary/{words}w/c{args.concurrency}",
+                "suite": "summary",
+                "words": words,
+                "concurrency": args.concurrency,
+                "fake_latency_ms": args.fake_latency_ms,
+                "iterations": args.iterations,
+                "azure_calls_per_summary": round(
+                    (fake.requests - requests_before) / (args.iterations + args.warmup), 2
+                ),
+                "latency_ms": latency_stats(run["latencies"]),
+                "throughput": {
+                    "summaries_per_s": round(args.iterations / run["wall"], 3),
+                },
+                "peak_rss_mb": peak_rss_mb(),
+            })
+            logger.info(f"📝 {results[-1]['name']}: p50 {results[-1]['latency_ms']['p50']} ms")
+    finally:
+        await service.azure_client.close()
+        await service.aclose()
+
+    return results
+
+
+async def run_benchmarks(args: argparse.Namespace) -> Dict[str, Any]:
+    """Exécute les suites demandées et retourne le rapport JSON"""
+    report = {"environment": environment_info(args), "results": []}
+
+    samples: Dict[tuple, bytes] = {}
+    if {"upload", "transcription"} & set(args.suite):
+        for duration in args.durations:
+            audio = generate_speech_like(duration, seed=args.seed)
+            for audio_format in args.formats:
+                samples[(audio_format, duration)] = encode_audio(audio, audio_format)
+
+    file_handler = FileHandler()
+    if "upload" in args.suite:
+        report["results"] += await bench_upload(args, file_handler, samples)
+    if "summary" in args.suite:
+        report["results"] += await bench_summary(args)
+    # En dernier : le chargement des modèles domine le pic mémoire
+    if "transcription" in args.suite:
+        report["results"] += await bench_transcription(args, file_handler, samples)
+
+    report["environment"]["peak_rss_mb"] = peak_rss_mb()
+    return report
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarks Whispen (hors ligne)")
+    parser.add_argument("--suite", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--models", nargs="+", default=["tiny", "base"],
+                        help="Tailles ou chemins locaux des modèles Whisper")
+    parser.add_argument("--durations", nargs="+", type=int, default=[10, 60],
+                        help="Durées de l'audio synthétique (s)")
+    parser.add_argument(
+        "--formats", nargs="+", choices=sorted(AUDIO_FORMATS), default=["wav", "mp3"]
+    )
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1, help="Itérations non mesurées")
+    parser.add_argument("--language", default="fr")
+    parser.add_argument(
+        "--summary-words",
+        nargs="+",
+        type=int,
+        default=[1500, 12000],
+        help="Longueurs des transcriptions à résumer (la plus longue passe en map-reduce)",
+    )
+    parser.add_argument("--fake-latency-ms", type=float, default=50.0,
+                        help="Latence simulée de chaque appel Azure")
+    parser.add_argument("--concurrency", type=int, default=4, help="Résumés simultanés")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Fichier JSON de sortie (défaut : sortie standard)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+
+    report = asyncio.run(run_benchmarks(args))
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+        logger.info(f"✅ Results written to {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Génération d'audio synthétique proche de la parole
+Signal déterministe (graine fixe) encodé en WAV, MP3 ou FLAC
+"""
+
+import io
+import wave
+import numpy as np
+from typing import Dict, Tuple
+
+SAMPLING_RATE = 16000
+
+# Formants (F1, F2) de quelques voyelles, en Hz
+VOWEL_FORMANTS = [(730, 1090), (270, 2290), (300, 870), (530, 1840), (640, 1190)]
+
+# Nombre d'harmoniques de la fréquence fondamentale
+HARMONICS = 24
+
+# Format -> (codec PyAV, conteneur) ; WAV est écrit sans dépendance
+AUDIO_FORMATS: Dict[str, Tuple[str, str]] = {
+    "wav": ("pcm_s16le", "wav"),
+    "mp3": ("libmp3lame", "mp3"),
+    "flac": ("flac", "flac"),
+}
+
+
+def _syllable(rng: np.random.Generator, length: int, sample_rate: int) -> np.ndarray:
+    """Syllabe voisée : harmoniques filtrées par deux formants, hauteur glissante"""
+    t = np.arange(length) / sample_rate
+    f0_start, f0_end = rng.uniform(100, 220, size=2)
+    f0 = np.linspace(f0_start, f0_end, length)
+    phase = 2 * np.pi * np.cumsum(f0) / sample_rate
+    f1, f2 = VOWEL_FORMANTS[rng.integers(len(VOWEL_FORMANTS))]
+
+    signal = np.zeros(length)
+    for harmonic in range(1, HARMONICS + 1):
+        frequency = harmonic * f0.mean()
+        if frequency >= sample_rate / 2:
+            break
+        gain = np.exp(-((frequency - f1) / 120) ** 2) + 0.6 * np.exp(-((frequency - f2) / 180) ** 2)
+        signal += (gain + 0.02) / harmonic * np.sin(harmonic * phase)
+
+    # Attaque et chute douces, léger vibrato d'amplitude
+    envelope = np.sin(np.pi * np.linspace(0, 1, length)) ** 0.6
+    envelope *= 1 + 0.1 * np.sin(2 * np.pi * 5 * t)
+    return signal * envelope
+
+
+def generate_speech_like(
+    duration: float, sample_rate: int = SAMPLING_RATE, seed: int = 0
+) -> np.ndarray:
+    """
+    Génère un signal mono float32 imitant la parole
+
+    Syllabes de 120 à 300 ms groupées en mots, courtes pauses entre les mots
+    et pauses plus longues (0,5 à 1,2 s) entre les phrases, sur un bruit de fond
+    faible : la VAD et le découpage aux silences se comportent comme sur
+    un enregistrement de réunion.
+
+    Args:
+        duration: Durée en secondes
+        sample_rate: Fréquence d'échantillonnage
+        seed: Graine du générateur (même graine = même signal)
+
+    Returns:
+        Tableau float32 dans [-1, 1]
+    """
+    rng = np.random.default_rng(seed)
+    total = int(duration * sample_rate)
+    audio = rng.normal(0, 0.003, total)
+    position = int(rng.uniform(0.2, 0.5) * sample_rate)
+
+    while position < total:
+        # Une phrase : 3 à 12 mots de 1 à 3 syllabes
+        for _ in range(rng.integers(3, 13)):
+            for _ in range(rng.integers(1, 4)):
+                length = int(rng.uniform(0.12, 0.30) * sample_rate)
+                end = min(position + length, total)
+                if end <= position:
+                    break
+                audio[position:end] += (
+                    rng.uniform(0.3, 0.6) * _syllable(rng, length, sample_rate)[: end - position]
+                )
+                position = end
+            position += int(rng.uniform(0.05, 0.15) * sample_rate)
+            if position >= total:
+                break
+        position += int(rng.uniform(0.5, 1.2) * sample_rate)
+
+    peak = np.abs(audio).max()
+    if peak > 0:
+        audio *= 0.8 / peak
+    return audio.astype(np.float32)
+
+
+def encode_audio(samples: np.ndarray, audio_format: str, sample_rate: int = SAMPLING_RATE) -> bytes:
+    """
+    Encode un signal mono float32 dans le format demandé
+
+    Args:
+        samples: Signal float32 dans [-1, 1]
+        audio_format: Clé de AUDIO_FORMATS
+        sample_rate: Fréquence d'échantillonnage
+
+    Returns:
+        Contenu du fichier encodé
+    """
+    pcm = (np.clip(samples, -1, 1) * 32767).astype("<i2")
+
+    if audio_format == "wav":
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(sample_rate)
+            wav.writeframes(pcm.tobytes())
+        return buffer.getvalue()
+
+    if audio_format not in AUDIO_FORMATS:
+        raise ValueError(f"Unsupported audio format: {audio_format}")
+
+    import av  # Installé avec faster-whisper
+
+    codec, container_format = AUDIO_FORMATS[audio_format]
+    buffer = io.BytesIO()
+    with av.open(buffer, mode="w", format=container_format) as container:
+        stream = container.add_stream(codec, rate=sample_rate)
+        stream.layout = "mono"
+        frame = av.AudioFrame.from_ndarray(pcm.reshape(1, -1), format="s16", layout="mono")
+        frame.sample_rate = sample_rate
+        for packet in stream.encode(frame):
+            container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+    return buffer.getvalue()
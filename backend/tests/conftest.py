@@ -1,7 +1,18 @@
 """Configuration pytest"""
 import pytest
 import sys
+import numpy as np
 from pathlib import Path
+from unittest.mock import patch
 
 # Ajouter le dossier parent au path pour les imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture
+def prepared_audio():
+    """Remplace le décodage des uploads par 30 secondes de silence à 16 kHz"""
+    from app.services.audio_preprocessor import AudioPreprocessor
+    audio = np.zeros(30 * 16000, dtype=np.float32)
+    with patch.object(AudioPreprocessor, 'load', return_value=audio) as mock_load:
+        yield mock_load
@@ -0,0 +1,106 @@
+"""
+Tests du contrôle d'admission des transcriptions
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.main import app
+from app.services.admission_controller import AdmissionController, AdmissionRejectedError
+from app.services.job_manager import JobManager
+
+
+@pytest.fixture
+def limits():
+    """Limites réduites, un seul slot de transcription"""
+    with patch.object(settings, "ADMISSION_MAX_PENDING", 2), \
+         patch.object(settings, "ADMISSION_MAX_AUDIO_SECONDS", 600), \
+         patch.object(settings, "USE_LOCAL_WHISPER", False), \
+         patch.object(settings, "AZURE_MAX_CONCURRENT_REQUESTS", 1):
+        yield
+
+
+def test_queue_depth_limit_and_retry_after(limits):
+    """Test : file pleine -> refus, Retry-After calculé à partir de la vitesse mesurée"""
+    controller = AdmissionController()
+    controller.record_completion(audio_seconds=100, processing_seconds=10)  # 10 s d'audio / s
+
+    first = controller.admit(100)
+    controller.admit(200)
+
+    with pytest.raises(AdmissionRejectedError) as error:
+        controller.admit(10)
+    # Une transcription moyenne (150 s d'audio) doit se terminer : 15 s
+    assert error.value.retry_after == 15
+    assert error.value.reason == "queue_full"
+
+    first.release()
+    first.release()
+    assert controller.pending == 1
+    assert controller.outstanding_audio_seconds == 200
+    controller.admit(10)
+
+
+def test_audio_budget_limit(limits):
+    """Test : budget d'audio dépassé -> refus ; une requête seule est toujours acceptée"""
+    controller = AdmissionController()
+    controller.record_completion(audio_seconds=60, processing_seconds=30)  # 2 s d'audio / s
+
+    oversized = controller.admit(5000)
+    with pytest.raises(AdmissionRejectedError) as error:
+        controller.admit(100)
+    assert error.value.reason == "audio_backlog"
+    # 5000 + 100 - 600 = 4500 s d'audio en trop, à 2 s/s
+    assert error.value.retry_after == settings.ADMISSION_MAX_RETRY_AFTER_SECONDS
+
+    oversized.resize(500)
+    ticket = controller.admit(100)
+    ticket.release({"duration": 120.0, "processing_time": 20.0})
+    assert controller.speed == pytest.approx(2 + 0.2 * (6 - 2))
+
+
+def test_upload_rejected_before_reading_body(limits):
+    """Test : 429 + Retry-After sans lire ni sauvegarder le fichier"""
+    from app.main import admission_controller
+
+    client = TestClient(app)
+    busy = [admission_controller.admit(300), admission_controller.admit(300)]
+
+    try:
+        with patch(
+            "app.routes.transcription.file_handler.ingest_upload", new_callable=AsyncMock
+        ) as ingest:
+            response = client.post(
+                "/api/v1/transcription/upload",
+                files={"file": ("reunion.mp3", b"\x00" * 1024, "audio/mpeg")}
+            )
+
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        ingest.assert_not_called()
+    finally:
+        for ticket in busy:
+            ticket.release()
+
+    assert admission_controller.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_job_releases_ticket_when_finished(limits):
+    """Test : la place d'un job est rendue à la fin du job, avec sa vitesse mesurée"""
+    controller = AdmissionController()
+    ticket = controller.admit(60).detach()
+    manager = JobManager(max_concurrent=1, max_queue_size=4)
+    job = manager.submit("job-admission", "unused.wav", "fr", admission=ticket)
+
+    result = {"text": "ok", "duration": 60.0, "processing_time": 3.0}
+    with patch(
+        "app.services.job_manager.azure_service.transcribe_audio",
+        new=AsyncMock(return_value=result),
+    ), patch("app.services.job_manager.file_handler.delete_file", new=AsyncMock()):
+        await manager._queue.join()
+
+    await manager.stop()
+    assert job.status.value == "completed"
+    assert controller.pending == 0
+    assert controller.speed == 20.0
@@ -134,7 +134,8 @@ def test_transcription_upload_invalid_extension():
     files = {"file": ("test.txt", BytesIO(b"fake content"), "text/plain")}
     data = {"language": "fr"}
     
-    with patch('app.utils.file_handler.file_handler.save_upload_file') as mock_save:
+    with patch('app.services.azure_service.AzureOpenAIService.transcription_available', True), \
+         patch('app.utils.file_handler.file_handler.save_upload_file') as mock_save:
         from fastapi import HTTPException
         mock_save.side_effect = HTTPException(status_code=400, detail="Format non supporté")
         
@@ -0,0 +1,85 @@
+"""
+Tests du découpage parallèle des longs enregistrements
+"""
+import pytest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from app.services.azure_service import AzureOpenAIService
+from app.utils.audio_chunker import AudioChunk, plan_chunks, deduplicate_boundary
+
+SR = 16000
+
+
+def test_plan_chunks_cuts_in_longest_silence():
+    """Test : la coupe tombe au milieu du plus long silence proche de la cible"""
+    speech = [
+        {"start": 0, "end": 95 * SR},
+        {"start": 96 * SR, "end": 98 * SR},
+        {"start": 102 * SR, "end": 200 * SR},
+    ]
+
+    chunks = plan_chunks(
+        speech, total_samples=200 * SR, target_samples=100 * SR, overlap_samples=SR
+    )
+
+    assert chunks == [AudioChunk(0, 100 * SR, 0), AudioChunk(100 * SR, 200 * SR, 0)]
+
+
+def test_plan_chunks_hard_cut_overlaps():
+    """Test : sans silence, la coupe est franche et le bloc suivant chevauche"""
+    speech = [{"start": 0, "end": 300 * SR}]
+
+    chunks = plan_chunks(
+        speech, total_samples=300 * SR, target_samples=100 * SR, overlap_samples=SR
+    )
+
+    assert chunks[0] == AudioChunk(0, 100 * SR, 0)
+    assert chunks[1] == AudioChunk(99 * SR, 199 * SR, SR)
+    assert chunks[-1].end == 300 * SR
+
+
+def test_deduplicate_boundary():
+    """Test : les mots répétés au début du bloc suivant sont retirés"""
+    assert (
+        deduplicate_boundary("on valide le budget.", "Le budget, puis le planning")
+        == "puis le planning"
+    )
+    assert deduplicate_boundary("on valide", "ensuite le planning") == "ensuite le planning"
+
+
+def make_segment(start, end, text):
+    segment = MagicMock()
+    segment.start, segment.end, segment.text = start, end, text
+    return segment
+
+
+@pytest.mark.asyncio
+async def test_transcribe_local_chunked_stitches_chunks():
+    """Test : les blocs sont décodés sur des répliques et recollés dans l'ordre"""
+    service = AzureOpenAIService()
+    # Segments renvoyés selon la longueur du bloc (les blocs sont décodés en parallèle)
+    segments_by_length = {
+        100 * SR: [make_segment(0.0, 99.5, " Bonjour, on commence la réunion")],
+        101
+        * SR: [make_segment(0.0, 2.0, " la réunion"), make_segment(2.0, 100.0, " et on termine")],
+    }
+    for _ in range(2):
+        model = MagicMock()
+        model.transcribe.side_effect = lambda audio, **kwargs: (
+            iter(segments_by_length[len(audio)]), MagicMock(language="fr")
+        )
+        service.model_pool.add(model)
+
+    chunks = [AudioChunk(0, 100 * SR, 0), AudioChunk(99 * SR, 200 * SR, SR)]
+    progress = []
+
+    with patch.object(service, '_plan_local_chunks', return_value=chunks):
+        timeline, duration, language = await service._transcribe_local_chunked(
+            np.zeros(200 * SR, dtype=np.float32), "fr", progress_callback=progress.append
+        )
+
+    assert timeline.text == "Bonjour, on commence la réunion et on termine"
+    assert timeline.starts.tolist() == [0.0, 99.0 + 2.0]
+    assert duration == 200.0
+    assert language == "fr"
+    assert progress[-1] == 1.0
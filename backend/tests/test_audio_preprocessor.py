@@ -0,0 +1,67 @@
+"""
+Tests du prétraitement audio (décodage unique en PCM 16 kHz)
+"""
+import pytest
+import wave
+import numpy as np
+from unittest.mock import patch
+from app.services.audio_preprocessor import AudioPreprocessor
+from app.utils.file_handler import FileHandler
+
+
+def write_wav(path, samples, sample_rate=16000, channels=1):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes((samples * 32767).astype("<i2").tobytes())
+
+
+def test_wav_16k_mono_skips_decoder(tmp_path):
+    """Test : un WAV 16 kHz mono est lu sans décodeur puis relu depuis le memmap"""
+    preprocessor = AudioPreprocessor()
+    upload = tmp_path / "meeting.wav"
+    write_wav(upload, np.full(16000, 0.5, dtype=np.float32))
+
+    with patch('app.services.audio_preprocessor.decode_audio', create=True) as mock_decode:
+        audio = preprocessor.load(str(upload))
+        again = preprocessor.load(str(upload))
+
+    mock_decode.assert_not_called()
+    assert isinstance(again, np.memmap)
+    assert audio.dtype == np.float32
+    assert preprocessor.duration(audio) == 1.0
+    assert audio[0] == pytest.approx(0.5, abs=1e-3)
+    assert preprocessor.sidecar_path(str(upload)).exists()
+    assert preprocessor.stats() == {"decoded": 0, "wav_passthrough": 1, "reused": 1}
+
+
+def test_other_formats_are_decoded_once(tmp_path):
+    """Test : les autres formats passent par le décodeur une seule fois"""
+    preprocessor = AudioPreprocessor()
+    upload = tmp_path / "meeting.wav"
+    write_wav(upload, np.zeros(44100, dtype=np.float32), sample_rate=44100)
+    decoded = np.zeros(16000, dtype=np.float32)
+
+    with patch("app.services.audio_preprocessor.DECODER_AVAILABLE", True), patch(
+        "app.services.audio_preprocessor.decode_audio", return_value=decoded, create=True
+    ) as mock_decode:
+        preprocessor.load(str(upload))
+        preprocessor.load(str(upload))
+
+    mock_decode.assert_called_once()
+    assert preprocessor.stats()["decoded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sidecar_deleted_with_upload(tmp_path):
+    """Test : l'audio décodé est supprimé avec l'upload (RGPD)"""
+    handler = FileHandler()
+    handler.temp_folder = tmp_path
+    upload = tmp_path / "meeting.wav"
+    write_wav(upload, np.zeros(1600, dtype=np.float32))
+
+    AudioPreprocessor().load(str(upload))
+    await handler.delete_file(str(upload))
+
+    assert list(tmp_path.iterdir()) == []
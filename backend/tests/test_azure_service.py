@@ -2,7 +2,7 @@
 Tests unitaires pour azure_service.py
 """
 import pytest
-from unittest.mock import Mock, patch, MagicMock, mock_open
+from unittest.mock import Mock, patch, MagicMock, AsyncMock, mock_open
 from app.services.azure_service import AzureOpenAIService
 import time
 
@@ -23,7 +23,7 @@ def mock_whisper_model():
 
 
 @pytest.mark.asyncio
-async def test_transcribe_audio_local_success(mock_whisper_model):
+async def test_transcribe_audio_local_success(mock_whisper_model, prepared_audio):
     """Test de transcription locale réussie avec faster-whisper"""
     with patch('app.services.azure_service.FASTER_WHISPER_AVAILABLE', True):
         with patch('app.services.azure_service.WhisperModel', return_value=mock_whisper_model):
@@ -49,9 +49,9 @@ async def test_transcribe_audio_openai_api():
     mock_transcript.language = "fr"
     mock_transcript.duration = 15.2
     
-    with patch('app.services.azure_service.OpenAI') as mock_openai:
+    with patch('app.services.azure_service.AsyncOpenAI') as mock_openai:
         mock_client = MagicMock()
-        mock_client.audio.transcriptions.create.return_value = mock_transcript
+        mock_client.audio.transcriptions.create = AsyncMock(return_value=mock_transcript)
         mock_openai.return_value = mock_client
         
         service = AzureOpenAIService()
@@ -99,9 +99,9 @@ Réunion de planification du projet Whispen.
 - Documenter l'API - Tech Lead
 """
     
-    with patch('app.services.azure_service.AzureOpenAI') as mock_azure:
+    with patch('app.services.azure_service.AsyncAzureOpenAI') as mock_azure:
         mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         mock_azure.return_value = mock_client
         
         service = AzureOpenAIService()
@@ -127,9 +127,9 @@ async def test_generate_summary_bullet_points():
     mock_response.choices = [Mock()]
     mock_response.choices[0].message.content = "- Point 1\n- Point 2\n- Point 3"
     
-    with patch('app.services.azure_service.AzureOpenAI') as mock_azure:
+    with patch('app.services.azure_service.AsyncAzureOpenAI') as mock_azure:
         mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         mock_azure.return_value = mock_client
         
         service = AzureOpenAIService()
@@ -152,9 +152,9 @@ async def test_generate_summary_short():
     mock_response.choices = [Mock()]
     mock_response.choices[0].message.content = "Résumé très court en 2 phrases."
     
-    with patch('app.services.azure_service.AzureOpenAI') as mock_azure:
+    with patch('app.services.azure_service.AsyncAzureOpenAI') as mock_azure:
         mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         mock_azure.return_value = mock_client
         
         service = AzureOpenAIService()
@@ -173,12 +173,9 @@ async def test_generate_summary_short():
 @pytest.mark.asyncio
 async def test_check_connection_success():
     """Test de vérification de connexion réussie"""
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    
-    with patch('app.services.azure_service.AzureOpenAI') as mock_azure:
+    with patch('app.services.azure_service.AsyncAzureOpenAI') as mock_azure:
         mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.models.list = AsyncMock(return_value=Mock())
         mock_azure.return_value = mock_client
         
         service = AzureOpenAIService()
@@ -187,14 +184,15 @@ async def test_check_connection_success():
         result = await service.check_connection()
     
     assert result is True
+    mock_client.chat.completions.create.assert_not_called()  # Aucun token consommé
 
 
 @pytest.mark.asyncio
 async def test_check_connection_failure():
     """Test de vérification de connexion échouée"""
-    with patch('app.services.azure_service.AzureOpenAI') as mock_azure:
+    with patch('app.services.azure_service.AsyncAzureOpenAI') as mock_azure:
         mock_client = MagicMock()
-        mock_client.chat.completions.create.side_effect = Exception("Connection failed")
+        mock_client.models.list = AsyncMock(side_effect=Exception("Connection failed"))
         mock_azure.return_value = mock_client
         
         service = AzureOpenAIService()
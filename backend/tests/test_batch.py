@@ -0,0 +1,113 @@
+"""
+Tests de la transcription par lots (plusieurs fichiers ou archive zip)
+"""
+import asyncio
+import io
+import json
+import zipfile
+from pathlib import Path
+import pytest
+from unittest.mock import PropertyMock, patch
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.main import app
+from app.services.azure_service import AzureOpenAIService, azure_service
+from benchmarks.synthetic_audio import generate_speech_like, encode_audio
+
+WAV = encode_audio(generate_speech_like(1.0), "wav")
+
+
+def make_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def fake_transcription():
+    """Transcription factice (échec pour les fichiers .ogg), suivi de la concurrence"""
+    state = {"in_flight": 0, "max_in_flight": 0, "paths": []}
+
+    async def fake_transcribe(file_path, language, content_hash=None, model=None):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        state["paths"].append(file_path)
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        if file_path.endswith(".ogg"):
+            raise RuntimeError("décodage impossible")
+        return {
+            "text": f"transcription {language}", "language": language, "duration": 1.0,
+            "word_count": 2, "processing_time": 0.01, "model": "base", "segments": None
+        }
+
+    with patch.object(
+        AzureOpenAIService, "transcription_available", new_callable=PropertyMock, return_value=True
+    ), patch.object(azure_service, "transcribe_audio", side_effect=fake_transcribe), patch.object(
+        settings, "BATCH_MAX_CONCURRENT", 2
+    ):
+        yield state
+
+
+def post_batch(files, **data):
+    client = TestClient(app)
+    response = client.post("/api/v1/transcription/batch", files=files, data=data)
+    return response, [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_batch_streams_each_file_and_isolates_errors(fake_transcription):
+    """Test : fichiers et archive transcrits, un fichier refusé et un échec n'arrêtent pas le lot"""
+    archive = make_zip({
+        "semaine/lundi.wav": WAV,
+        "semaine/mardi.wav": WAV,
+        "semaine/notes.txt": b"pas de l'audio",
+        "__MACOSX/semaine/._lundi.wav": b"metadata",
+    })
+    files = [
+        ("files", ("reunion.wav", WAV, "audio/wav")),
+        ("files", ("corrompu.ogg", WAV, "audio/ogg")),
+        ("files", ("semaine.zip", archive, "application/zip")),
+    ]
+
+    response, events = post_batch(files, language="en")
+
+    assert response.status_code == 200
+    results = {event["filename"]: event for event in events if event["type"] == "file"}
+    assert sorted(results) == ["corrompu.ogg", "lundi.wav", "mardi.wav", "notes.txt", "reunion.wav"]
+    assert results["lundi.wav"]["status"] == "completed"
+    assert results["lundi.wav"]["result"]["text"] == "transcription en"
+    assert results["notes.txt"]["status_code"] == 400
+    assert results["corrompu.ogg"]["status"] == "failed"
+    assert "décodage impossible" in results["corrompu.ogg"]["error"]
+    assert events[-1] == {**events[-1], "type": "done", "total": 5, "completed": 3, "failed": 2}
+    assert fake_transcription["max_in_flight"] == 2
+    # Fichiers temporaires supprimés après transcription (RGPD)
+    assert not any(Path(path).exists() for path in fake_transcription["paths"])
+
+
+def test_batch_reports_invalid_archive(fake_transcription):
+    """Test : archive illisible -> un élément en erreur, les autres fichiers transcrits"""
+    files = [
+        ("files", ("archive.zip", b"PK pas une archive", "application/zip")),
+        ("files", ("reunion.wav", WAV, "audio/wav")),
+    ]
+
+    response, events = post_batch(files)
+
+    failed = [event for event in events if event.get("status") == "failed"]
+    assert [event["filename"] for event in failed] == ["archive.zip"]
+    assert failed[0]["error"] == "Archive zip invalide"
+    assert events[-1]["completed"] == 1
+
+
+def test_batch_rejects_too_many_files(fake_transcription):
+    """Test : lot au-delà de BATCH_MAX_FILES -> 400, aucun fichier conservé"""
+    files = [("files", (f"reunion{i}.wav", WAV, "audio/wav")) for i in range(3)]
+
+    with patch.object(settings, "BATCH_MAX_FILES", 2):
+        response = TestClient(app).post("/api/v1/transcription/batch", files=files)
+
+    assert response.status_code == 400
+    assert fake_transcription["paths"] == []
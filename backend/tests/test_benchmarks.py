@@ -0,0 +1,58 @@
+"""
+Tests de la suite de benchmarks (exécution courte, hors ligne)
+"""
+import json
+from benchmarks import run
+from benchmarks.compare import compare_reports, find_regressions
+from benchmarks.synthetic_audio import generate_speech_like, encode_audio
+
+
+def test_synthetic_audio_is_deterministic():
+    """Test : même graine, même signal ; le WAV respecte la durée demandée"""
+    audio = generate_speech_like(2.0, seed=3)
+
+    assert audio.dtype.name == "float32"
+    assert len(audio) == 32000
+    assert (audio == generate_speech_like(2.0, seed=3)).all()
+    assert len(encode_audio(audio, "wav")) == 44 + 2 * 32000
+
+
+def test_upload_and_summary_suites_report_json(tmp_path):
+    """Test : rapport JSON avec latences, débit et pic mémoire"""
+    output = tmp_path / "results.json"
+
+    run.main([
+        "--suite", "upload", "summary",
+        "--durations", "1", "--formats", "wav",
+        "--iterations", "3", "--warmup", "0",
+        "--summary-words", "200", "--fake-latency-ms", "0",
+        "--output", str(output)
+    ])
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    names = [result["name"] for result in report["results"]]
+    assert names == ["upload/wav/1s", "summary/200w/c4"]
+    assert report["results"][0]["latency_ms"]["p95"] >= report["results"][0]["latency_ms"]["p50"]
+    assert report["results"][1]["azure_calls_per_summary"] == 1
+    assert report["environment"]["parameters"]["iterations"] == 3
+
+
+def test_compare_flags_regressions():
+    """Test : seule une dégradation au-delà du seuil est signalée"""
+    def report(p50, rtf):
+        return {
+            "environment": {},
+            "results": [
+                {"name": "upload/wav/10s", "latency_ms": {"p50": p50, "p95": p50 * 2}},
+                {
+                    "name": "transcription/tiny/wav/10s",
+                    "latency_ms": {"p50": 1000, "p95": 1000},
+                    "rtf": {"p50": rtf},
+                },
+            ],
+        }
+
+    rows = compare_reports(report(10.0, 0.20), report(12.0, 0.21))
+
+    regressions = find_regressions(rows, threshold=10)
+    assert [(row["name"], row["metric"]) for row in regressions] == [("upload/wav/10s", "p50 ms")]
@@ -0,0 +1,82 @@
+"""
+Tests du faux Azure OpenAI et du générateur de charge
+Le vrai client openai et l'application FastAPI complète sont exercés, sans réseau
+"""
+import httpx
+import pytest
+from unittest.mock import patch
+from openai import AsyncOpenAI
+from app.config import settings
+from app.main import app
+from app.services.azure_service import AzureOpenAIService, azure_service
+from benchmarks.fake_azure import (
+    FAKE_SUMMARY,
+    FakeAzureConfig,
+    FakeAzureOpenAI,
+    make_fake_azure_client,
+)
+from benchmarks.load_test import Payloads, run_level
+from benchmarks.run import synthetic_transcription
+from benchmarks.synthetic_audio import generate_speech_like, encode_audio
+
+
+@pytest.mark.asyncio
+async def test_throttling_is_retried_then_surfaced():
+    """Test : chaque 429 injecté est retenté selon retry-after-ms, puis l'erreur remonte"""
+    fake = FakeAzureOpenAI(FakeAzureConfig(latency_ms=0, throttle_rate=1.0, retry_after_ms=1))
+    service = AzureOpenAIService()
+    service.azure_client = make_fake_azure_client(fake)
+
+    with patch.object(settings, "AZURE_MAX_RETRIES", 2), \
+         patch.object(settings, "SUMMARY_CACHE_ENABLED", False):
+        with pytest.raises(Exception, match="429"):
+            await service.generate_summary("Texte de réunion suffisamment long. " * 5)
+
+    assert fake.requests == 3
+    assert fake.throttled == 3
+
+
+@pytest.mark.asyncio
+async def test_streaming_chat_and_verbose_transcription():
+    """Test : flux SSE reconstitué par le client, segments verbose_json relus par le service"""
+    fake = FakeAzureOpenAI(FakeAzureConfig(latency_ms=0))
+    azure_client = make_fake_azure_client(fake)
+
+    stream = await azure_client.chat.completions.create(
+        model="gpt-4o-mini", messages=[{"role": "user", "content": "Bonjour"}], stream=True
+    )
+    content = "".join([chunk.choices[0].delta.content or "" async for chunk in stream])
+    assert content == FAKE_SUMMARY
+
+    openai_client = AsyncOpenAI(
+        api_key="test", base_url="http://fake/v1",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=fake.app))
+    )
+    transcript = await openai_client.audio.transcriptions.create(
+        model="whisper-1",
+        file=("clip.wav", encode_audio(generate_speech_like(12.0), "wav")),
+        response_format="verbose_json"
+    )
+    timeline = AzureOpenAIService._openai_segments(transcript)
+    assert transcript.duration == 12.0
+    assert timeline.ends.tolist() == [5.0, 10.0, 12.0]
+    assert fake.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_load_level_against_full_app():
+    """Test : le générateur de charge traverse l'API jusqu'au faux Azure"""
+    fake = FakeAzureOpenAI(FakeAzureConfig(latency_ms=5))
+    payloads = Payloads(transcription_text=synthetic_transcription(200, seed=0))
+
+    with patch.object(azure_service, "azure_client", make_fake_azure_client(fake)):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            result = await run_level(client, "summary", payloads, concurrency=4, requests=8)
+
+    assert result["status_counts"] == {"200": 8}
+    assert result["error_rate"] == 0
+    assert result["latency_ms"]["p99"] >= result["latency_ms"]["p50"]
+    assert fake.requests == 8
+    assert fake.peak_in_flight == 4
@@ -31,26 +31,31 @@ async def test_save_upload_file_success(file_handler, tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_validate_file_too_large(file_handler):
-    """Test validation : fichier trop volumineux"""
+async def test_validate_file_too_large(file_handler, tmp_path):
+    """Test validation : fichier trop volumineux, rien ne reste sur disque"""
     # Créer un fichier fictif de 250 MB
     large_content = b"x" * (250 * 1024 * 1024)
     mock_file = UploadFile(filename="large.mp3", file=BytesIO(large_content))
     
+    file_handler.temp_folder = tmp_path
+    
     with pytest.raises(HTTPException) as exc_info:
-        await file_handler._validate_file(mock_file)
+        await file_handler.ingest_upload(mock_file)
     
     assert exc_info.value.status_code == 413
+    assert list(tmp_path.iterdir()) == []
 
 
 @pytest.mark.asyncio
-async def test_validate_file_wrong_extension(file_handler):
+async def test_validate_file_wrong_extension(file_handler, tmp_path):
     """Test validation : extension invalide"""
     file_content = b"fake content"
     mock_file = UploadFile(filename="test.exe", file=BytesIO(file_content))
     
+    file_handler.temp_folder = tmp_path
+    
     with pytest.raises(HTTPException) as exc_info:
-        await file_handler._validate_file(mock_file)
+        await file_handler.ingest_upload(mock_file)
     
     assert exc_info.value.status_code == 400
     assert "Format non supporté" in exc_info.value.detail
@@ -94,8 +99,9 @@ async def test_cleanup_old_files(file_handler, tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_validate_file_allowed_extensions(file_handler):
+async def test_validate_file_allowed_extensions(file_handler, tmp_path):
     """Test validation des extensions autorisées"""
+    file_handler.temp_folder = tmp_path
     allowed_extensions = ["mp3", "wav", "m4a", "flac", "ogg", "webm"]
     
     for ext in allowed_extensions:
@@ -104,7 +110,7 @@ async def test_validate_file_allowed_extensions(file_handler):
         
         # Ne devrait pas lever d'exception
         try:
-            await file_handler._validate_file(mock_file)
+            await file_handler.ingest_upload(mock_file)
         except HTTPException as e:
             if e.status_code != 413:  # Ignorer erreur taille si présente
                 pytest.fail(f"Extension .{ext} devrait être autorisée")
@@ -155,3 +161,55 @@ async def test_cleanup_recent_files_preserved(file_handler, tmp_path):
     
     assert deleted_count == 0
     assert recent_file.exists()  # Le fichier récent doit être préservé
+
+
+@pytest.mark.asyncio
+async def test_ingest_upload_hash_and_size(file_handler, tmp_path):
+    """Test : taille et hash SHA-256 calculés pendant la lecture par blocs"""
+    import hashlib
+    from unittest.mock import patch
+    
+    file_handler.temp_folder = tmp_path
+    file_content = b"audio content " * 1000
+    mock_file = UploadFile(filename="test.wav", file=BytesIO(file_content))
+    
+    with patch('app.utils.file_handler.settings.UPLOAD_CHUNK_SIZE_KB', 1):
+        stored = await file_handler.ingest_upload(mock_file)
+    
+    assert stored.size_bytes == len(file_content)
+    assert stored.sha256 == hashlib.sha256(file_content).hexdigest()
+    assert Path(stored.file_path).read_bytes() == file_content
+
+
+@pytest.mark.asyncio
+async def test_ingest_upload_spills_to_disk(file_handler, tmp_path):
+    """Test : au-delà du seuil mémoire, le fichier est écrit sur disque par blocs"""
+    from unittest.mock import patch
+    
+    file_handler.temp_folder = tmp_path
+    file_content = b"x" * (3 * 1024 * 1024)
+    mock_file = UploadFile(filename="large.mp3", file=BytesIO(file_content))
+    
+    with patch('app.utils.file_handler.settings.UPLOAD_SPOOL_MAX_MEMORY_MB', 1):
+        stored = await file_handler.ingest_upload(mock_file)
+    
+    assert Path(stored.file_path).stat().st_size == len(file_content)
+    assert not list(tmp_path.glob("*.part"))
+
+
+@pytest.mark.asyncio
+async def test_ingest_upload_too_large_leaves_no_file(file_handler, tmp_path):
+    """Test : un upload trop volumineux est rejeté sans laisser de fichier"""
+    from unittest.mock import patch
+    
+    file_handler.temp_folder = tmp_path
+    file_content = b"x" * (3 * 1024 * 1024)
+    mock_file = UploadFile(filename="large.mp3", file=BytesIO(file_content))
+    
+    with patch('app.utils.file_handler.settings.MAX_FILE_SIZE_MB', 2), \
+         patch('app.utils.file_handler.settings.UPLOAD_SPOOL_MAX_MEMORY_MB', 1):
+        with pytest.raises(HTTPException) as exc_info:
+            await file_handler.ingest_upload(mock_file)
+    
+    assert exc_info.value.status_code == 413
+    assert list(tmp_path.iterdir()) == []
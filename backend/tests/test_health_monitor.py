@@ -0,0 +1,90 @@
+"""
+Tests unitaires pour health_monitor.py et les probes liveness/readiness
+"""
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.azure_service import azure_service
+from app.services.health_monitor import HealthMonitor
+from app.services.model_registry import ModelRegistry
+
+
+@pytest.mark.asyncio
+async def test_refresh_caches_status():
+    """Test : le résultat de la sonde est conservé avec son âge"""
+    monitor = HealthMonitor(interval_seconds=30)
+    
+    with patch('app.services.health_monitor.azure_service.check_connection',
+               new=AsyncMock(return_value=True)) as mock_check:
+        assert await monitor.get_azure_status() is True
+        assert await monitor.get_azure_status() is True
+    
+    mock_check.assert_awaited_once()
+    snapshot = monitor.snapshot()
+    assert snapshot["connected"] is True
+    assert snapshot["age_seconds"] >= 0
+    assert snapshot["checked_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_share_one_probe():
+    """Test : sans résultat en cache, les appels concurrents attendent une seule sonde"""
+    monitor = HealthMonitor(interval_seconds=30)
+    
+    async def slow_check():
+        await asyncio.sleep(0.01)
+        return True
+    
+    with patch('app.services.health_monitor.azure_service.check_connection',
+               new=AsyncMock(side_effect=slow_check)) as mock_check:
+        statuses = await asyncio.gather(*(monitor.get_azure_status() for _ in range(5)))
+    
+    assert statuses == [True] * 5
+    mock_check.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_background_probe_interval():
+    """Test : la sonde est relancée périodiquement en arrière-plan"""
+    monitor = HealthMonitor(interval_seconds=0.01)
+    
+    with patch('app.services.health_monitor.azure_service.check_connection',
+               new=AsyncMock(side_effect=[True, False, False, False, False])) as mock_check:
+        monitor.start()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+    
+    assert mock_check.await_count >= 2
+    assert monitor.azure_connected is False
+
+
+def test_health_endpoint_uses_cached_status():
+    """Test : /health ne sonde pas Azure à chaque appel"""
+    client = TestClient(app)
+    
+    with patch('app.main.health_monitor.azure_connected', True), \
+         patch('app.services.health_monitor.azure_service.check_connection',
+               new=AsyncMock(return_value=False)) as mock_check:
+        response = client.get("/health")
+    
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+    mock_check.assert_not_awaited()
+
+
+def test_liveness_and_readiness():
+    """Test : liveness toujours OK, readiness selon le moteur de transcription"""
+    client = TestClient(app)
+    
+    assert client.get("/health/live").status_code == 200
+    
+    with patch(
+        "app.main.azure_service.model_registry", ModelRegistry(azure_service._load_whisper_model)
+    ), patch("app.main.azure_service.openai_client", None):
+        response = client.get("/health/ready")
+    
+    assert response.status_code == 503
+    assert response.json()["transcription_ready"] is False
+    assert "queue" in response.json()
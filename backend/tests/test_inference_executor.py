@@ -0,0 +1,73 @@
+"""
+Tests unitaires pour inference_executor.py
+"""
+import pytest
+import asyncio
+import time
+from app.services.inference_executor import InferenceExecutor
+
+
+@pytest.fixture
+def executor():
+    """Fixture pour InferenceExecutor"""
+    executor = InferenceExecutor(max_workers=2)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result(executor):
+    """Test : le résultat de la fonction bloquante est renvoyé"""
+    result = await executor.run(lambda a, b=0: a + b, 2, b=3)
+    
+    assert result == 5
+    stats = executor.stats()
+    assert stats["completed"] == 1
+    assert stats["queue_depth"] == 0
+    assert stats["last_job"]["run_seconds"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_run_does_not_block_event_loop(executor):
+    """Test : l'event loop reste disponible pendant le décodage"""
+    ticks = 0
+    
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+    
+    task = asyncio.create_task(ticker())
+    await executor.run(time.sleep, 0.2)
+    task.cancel()
+    
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_run_failure_counted(executor):
+    """Test : les erreurs sont propagées et comptabilisées"""
+    def failing():
+        raise ValueError("decode error")
+    
+    with pytest.raises(ValueError):
+        await executor.run(failing)
+    
+    stats = executor.stats()
+    assert stats["failed"] == 1
+    assert stats["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_depth_when_pool_saturated(executor):
+    """Test : les jobs au-delà de la taille du pool sont en file d'attente"""
+    jobs = [asyncio.create_task(executor.run(time.sleep, 0.2)) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    
+    stats = executor.stats()
+    assert stats["running"] == 2
+    assert stats["queue_depth"] == 1
+    
+    await asyncio.gather(*jobs)
+    assert executor.stats()["completed"] == 3
@@ -0,0 +1,132 @@
+"""
+Tests unitaires pour job_manager.py
+"""
+import pytest
+import asyncio
+from unittest.mock import patch, AsyncMock, MagicMock
+from app.models.schemas import TranscriptionStatus
+from app.services.job_manager import JobManager, JobQueueFullError
+
+
+MOCK_RESULT = {
+    "text": "Ceci est un test",
+    "language": "fr",
+    "duration": 10.5,
+    "processing_time": 1.2,
+    "word_count": 4
+}
+
+
+async def wait_for_job(manager, job_id, timeout=2.0):
+    """Attend la fin d'un job"""
+    for _ in range(int(timeout / 0.01)):
+        job = manager.get(job_id)
+        if job.is_finished:
+            return job
+        await asyncio.sleep(0.01)
+    raise TimeoutError(job_id)
+
+
+@pytest.mark.asyncio
+async def test_job_completed():
+    """Test : un job soumis est traité et son fichier supprimé"""
+    manager = JobManager(max_concurrent=1, max_queue_size=10)
+    
+    with patch('app.services.job_manager.azure_service.transcribe_audio',
+               new=AsyncMock(return_value=MOCK_RESULT)) as mock_transcribe, \
+         patch('app.services.job_manager.file_handler.delete_file', new=AsyncMock()) as mock_delete:
+        job = manager.submit("job-1", "/tmp/job-1.mp3", "fr", filename="reunion.mp3")
+        assert job.status == TranscriptionStatus.PENDING
+        
+        job = await wait_for_job(manager, "job-1")
+        await manager.stop()
+    
+    assert job.status == TranscriptionStatus.COMPLETED
+    assert job.progress == 1.0
+    assert job.result["text"] == "Ceci est un test"
+    mock_transcribe.assert_awaited_once()
+    mock_delete.assert_awaited_once_with("/tmp/job-1.mp3")
+
+
+@pytest.mark.asyncio
+async def test_job_failed():
+    """Test : une erreur de transcription passe le job en échec"""
+    manager = JobManager(max_concurrent=1, max_queue_size=10)
+    
+    with patch('app.services.job_manager.azure_service.transcribe_audio',
+               new=AsyncMock(side_effect=Exception("Decode error"))), \
+         patch('app.services.job_manager.file_handler.delete_file', new=AsyncMock()):
+        manager.submit("job-2", "/tmp/job-2.mp3")
+        job = await wait_for_job(manager, "job-2")
+        await manager.stop()
+    
+    assert job.status == TranscriptionStatus.FAILED
+    assert "Decode error" in job.error
+
+
+@pytest.mark.asyncio
+async def test_queue_full():
+    """Test : la file d'attente est bornée"""
+    manager = JobManager(max_concurrent=1, max_queue_size=1)
+    blocker = asyncio.Event()
+    
+    async def slow_transcribe(*args, **kwargs):
+        await blocker.wait()
+        return MOCK_RESULT
+    
+    with patch('app.services.job_manager.azure_service.transcribe_audio', new=slow_transcribe), \
+         patch('app.services.job_manager.file_handler.delete_file', new=AsyncMock()):
+        manager.submit("job-a", "/tmp/a.mp3")
+        await asyncio.sleep(0.01)  # job-a en cours de traitement
+        manager.submit("job-b", "/tmp/b.mp3")
+        
+        with pytest.raises(JobQueueFullError):
+            manager.submit("job-c", "/tmp/c.mp3")
+        
+        assert manager.stats()["queue_depth"] == 1
+        blocker.set()
+        await wait_for_job(manager, "job-b")
+        await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_jobs():
+    """Test : les jobs terminés sont purgés après la durée de rétention"""
+    manager = JobManager(max_concurrent=1, max_queue_size=10)
+    
+    with patch('app.services.job_manager.azure_service.transcribe_audio',
+               new=AsyncMock(return_value=MOCK_RESULT)), \
+         patch('app.services.job_manager.file_handler.delete_file', new=AsyncMock()):
+        manager.submit("job-old", "/tmp/old.mp3")
+        await wait_for_job(manager, "job-old")
+        await manager.stop()
+    
+    assert manager.purge_expired(hours=0) == 1
+    assert manager.get("job-old") is None
+
+
+@pytest.mark.asyncio
+async def test_stop_fails_and_cleans_up_interrupted_jobs():
+    """Test : à l'arrêt, jobs en cours et en file passent en échec, fichiers et tickets libérés"""
+    manager = JobManager(max_concurrent=1, max_queue_size=10)
+    started = asyncio.Event()
+    
+    async def endless_transcribe(*args, **kwargs):
+        started.set()
+        await asyncio.Event().wait()
+    
+    running_ticket, queued_ticket = MagicMock(), MagicMock()
+    with patch('app.services.job_manager.azure_service.transcribe_audio',
+               new=endless_transcribe), \
+         patch('app.services.job_manager.file_handler.delete_file', new=AsyncMock()) as mock_delete:
+        running = manager.submit("job-run", "/tmp/run.mp3", admission=running_ticket)
+        queued = manager.submit("job-wait", "/tmp/wait.mp3", admission=queued_ticket)
+        await started.wait()
+        await manager.stop()
+    
+    assert running.status == TranscriptionStatus.FAILED
+    assert queued.status == TranscriptionStatus.FAILED
+    running_ticket.release.assert_called_once_with(None)
+    queued_ticket.release.assert_called_once_with(None)
+    deleted = {call.args[0] for call in mock_delete.await_args_list}
+    assert deleted == {"/tmp/run.mp3", "/tmp/wait.mp3"}
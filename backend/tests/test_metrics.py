@@ -0,0 +1,81 @@
+"""
+Tests de l'endpoint /metrics et de l'instrumentation
+"""
+import pytest
+import httpx
+import openai
+from io import BytesIO
+from unittest.mock import AsyncMock
+from fastapi import UploadFile
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from app.main import app
+from app.services.azure_service import AzureOpenAIService
+from app.utils.file_handler import FileHandler
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_endpoint_exposes_gauges_and_stages():
+    """Test : jauges de file et histogrammes d'étapes exposés au format Prometheus"""
+    client = TestClient(app)
+    client.get("/health/live")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "whispen_job_queue_depth" in response.text
+    assert "whispen_inference_running" in response.text
+    assert (
+        "whispen_http_request_duration_seconds_count"
+        '{method="GET",route="/health/live",status="200"}' in response.text
+    )
+
+
+@pytest.mark.asyncio
+async def test_azure_retries_and_errors_counted():
+    """Test : chaque erreur et chaque nouvelle tentative sont comptées"""
+    service = AzureOpenAIService()
+    request = httpx.Request("POST", "https://x.openai.azure.com/")
+    rate_limited = openai.RateLimitError(
+        "rate limited",
+        response=httpx.Response(429, request=request, headers={"retry-after-ms": "0"}),
+        body=None,
+    )
+    call = AsyncMock(side_effect=[rate_limited, "ok"])
+
+    errors_before = sample("whispen_azure_errors_total", operation="chat", error="429")
+    retries_before = sample("whispen_azure_retries_total", operation="chat")
+
+    assert await service._call_with_retries(call, operation="chat") == "ok"
+
+    assert sample("whispen_azure_errors_total", operation="chat", error="429") == errors_before + 1
+    assert sample("whispen_azure_retries_total", operation="chat") == retries_before + 1
+
+
+def test_real_time_factor_recorded_by_model():
+    """Test : le facteur temps réel est observé avec la taille du modèle"""
+    count_before = sample("whispen_transcription_real_time_factor_count", model="tiny")
+
+    AzureOpenAIService._record_transcription_metrics("tiny", inference_seconds=5.0, duration=50.0)
+    AzureOpenAIService._record_transcription_metrics("tiny", inference_seconds=5.0, duration=None)
+
+    assert sample("whispen_transcription_real_time_factor_count", model="tiny") == count_before + 1
+    assert sample("whispen_transcription_real_time_factor_sum", model="tiny") >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_upload_validation_observed_once(tmp_path):
+    """Test : extension et type MIME mesurés ensemble, une observation par upload"""
+    handler = FileHandler()
+    handler.temp_folder = tmp_path
+    count_before = sample("whispen_stage_duration_seconds_count", stage="validation")
+
+    await handler.ingest_upload(
+        UploadFile(filename="test.mp3", file=BytesIO(b"fake audio content"))
+    )
+
+    assert sample("whispen_stage_duration_seconds_count", stage="validation") == count_before + 1
@@ -0,0 +1,99 @@
+"""
+Tests du regroupement dynamique des transcriptions courtes
+"""
+import pytest
+import asyncio
+import numpy as np
+from unittest.mock import MagicMock, patch
+from app.services.azure_service import AzureOpenAIService
+from app.services.micro_batcher import MicroBatcher
+
+
+def make_batch_runner(calls):
+    async def run_batch(audios, language):
+        calls.append((len(audios), language))
+        return [f"{language}:{len(audio)}" for audio in audios]
+    return run_batch
+
+
+@pytest.mark.asyncio
+async def test_concurrent_clips_share_one_batch():
+    """Test : des clips arrivés ensemble sont décodés en un seul lot"""
+    calls = []
+    batcher = MicroBatcher(make_batch_runner(calls), max_batch_size=8, max_wait_ms=20)
+
+    results = await asyncio.gather(*(
+        batcher.submit(np.zeros(size, dtype=np.float32), "fr") for size in (1, 2, 3)
+    ))
+
+    assert results == ["fr:1", "fr:2", "fr:3"]
+    assert calls == [(3, "fr")]
+    assert batcher.stats()["avg_batch_size"] == 3
+
+
+@pytest.mark.asyncio
+async def test_full_batch_sent_without_waiting():
+    """Test : un lot plein part immédiatement, les langues ne sont pas mélangées"""
+    calls = []
+    batcher = MicroBatcher(make_batch_runner(calls), max_batch_size=2, max_wait_ms=10_000)
+
+    results = await asyncio.wait_for(asyncio.gather(
+        batcher.submit(np.zeros(1, dtype=np.float32), "fr"),
+        batcher.submit(np.zeros(1, dtype=np.float32), "en"),
+        batcher.submit(np.zeros(2, dtype=np.float32), "fr"),
+        batcher.submit(np.zeros(2, dtype=np.float32), "en"),
+    ), timeout=1)
+
+    assert results == ["fr:1", "en:1", "fr:2", "en:2"]
+    assert sorted(calls) == [(2, "en"), (2, "fr")]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller():
+    """Test : l'échec d'un lot est transmis à chaque appelant"""
+    async def failing_batch(audios, language):
+        raise RuntimeError("decode failed")
+
+    batcher = MicroBatcher(failing_batch, max_batch_size=8, max_wait_ms=5)
+
+    results = await asyncio.gather(
+        batcher.submit(np.zeros(1, dtype=np.float32), "fr"),
+        batcher.submit(np.zeros(1, dtype=np.float32), "fr"),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_transcribe_batch_routes_segments_to_clips():
+    """Test : chaque segment du pipeline batché revient au clip qui le contient"""
+    service = AzureOpenAIService()
+    service.whisper_model = MagicMock()
+    audios = [np.zeros(16000 * 5, dtype=np.float32), np.zeros(16000 * 3, dtype=np.float32)]
+
+    def speech(audio, vad_options):
+        return [{"start": 0, "end": len(audio)}]
+
+    pipeline = MagicMock()
+    pipeline.transcribe.return_value = (iter([
+        MagicMock(start=0.0, end=5.0, text=" Premier clip"),
+        MagicMock(start=5.0, end=8.0, text=" Second clip"),
+    ]), MagicMock())
+
+    with patch(
+        "app.services.azure_service.get_speech_timestamps", side_effect=speech, create=True
+    ), patch(
+        "app.services.azure_service.merge_segments",
+        side_effect=lambda segments, options: segments,
+        create=True,
+    ), patch(
+        "app.services.azure_service.VadOptions", create=True
+    ), patch(
+        "app.services.azure_service.BatchedInferencePipeline", return_value=pipeline, create=True
+    ):
+        timelines = service._transcribe_batch(service.model_pool, audios, "fr")
+
+    assert [timeline.text for timeline in timelines] == ["Premier clip", "Second clip"]
+    assert timelines[1].starts.tolist() == [0.0]
+    clip_timestamps = pipeline.transcribe.call_args.kwargs["clip_timestamps"]
+    assert clip_timestamps == [{"start": 0, "end": 80000}, {"start": 80000, "end": 128000}]
@@ -0,0 +1,85 @@
+"""
+Tests du chargement du modèle Whisper en arrière-plan
+"""
+import pytest
+import numpy as np
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.azure_service import AzureOpenAIService
+
+
+@pytest.fixture
+def mock_whisper_model():
+    mock_model = MagicMock()
+    mock_model.transcribe.return_value = (iter([]), MagicMock())
+    return mock_model
+
+
+@pytest.mark.asyncio
+async def test_load_models_warms_up(mock_whisper_model):
+    """Test : le modèle est chargé puis préchauffé sur une seconde de silence"""
+    service = AzureOpenAIService()
+
+    with patch("app.services.azure_service.settings.USE_LOCAL_WHISPER", True), patch(
+        "app.services.azure_service.FASTER_WHISPER_AVAILABLE", True
+    ), patch(
+        "app.services.azure_service.WhisperModel", return_value=mock_whisper_model, create=True
+    ):
+        await service.load_models()
+
+        assert service.transcription_available
+
+    assert service.whisper_model is mock_whisper_model
+    assert service.model_info()["status"] == "ready"
+    warmup_audio = mock_whisper_model.transcribe.call_args[0][0]
+    assert isinstance(warmup_audio, np.ndarray)
+    assert warmup_audio.dtype == np.float32
+
+
+@pytest.mark.asyncio
+async def test_load_models_failure_is_reported():
+    """Test : un échec de chargement est exposé sans lever d'exception"""
+    service = AzureOpenAIService()
+
+    with patch("app.services.azure_service.FASTER_WHISPER_AVAILABLE", True), patch(
+        "app.services.azure_service.WhisperModel",
+        side_effect=RuntimeError("disk full"),
+        create=True,
+    ):
+        await service.load_models()
+
+    assert service.whisper_model is None
+    assert service.model_info()["status"] == "failed"
+    assert "disk full" in service.model_info()["error"]
+
+
+def test_upload_rejected_while_model_loading():
+    """Test : les transcriptions sont refusées (503 + Retry-After) pendant le chargement"""
+    service = AzureOpenAIService()
+    service.model_status = "loading"
+    client = TestClient(app)
+
+    with patch('app.routes.transcription.azure_service', service):
+        response = client.post(
+            "/api/v1/transcription/jobs",
+            files={"file": ("test.mp3", BytesIO(b"fake audio content"), "audio/mpeg")},
+            data={"language": "fr"}
+        )
+
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+
+
+def test_readiness_reports_model_status():
+    """Test : la readiness probe indique l'état du modèle"""
+    service = AzureOpenAIService()
+    service.model_status = "loading"
+    client = TestClient(app)
+
+    with patch('app.main.azure_service', service):
+        response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["model"]["status"] == "loading"
@@ -0,0 +1,138 @@
+"""
+Tests du pool de répliques du modèle Whisper
+"""
+import asyncio
+import pytest
+import threading
+import time
+from unittest.mock import MagicMock, patch
+from app.services.azure_service import AzureOpenAIService
+from app.services.model_pool import WhisperModelPool, plan_cpu_affinity
+
+
+def test_acquire_dispatches_to_free_replica():
+    """Test : une réplique occupée n'est pas prêtée deux fois"""
+    pool = WhisperModelPool()
+    first, second = MagicMock(), MagicMock()
+    pool.add(first)
+    pool.add(second)
+
+    with pool.acquire() as model_a:
+        with pool.acquire() as model_b:
+            assert {model_a, model_b} == {first, second}
+            assert pool.stats()["busy"] == 2
+
+    stats = pool.stats()
+    assert stats["busy"] == 0
+    assert [replica["jobs"] for replica in stats["per_replica"]] == [1, 1]
+
+
+def test_acquire_waits_for_released_replica():
+    """Test : un thread attend qu'une réplique se libère"""
+    pool = WhisperModelPool()
+    pool.add(MagicMock())
+    acquired = threading.Event()
+
+    def borrow():
+        with pool.acquire():
+            acquired.set()
+
+    with pool.acquire():
+        thread = threading.Thread(target=borrow)
+        thread.start()
+        assert not acquired.wait(0.1)
+
+    thread.join(timeout=1)
+    assert acquired.is_set()
+    assert pool.stats()["per_replica"][0]["jobs"] == 2
+
+
+def test_clear_wakes_waiting_threads():
+    """Test : un thread en attente échoue au clear au lieu de rester bloqué"""
+    pool = WhisperModelPool()
+    pool.add(MagicMock())
+    errors = []
+
+    def borrow():
+        try:
+            with pool.acquire():
+                pass
+        except RuntimeError as e:
+            errors.append(e)
+
+    with pool.acquire():
+        thread = threading.Thread(target=borrow)
+        thread.start()
+        # Réplique empruntée : le clear est refusé
+        assert pool.clear() is False
+        assert len(pool) == 1
+
+    thread.join(timeout=1)
+    assert errors == []
+
+    # Réplique sortie de la file mais pas encore marquée occupée (course avec clear)
+    pool._free.get()
+    thread = threading.Thread(target=borrow)
+    thread.start()
+    deadline = time.monotonic() + 1
+    while not pool._waiting and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pool.clear() is True
+
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+    assert len(errors) == 1
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_reserve_limits_submissions_to_replicas():
+    """Test : une réservation attend une réplique libre ; le clear la fait échouer"""
+    pool = WhisperModelPool()
+    pool.add(MagicMock())
+
+    release = await pool.reserve()
+    waiting = asyncio.ensure_future(pool.reserve())
+    await asyncio.sleep(0.01)
+    assert not waiting.done()
+
+    release()
+    await waiting
+    waiting = asyncio.ensure_future(pool.reserve())
+    await asyncio.sleep(0.01)
+    assert pool.clear() is True
+
+    with pytest.raises(RuntimeError):
+        await waiting
+
+
+def test_plan_cpu_affinity_disjoint_sets():
+    """Test : les groupes de cœurs ne se chevauchent pas"""
+    with patch(
+        "app.services.model_pool.os.sched_getaffinity", return_value=set(range(8)), create=True
+    ):
+        cpu_sets = plan_cpu_affinity(replicas=2, threads_per_replica=4)
+        assert cpu_sets == [{0, 1, 2, 3}, {4, 5, 6, 7}]
+
+        assert plan_cpu_affinity(replicas=4, threads_per_replica=4) == [None] * 4
+
+
+@pytest.mark.asyncio
+async def test_load_models_builds_replicas():
+    """Test : le service charge le nombre de répliques configuré"""
+    service = AzureOpenAIService()
+    models = [MagicMock(), MagicMock(), MagicMock()]
+    for model in models:
+        model.transcribe.return_value = (iter([]), MagicMock())
+
+    with patch("app.services.azure_service.settings.WHISPER_REPLICAS", 3), patch(
+        "app.services.azure_service.FASTER_WHISPER_AVAILABLE", True
+    ), patch(
+        "app.services.azure_service.WhisperModel", side_effect=models, create=True
+    ) as mock_cls:
+        await service.load_models()
+
+    assert len(service.model_pool) == 3
+    assert service.whisper_model is models[0]
+    assert mock_cls.call_args.kwargs["num_workers"] == 1
+    assert service.model_info()["replicas"] == 3
@@ -0,0 +1,88 @@
+"""
+Tests du registre des modèles Whisper (chargement à la demande, éviction LRU)
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+from app.config import settings
+from app.services.model_registry import ModelRegistry
+
+
+@pytest.fixture
+def budget():
+    """Budget de 700 MB, mémoire estimée (tiny 75, base 145, small 490 MB)"""
+    with patch.object(settings, "WHISPER_MODEL_SIZE", "tiny"), \
+         patch.object(settings, "WHISPER_REPLICAS", 1), \
+         patch.object(settings, "WHISPER_MODEL_MEMORY_BUDGET_MB", 700), \
+         patch('app.services.model_registry.resident_memory_bytes', return_value=None):
+        yield
+
+
+def fake_loader():
+    loaded = []
+
+    def load_replica(cpu_ids, model_size):
+        loaded.append(model_size)
+        return MagicMock(name=model_size)
+
+    return loaded, load_replica
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_model_is_evicted(budget):
+    """Test : au-delà du budget, le modèle inutilisé le plus ancien est déchargé"""
+    loaded, load_replica = fake_loader()
+    registry = ModelRegistry(load_replica)
+
+    await registry.ensure("tiny")
+    await registry.ensure("base")
+    await registry.ensure("tiny")
+    await registry.ensure(
+        "small"
+    )  # 75 + 145 + 490 > 700 : base est évincé, tiny est le modèle par défaut
+    await registry.ensure("small")
+
+    assert loaded == ["tiny", "base", "small"]
+    assert registry.loaded_models() == ["tiny", "small"]
+    assert [(event["event"], event["model"]) for event in registry.events] == [
+        ("load", "tiny"), ("load", "base"), ("evict", "base"), ("load", "small")
+    ]
+    stats = registry.stats()
+    assert stats["memory_mb"] == 565
+    assert stats["models"]["small"]["hits"] == 1
+    assert stats["models"]["tiny"]["hits"] == 1
+    assert stats["models"]["small"]["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_model_in_use_is_not_evicted(budget):
+    """Test : un modèle utilisé par une transcription reste chargé, même hors budget"""
+    loaded, load_replica = fake_loader()
+    registry = ModelRegistry(load_replica)
+
+    async with registry.use("small") as pool:
+        assert len(pool) == 1
+        await registry.ensure("base")
+        await registry.ensure("medium")  # base évincé, small utilisé : budget dépassé
+
+        assert registry.loaded_models() == ["small", "medium"]
+        assert not registry.evict("small")
+
+    assert registry.evict("small")
+    assert registry.loaded_models() == ["medium"]
+    assert loaded == ["small", "base", "medium"]
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_reported_and_retried():
+    """Test : un échec de chargement lève une erreur et n'occupe pas le registre"""
+    registry = ModelRegistry(MagicMock(side_effect=RuntimeError("disk full")))
+
+    with patch.object(settings, "WHISPER_REPLICAS", 1):
+        with pytest.raises(RuntimeError, match="disk full"):
+            await registry.ensure("base")
+
+        assert registry.loaded_models() == []
+        assert registry.events[-1]["event"] == "load_failed"
+        with pytest.raises(RuntimeError):
+            await registry.ensure("base")
+    assert registry._load_replica.call_count == 2
@@ -0,0 +1,128 @@
+"""
+Tests du routage des transcriptions par durée d'audio
+"""
+import pytest
+from unittest.mock import MagicMock, PropertyMock, patch
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.main import app
+from app.services.audio_preprocessor import audio_preprocessor
+from app.services.azure_service import AzureOpenAIService, LOCAL_DECODE_OPTIONS
+from app.services.transcription_cache import TranscriptionCache
+from app.services.model_router import ModelRouter, ModelTier, parse_routing_rules
+from benchmarks.synthetic_audio import generate_speech_like, encode_audio
+
+
+@pytest.fixture
+def routing():
+    """Paliers : base jusqu'à 60 s, small jusqu'à 30 min, medium au-delà"""
+    with patch.object(settings, "WHISPER_MODEL_ROUTING", "60:base,1800:small,medium"), \
+         patch.object(settings, "WHISPER_MODEL_SIZE", "small"), \
+         patch.object(settings, "USE_LOCAL_WHISPER", True):
+        yield
+
+
+def make_model(text):
+    segment = MagicMock(start=0.0, end=1.0, text=text)
+    model = MagicMock()
+    model.transcribe.side_effect = lambda audio, **kwargs: (
+        iter([segment]), MagicMock(duration=len(audio) / 16000, language="fr")
+    )
+    return model
+
+
+def test_routing_rules_and_overrides(routing):
+    """Test : palier choisi par durée, modèle par défaut si durée inconnue, modèle imposé vérifié"""
+    assert parse_routing_rules("30:tiny", "medium") == [
+        ModelTier("tiny", 30.0),
+        ModelTier("medium"),
+    ]
+    with pytest.raises(ValueError):
+        parse_routing_rules("600:small,60:base", "medium")
+
+    router = ModelRouter()
+    assert router.models == ["small", "base", "medium"]
+    assert router.route(45.0).model == "base"
+    assert router.route(600.0).model == "small"
+    assert router.route(7200.0).model == "medium"
+    assert router.route(None).reason == "default"
+    assert router.route(45.0, override="medium").reason == "override"
+    assert router.route(45.0, override="large-v3").model == "large-v3"
+    with pytest.raises(ValueError):
+        router.route(45.0, override="huge")
+
+
+@pytest.mark.parametrize("audio_format", ["wav", "mp3"])
+def test_probe_duration_reads_headers(tmp_path, audio_format):
+    """Test : durée lue dans l'en-tête, sans décoder l'audio"""
+    path = tmp_path / f"clip.{audio_format}"
+    path.write_bytes(encode_audio(generate_speech_like(4.0), audio_format))
+
+    assert audio_preprocessor.probe_duration(str(path)) == pytest.approx(4.0, abs=0.1)
+    assert not audio_preprocessor.sidecar_path(str(path)).exists()
+
+    path.write_bytes(b"not audio")
+    assert audio_preprocessor.probe_duration(str(path)) is None
+
+
+@pytest.mark.asyncio
+async def test_transcription_uses_routed_model(routing, tmp_path):
+    """Test : un clip court va au palier base, le modèle apparaît dans le résultat"""
+    path = tmp_path / "clip.wav"
+    path.write_bytes(encode_audio(generate_speech_like(5.0), "wav"))
+
+    service = AzureOpenAIService()
+    service.pool_for("small").add(make_model(" petit modèle"))
+    service.pool_for("base").add(make_model(" modèle base"))
+
+    routed = await service.transcribe_audio(str(path), "fr")
+    forced = await service.transcribe_audio(str(path), "fr", model="small")
+    # medium impossible à charger : repli sur le modèle par défaut
+    with patch.object(settings, "WHISPER_MODEL_ROUTING", "1:tiny,medium"), \
+         patch.object(service.model_registry, "_load_replica", side_effect=RuntimeError("offline")):
+        fallback = await service.transcribe_audio(str(path), "fr")
+
+    assert (routed["model"], routed["text"]) == ("base", "modèle base")
+    assert (forced["model"], forced["text"]) == ("small", "petit modèle")
+    assert fallback["model"] == "small"
+
+
+def test_upload_rejects_unknown_model(routing):
+    """Test : modèle imposé inconnu -> 400 avant l'upload"""
+    client = TestClient(app)
+
+    with patch.object(
+        AzureOpenAIService, "transcription_available", new_callable=PropertyMock, return_value=True
+    ), patch("app.routes.transcription.file_handler.ingest_upload") as ingest:
+        response = client.post(
+            "/api/v1/transcription/upload",
+            files={"file": ("reunion.wav", b"\x00" * 1024, "audio/wav")},
+            data={"model": "huge"}
+        )
+
+    assert response.status_code == 400
+    assert "base" in response.json()["detail"]
+    ingest.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fallback_result_cached_under_fallback_model(routing, tmp_path):
+    """Test : résultat du repli mis en cache sous le modèle réellement utilisé"""
+    path = tmp_path / "clip.wav"
+    path.write_bytes(encode_audio(generate_speech_like(5.0), "wav"))
+    cache = TranscriptionCache(tmp_path / "cache", max_size_bytes=10 * 1024, ttl_hours=24)
+
+    service = AzureOpenAIService()
+    service.pool_for("small").add(make_model(" petit modèle"))
+    offline = RuntimeError("offline")
+
+    with patch.object(settings, "WHISPER_MODEL_ROUTING", "1:tiny,medium"), \
+         patch.object(settings, "TRANSCRIPTION_CACHE_ENABLED", True), \
+         patch.object(service.model_registry, "_load_replica", side_effect=offline), \
+         patch("app.services.azure_service.transcription_cache", cache):
+        result = await service.transcribe_audio(str(path), "fr", content_hash="abc")
+
+    assert result["model"] == "small"
+    fallback_key = cache.make_key("abc", "fr", "small", LOCAL_DECODE_OPTIONS)
+    assert (await cache.get(fallback_key))["text"] == "petit modèle"
+    assert await cache.get(cache.make_key("abc", "fr", "medium", LOCAL_DECODE_OPTIONS)) is None
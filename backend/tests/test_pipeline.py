@@ -0,0 +1,148 @@
+"""
+Tests du pipeline transcription + résumé en une requête
+"""
+import asyncio
+import pytest
+import numpy as np
+from unittest.mock import MagicMock, PropertyMock, patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.azure_service import AzureOpenAIService, azure_service
+from app.services.pipeline import IncrementalSummarizer
+from app.services.summary_cache import SummaryCache
+from app.utils.audio_chunker import AudioChunk
+from app.utils.segment_timeline import SegmentTimeline
+
+SR = 16000
+
+
+@pytest.fixture
+def fake_gpt():
+    """Réponses GPT factices (map : point partiel, reduce : point final)"""
+    calls = []
+
+    async def fake_completion(system_prompt, user_content, max_tokens):
+        calls.append("reduce" if "fusionne" in system_prompt else "map")
+        if "fusionne" in system_prompt:
+            return "## 🎯 Points Clés\n- Point final"
+        return "- Point partiel"
+
+    with patch.object(azure_service, "_chat_completion", side_effect=fake_completion), \
+         patch("app.services.azure_service.settings.SUMMARY_CHUNK_MAX_TOKENS", 200), \
+         patch("app.services.azure_service.summary_cache", SummaryCache(60, 1024 * 1024)):
+        yield calls
+
+
+@pytest.mark.asyncio
+async def test_chunked_transcription_emits_segments_in_order():
+    """Test : segments transmis dans l'ordre dès que les blocs précédents sont décodés"""
+    service = AzureOpenAIService()
+    chunks = [
+        AudioChunk(0, 10 * SR, 0),
+        AudioChunk(10 * SR, 30 * SR, 0),
+        AudioChunk(30 * SR, 60 * SR, 0),
+    ]
+    texts = {10 * SR: " un", 20 * SR: " deux", 30 * SR: " trois"}
+    for _ in range(3):
+        model = MagicMock()
+        model.transcribe.side_effect = lambda audio, **kwargs: (
+            iter([MagicMock(start=0.0, end=1.0, text=texts[len(audio)])]), MagicMock(language="fr")
+        )
+        service.model_pool.add(model)
+    emitted = []
+
+    with patch.object(service, "_plan_local_chunks", return_value=chunks):
+        timeline, _, _ = await service._transcribe_local_chunked(
+            np.zeros(60 * SR, dtype=np.float32), None,
+            segment_callback=lambda start, end, text: emitted.append((start, text))
+        )
+
+    assert emitted == [(0.0, " un"), (10.0, " deux"), (30.0, " trois")]
+    assert timeline.text == "un deux trois"
+
+
+@pytest.mark.asyncio
+async def test_summarizer_maps_parts_during_transcription(fake_gpt):
+    """Test : les blocs complets sont résumés avant la fin, puis fusionnés"""
+    summarizer = IncrementalSummarizer("structured", "fr")
+    sentences = [f"Phrase numéro {i} de la réunion." for i in range(120)]
+
+    for i, sentence in enumerate(sentences):
+        summarizer.feed(float(i), float(i + 1), sentence)
+    await asyncio.sleep(0)
+    maps_before_end = fake_gpt.count("map")
+
+    result = await summarizer.finish(" ".join(sentences))
+
+    assert maps_before_end >= 2
+    assert summarizer.early_parts == maps_before_end
+    assert fake_gpt.count("map") == maps_before_end + 1
+    assert fake_gpt[-1] == "reduce"
+    assert result["key_points"] == ["Point final"]
+
+
+def test_pipeline_endpoint_returns_transcription_and_summary(fake_gpt):
+    """Test : une requête -> transcription, résumé et résumés partiels anticipés"""
+    client = TestClient(app)
+    sentences = [f"Phrase numéro {i} de la réunion." for i in range(120)]
+
+    async def fake_transcribe(
+        file_path, language, content_hash=None, model=None, segment_callback=None
+    ):
+        timeline = SegmentTimeline.from_segments(
+            (float(i), float(i + 1), sentence) for i, sentence in enumerate(sentences)
+        )
+        for segment in timeline:
+            segment_callback(*segment)
+            await asyncio.sleep(0)
+        return {
+            "text": timeline.text, "language": "fr", "duration": 120.0, "word_count": 600,
+            "processing_time": 1.0, "model": "small", "segments": timeline
+        }
+
+    with patch.object(
+        AzureOpenAIService, "transcription_available", new_callable=PropertyMock, return_value=True
+    ), patch.object(azure_service, "transcribe_audio", side_effect=fake_transcribe):
+        response = client.post(
+            "/api/v1/transcription/pipeline",
+            files={"file": ("reunion.wav", b"RIFF" + b"\x00" * 1024, "audio/wav")},
+            data={"language": "fr", "summary_type": "bullet_points"}
+        )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["transcription"]["text"].startswith("Phrase numéro 0")
+    assert body["summary"]["key_points"] == ["Point final"]
+    assert body["overlapped_summary_parts"] >= 2
+    assert body["summary_error"] is None
+
+
+def test_pipeline_keeps_transcription_when_summary_fails():
+    """Test : échec GPT -> transcription renvoyée avec summary_error"""
+    client = TestClient(app)
+    result = {
+        "text": "Bonjour à tous, on commence la réunion de suivi du projet Whispen.",
+        "language": "fr",
+        "duration": 5.0,
+        "word_count": 11,
+        "processing_time": 0.5,
+        "segments": None,
+    }
+
+    with patch.object(
+        AzureOpenAIService, "transcription_available", new_callable=PropertyMock, return_value=True
+    ), patch.object(azure_service, "transcribe_audio", return_value=result), patch.object(
+        azure_service, "_chat_completion", side_effect=RuntimeError("GPT indisponible")
+    ), patch(
+        "app.services.azure_service.settings.SUMMARY_CACHE_ENABLED", False
+    ):
+        response = client.post(
+            "/api/v1/transcription/pipeline",
+            files={"file": ("reunion.wav", b"RIFF" + b"\x00" * 1024, "audio/wav")}
+        )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["transcription"]["text"] == result["text"]
+    assert body["summary"] is None
+    assert "GPT indisponible" in body["summary_error"]
@@ -0,0 +1,80 @@
+"""
+Tests unitaires pour retry.py et les appels Azure OpenAI avec nouvelles tentatives
+"""
+import pytest
+import httpx
+import openai
+from unittest.mock import AsyncMock, patch
+from app.utils.retry import is_retryable, get_retry_after, compute_backoff
+from app.services.azure_service import AzureOpenAIService
+
+
+def make_status_error(status_code, headers=None):
+    """Construit une erreur HTTP de l'API OpenAI"""
+    request = httpx.Request("POST", "https://example.openai.azure.com/chat/completions")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    error_class = openai.RateLimitError if status_code == 429 else openai.APIStatusError
+    return error_class("error", response=response, body=None)
+
+
+def test_is_retryable():
+    """Test : seules les erreurs transitoires sont retentées"""
+    request = httpx.Request("POST", "https://example.openai.azure.com")
+    
+    assert is_retryable(make_status_error(429))
+    assert is_retryable(make_status_error(503))
+    assert is_retryable(openai.APIConnectionError(request=request))
+    assert not is_retryable(make_status_error(400))
+    assert not is_retryable(ValueError("bug"))
+
+
+def test_get_retry_after():
+    """Test : lecture des en-têtes retry-after-ms et Retry-After"""
+    assert get_retry_after(make_status_error(429, {"retry-after-ms": "1500"})) == 1.5
+    assert get_retry_after(make_status_error(429, {"retry-after": "7"})) == 7.0
+    assert get_retry_after(make_status_error(429)) is None
+
+
+def test_compute_backoff_bounds():
+    """Test : jitter borné par le plafond exponentiel, Retry-After prioritaire"""
+    for attempt in range(10):
+        delay = compute_backoff(attempt, base_delay=0.5, max_delay=8.0)
+        assert 0 <= delay <= min(8.0, 0.5 * 2 ** attempt)
+    
+    assert compute_backoff(0, 0.5, 8.0, retry_after=3.0) == 3.0
+    assert compute_backoff(0, 0.5, 8.0, retry_after=60.0) == 8.0
+
+
+@pytest.mark.asyncio
+async def test_call_with_retries_respects_retry_after():
+    """Test : un 429 est retenté après le délai demandé par le serveur"""
+    service = AzureOpenAIService()
+    request = AsyncMock(side_effect=[
+        make_status_error(429, {"retry-after": "2"}),
+        "ok"
+    ])
+    
+    with patch('app.services.azure_service.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+        result = await service._call_with_retries(request)
+    
+    assert result == "ok"
+    assert request.await_count == 2
+    mock_sleep.assert_awaited_once_with(2.0)
+
+
+@pytest.mark.asyncio
+async def test_call_with_retries_gives_up():
+    """Test : abandon après AZURE_MAX_RETRIES, pas de retentative sur 400"""
+    service = AzureOpenAIService()
+    
+    failing = AsyncMock(side_effect=make_status_error(500))
+    with patch('app.services.azure_service.asyncio.sleep', new=AsyncMock()), \
+         patch('app.services.azure_service.settings.AZURE_MAX_RETRIES', 2):
+        with pytest.raises(openai.APIStatusError):
+            await service._call_with_retries(failing)
+    assert failing.await_count == 3
+    
+    bad_request = AsyncMock(side_effect=make_status_error(400))
+    with pytest.raises(openai.APIStatusError):
+        await service._call_with_retries(bad_request)
+    assert bad_request.await_count == 1
@@ -0,0 +1,89 @@
+"""
+Tests de la chronologie des segments et des exports de sous-titres
+"""
+import json
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.schemas import TranscriptionStatus
+from app.services.job_manager import job_manager, TranscriptionJob
+from app.utils.segment_timeline import SegmentTimeline, export_srt, export_vtt, export_json
+
+
+def make_timeline():
+    return SegmentTimeline.from_segments([
+        (0.0, 2.5, " Bonjour à tous"),
+        (2.5, 3.0, "   "),
+        (3.0, 3661.25, " Début de la réunion"),
+    ])
+
+
+def test_timeline_columns_and_text():
+    """Test : segments vides ignorés, texte complet stocké une seule fois"""
+    timeline = make_timeline()
+
+    assert len(timeline) == 2
+    assert timeline.text == "Bonjour à tous Début de la réunion"
+    assert timeline.segment_text(1) == "Début de la réunion"
+    assert timeline.to_columns() == {
+        "start": [0.0, 3.0],
+        "end": [2.5, 3661.25],
+        "text": ["Bonjour à tous", "Début de la réunion"]
+    }
+
+
+def test_timeline_round_trip():
+    """Test : la forme sérialisée (cache) reconstruit la même chronologie"""
+    timeline = make_timeline()
+    restored = SegmentTimeline.from_dict(json.loads(json.dumps(timeline.to_dict())))
+
+    assert list(restored) == list(timeline)
+
+
+def test_exports():
+    """Test : formats SRT, WebVTT et JSON"""
+    timeline = make_timeline()
+
+    srt = "".join(export_srt(timeline))
+    assert srt.startswith("1\n00:00:00,000 --> 00:00:02,500\nBonjour à tous\n\n2\n")
+    assert "01:01:01,250" in srt
+
+    vtt = "".join(export_vtt(timeline))
+    assert vtt.startswith("WEBVTT\n\n00:00:00.000 --> 00:00:02.500\n")
+
+    segments = json.loads("".join(export_json(timeline)))
+    assert segments[1] == {"start": 3.0, "end": 3661.25, "text": "Début de la réunion"}
+
+
+def test_job_export_and_timestamps_endpoints():
+    """Test : export d'un job terminé et segments sur demande"""
+    client = TestClient(app)
+    job = TranscriptionJob(id="job-export", file_path="unused", language="fr")
+    job.result = {
+        "text": make_timeline().text,
+        "language": "fr",
+        "duration": 3661.25,
+        "processing_time": 1.0,
+        "word_count": 7,
+        "segments": make_timeline()
+    }
+    job.set_status(TranscriptionStatus.COMPLETED)
+    job_manager.jobs[job.id] = job
+
+    try:
+        response = client.get("/api/v1/transcription/jobs/job-export/export?format=vtt")
+        assert response.status_code == 200
+        assert response.text.startswith("WEBVTT")
+        assert response.headers["content-type"].startswith("text/vtt")
+
+        without = client.get("/api/v1/transcription/jobs/job-export").json()
+        assert without["result"]["segments"] is None
+
+        with_timestamps = client.get(
+            "/api/v1/transcription/jobs/job-export?include_timestamps=true"
+        ).json()
+        assert with_timestamps["result"]["segments"]["text"] == [
+            "Bonjour à tous",
+            "Début de la réunion",
+        ]
+    finally:
+        del job_manager.jobs[job.id]
@@ -0,0 +1,88 @@
+"""
+Tests unitaires pour summary_cache.py
+"""
+import pytest
+import time
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
+from app.services.summary_cache import SummaryCache
+from app.services.azure_service import AzureOpenAIService
+
+
+RESULT = {
+    "summary": "Résumé test",
+    "key_points": ["Point 1"],
+    "decisions": [],
+    "action_items": [],
+    "participants": [],
+    "processing_time": 1.5
+}
+
+
+def test_make_key_normalizes_whitespace():
+    """Test : les espaces superflus ne changent pas la clé"""
+    key = SummaryCache.make_key("Bonjour  à\ntous ", "structured", "fr", "gpt-4o-mini")
+    
+    assert key == SummaryCache.make_key("Bonjour à tous", "structured", "fr", "gpt-4o-mini")
+    assert key != SummaryCache.make_key("Bonjour à tous", "short", "fr", "gpt-4o-mini")
+    assert key != SummaryCache.make_key("Bonjour à tous", "structured", "en", "gpt-4o-mini")
+    assert key != SummaryCache.make_key("Bonjour à tous", "structured", "fr", "gpt-4")
+
+
+def test_get_put_returns_copy():
+    """Test : hit/miss comptés, le résultat en cache n'est pas modifiable"""
+    cache = SummaryCache(ttl_seconds=60, max_size_bytes=1024 * 1024)
+    
+    assert cache.get("key") is None
+    cache.put("key", RESULT)
+    result = cache.get("key")
+    result["key_points"].append("Modifié")
+    
+    assert cache.get("key")["key_points"] == ["Point 1"]
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_expiry():
+    """Test : une entrée expirée n'est plus servie"""
+    cache = SummaryCache(ttl_seconds=60, max_size_bytes=1024 * 1024)
+    cache.put("key", RESULT)
+    
+    with patch('app.services.summary_cache.time.time', return_value=time.time() + 120):
+        assert cache.get("key") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_memory_cap_evicts_lru():
+    """Test : le plafond mémoire évince l'entrée la moins récemment utilisée"""
+    entry_size = len(str(RESULT).encode("utf-8"))
+    cache = SummaryCache(ttl_seconds=60, max_size_bytes=entry_size * 2)
+    
+    cache.put("key-1", RESULT)
+    cache.put("key-2", RESULT)
+    cache.get("key-1")
+    cache.put("key-3", RESULT)
+    
+    assert cache.get("key-2") is None
+    assert cache.get("key-1") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_summary_uses_cache():
+    """Test : un résumé identique ne rappelle pas Azure OpenAI"""
+    mock_response = Mock()
+    mock_response.choices = [Mock()]
+    mock_response.choices[0].message.content = "Résumé très court en 2 phrases."
+    
+    service = AzureOpenAIService()
+    service.azure_client = MagicMock()
+    service.azure_client.chat.completions.create = AsyncMock(return_value=mock_response)
+    
+    with patch('app.services.azure_service.summary_cache', SummaryCache(60, 1024 * 1024)):
+        first = await service.generate_summary("Texte à résumer", "short", "fr")
+        second = await service.generate_summary("Texte  à résumer", "short", "fr")
+        await service.generate_summary("Texte à résumer", "structured", "fr")
+    
+    assert second["summary"] == first["summary"]
+    assert second["cached"] is True
+    assert service.azure_client.chat.completions.create.call_count == 2
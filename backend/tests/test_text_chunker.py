@@ -0,0 +1,87 @@
+"""
+Tests unitaires pour text_chunker.py et le résumé map-reduce
+"""
+import pytest
+import asyncio
+import sys
+from unittest.mock import MagicMock, patch
+from app.utils import text_chunker
+from app.utils.text_chunker import chunk_text, estimate_tokens, split_sentences
+from app.services.azure_service import AzureOpenAIService
+from app.services.summary_cache import SummaryCache
+
+
+def test_split_sentences():
+    """Test : découpage aux ponctuations de fin de phrase"""
+    sentences = split_sentences("Bonjour à tous. On commence ? Oui !  Très bien…  Fin")
+    
+    assert sentences == ["Bonjour à tous.", "On commence ?", "Oui !", "Très bien…", "Fin"]
+
+
+def test_estimate_tokens_falls_back_when_encoding_fails():
+    """Test : encodage tiktoken chargé au premier appel, estimation s'il échoue"""
+    tiktoken = MagicMock()
+    tiktoken.get_encoding.side_effect = OSError("téléchargement impossible")
+    
+    with patch.dict(sys.modules, {"tiktoken": tiktoken}), \
+         patch.object(text_chunker, "_encoding", text_chunker._NOT_LOADED):
+        assert estimate_tokens("x" * 30) == 30 // text_chunker.CHARS_PER_TOKEN + 1
+        estimate_tokens("encore")
+    
+    tiktoken.get_encoding.assert_called_once_with("o200k_base")
+
+
+def test_chunk_text_respects_budget_and_sentences():
+    """Test : blocs sous le budget, phrases intactes et ordre conservé"""
+    sentences = [f"Phrase numéro {i} de la réunion." for i in range(200)]
+    text = " ".join(sentences)
+    
+    chunks = chunk_text(text, max_tokens=100)
+    
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 100 for chunk in chunks)
+    assert " ".join(chunks) == text
+
+
+def test_chunk_text_without_punctuation():
+    """Test : une transcription sans ponctuation est découpée par mots"""
+    text = " ".join(["mot"] * 1000)
+    
+    chunks = chunk_text(text, max_tokens=50)
+    
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 50 for chunk in chunks)
+    assert sum(len(chunk.split()) for chunk in chunks) == 1000
+
+
+@pytest.mark.asyncio
+async def test_map_reduce_summary_parallel():
+    """Test : les blocs sont résumés en parallèle puis fusionnés"""
+    service = AzureOpenAIService()
+    calls = []
+    in_flight = 0
+    max_in_flight = 0
+    
+    async def fake_completion(system_prompt, user_content, max_tokens):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        calls.append(system_prompt)
+        if "fusionne" in system_prompt:
+            return "## 🎯 Points Clés\n- Point final"
+        return "- Point partiel"
+    
+    text = " ".join(f"Phrase numéro {i} de la réunion." for i in range(500))
+    
+    with patch.object(service, '_chat_completion', side_effect=fake_completion), \
+         patch('app.services.azure_service.settings.SUMMARY_CHUNK_MAX_TOKENS', 500), \
+         patch('app.services.azure_service.settings.SUMMARY_MAP_CONCURRENCY', 3), \
+         patch('app.services.azure_service.summary_cache', SummaryCache(60, 1024 * 1024)):
+        result = await service.generate_summary(text, "structured", "fr")
+    
+    assert len(calls) > 2
+    assert max_in_flight == 3
+    assert "fusionne" in calls[-1]
+    assert result["key_points"] == ["Point final"]
@@ -0,0 +1,119 @@
+"""
+Tests unitaires pour transcription_cache.py
+"""
+import asyncio
+import pytest
+import os
+import time
+from unittest.mock import MagicMock, patch
+from app.services.transcription_cache import TranscriptionCache
+from app.services.azure_service import AzureOpenAIService
+
+
+RESULT = {
+    "text": "Ceci est un test",
+    "language": "fr",
+    "duration": 10.5,
+    "processing_time": 4.2,
+    "word_count": 4
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Fixture pour TranscriptionCache"""
+    return TranscriptionCache(tmp_path, max_size_bytes=10 * 1024, ttl_hours=24)
+
+
+def test_make_key_depends_on_parameters():
+    """Test : la clé change avec la langue, le modèle ou les options"""
+    key = TranscriptionCache.make_key("abc", "fr", "base", {"beam_size": 5})
+    
+    assert key == TranscriptionCache.make_key("abc", "fr", "base", {"beam_size": 5})
+    assert key != TranscriptionCache.make_key("abc", "en", "base", {"beam_size": 5})
+    assert key != TranscriptionCache.make_key("abc", "fr", "medium", {"beam_size": 5})
+    assert key != TranscriptionCache.make_key("abc", "fr", "base", {"beam_size": 1})
+
+
+@pytest.mark.asyncio
+async def test_get_put_and_stats(cache):
+    """Test : miss puis hit, avec statistiques"""
+    assert await cache.get("key-1") is None
+    
+    await cache.put("key-1", RESULT)
+    result = await cache.get("key-1", audio_bytes=2048)
+    
+    assert result["text"] == "Ceci est un test"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["audio_bytes_saved"] == 2048
+    assert stats["audio_seconds_saved"] == 10.5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_puts_same_key(cache, tmp_path):
+    """Test : écritures concurrentes d'une même clé sans fichier temporaire partagé"""
+    results = [{**RESULT, "text": f"version {i}"} for i in range(5)]
+    
+    await asyncio.gather(*(cache.put("key-1", result) for result in results))
+    
+    assert (await cache.get("key-1"))["text"] in {result["text"] for result in results}
+    assert [path.name for path in tmp_path.iterdir()] == ["key-1.json"]
+    assert cache.stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(tmp_path):
+    """Test : l'entrée la moins récemment utilisée est évincée au-delà du budget"""
+    entry_size = len(str(RESULT)) + 20
+    cache = TranscriptionCache(tmp_path, max_size_bytes=entry_size * 2, ttl_hours=24)
+    
+    await cache.put("key-1", RESULT)
+    await cache.put("key-2", RESULT)
+    await cache.get("key-1")  # key-1 devient la plus récente
+    await cache.put("key-3", RESULT)
+    
+    assert await cache.get("key-2") is None
+    assert await cache.get("key-1") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_persistence_and_expiry(tmp_path, cache):
+    """Test : les entrées survivent au redémarrage et expirent (RGPD)"""
+    await cache.put("key-1", RESULT)
+    
+    reloaded = TranscriptionCache(tmp_path, max_size_bytes=10 * 1024, ttl_hours=24)
+    assert (await reloaded.get("key-1"))["text"] == "Ceci est un test"
+    
+    old_time = time.time() - 48 * 3600
+    os.utime(tmp_path / "key-1.json", (old_time, old_time))
+    expired = TranscriptionCache(tmp_path, max_size_bytes=10 * 1024, ttl_hours=24)
+    
+    assert await expired.get("key-1") is None
+    assert not (tmp_path / "key-1.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_audio_uses_cache(tmp_path, prepared_audio):
+    """Test : un même contenu audio n'est décodé qu'une fois"""
+    mock_model = MagicMock()
+    mock_segment = MagicMock(start=0.0, end=10.5, text="Ceci est un test")
+    mock_info = MagicMock(duration=10.5, language="fr")
+    mock_model.transcribe.side_effect = lambda *args, **kwargs: ([mock_segment], mock_info)
+    
+    service = AzureOpenAIService()
+    service.whisper_model = mock_model
+    cache = TranscriptionCache(tmp_path, max_size_bytes=10 * 1024, ttl_hours=24)
+    
+    with patch('app.services.azure_service.settings.USE_LOCAL_WHISPER', True), \
+         patch('app.services.azure_service.transcription_cache', cache):
+        first = await service.transcribe_audio("test.mp3", "fr", content_hash="abc")
+        second = await service.transcribe_audio("test.mp3", "fr", content_hash="abc")
+        await service.transcribe_audio("test.mp3", "en", content_hash="abc")
+    
+    assert first["text"] == second["text"]
+    assert second["cached"] is True
+    assert mock_model.transcribe.call_count == 2
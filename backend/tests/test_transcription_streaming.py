@@ -0,0 +1,86 @@
+"""
+Tests de la transcription en streaming (segments émis au fil du décodage)
+"""
+import pytest
+import json
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.azure_service import AzureOpenAIService
+
+
+def make_segment(start, end, text):
+    segment = MagicMock()
+    segment.start = start
+    segment.end = end
+    segment.text = text
+    return segment
+
+
+@pytest.fixture
+def mock_whisper_model():
+    """Modèle Whisper renvoyant trois segments sur 30 secondes"""
+    mock_model = MagicMock()
+    mock_info = MagicMock()
+    mock_info.duration = 30.0
+    mock_info.language = "fr"
+    segments = [
+        make_segment(0.0, 10.0, "Bonjour à tous"),
+        make_segment(10.0, 20.0, "Début de la réunion"),
+        make_segment(20.0, 30.0, "Fin de la réunion"),
+    ]
+    mock_model.transcribe.return_value = (iter(segments), mock_info)
+    return mock_model
+
+
+@pytest.fixture
+def service(mock_whisper_model, prepared_audio):
+    service = AzureOpenAIService()
+    service.whisper_model = mock_whisper_model
+    with patch('app.services.azure_service.settings.USE_LOCAL_WHISPER', True):
+        yield service
+
+
+@pytest.mark.asyncio
+async def test_stream_transcription_segments(service):
+    """Test : chaque segment est émis avec sa progression, puis l'événement final"""
+    events = [event async for event in service.stream_transcription("test.mp3", "fr")]
+    
+    assert [event["type"] for event in events] == ["segment", "segment", "segment", "done"]
+    assert events[0]["text"] == "Bonjour à tous"
+    assert events[0]["end"] == 10.0
+    assert events[1]["progress"] == pytest.approx(2 / 3, abs=1e-3)
+    assert events[-1]["word_count"] == 11
+    assert events[-1]["duration"] == 30.0
+
+
+@pytest.mark.asyncio
+async def test_stream_transcription_error(service, mock_whisper_model):
+    """Test : une erreur de décodage est émise comme événement"""
+    mock_whisper_model.transcribe.side_effect = RuntimeError("Invalid data")
+    
+    events = [event async for event in service.stream_transcription("test.mp3", "fr")]
+    
+    assert events[-1]["type"] == "error"
+    assert "Invalid data" in events[-1]["detail"]
+
+
+def test_stream_endpoint_ndjson(service, tmp_path):
+    """Test : l'endpoint renvoie du NDJSON et supprime le fichier uploadé"""
+    client = TestClient(app)
+    
+    with patch('app.routes.transcription.azure_service', service), \
+         patch('app.utils.file_handler.file_handler.temp_folder', tmp_path):
+        response = client.post(
+            "/api/v1/transcription/stream",
+            files={"file": ("test.mp3", BytesIO(b"fake audio content"), "audio/mpeg")},
+            data={"language": "fr"}
+        )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[-1]["type"] == "done"
+    assert events[-1]["text"] == "Bonjour à tous Début de la réunion Fin de la réunion"
+    assert list(tmp_path.iterdir()) == []
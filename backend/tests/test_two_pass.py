@@ -0,0 +1,87 @@
+"""
+Tests de la transcription en deux passes (brouillon rapide puis affinage)
+"""
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from app.config import settings
+from app.services.audio_preprocessor import audio_preprocessor
+from app.services.azure_service import AzureOpenAIService
+from app.utils.segment_timeline import SegmentTimeline
+from benchmarks.synthetic_audio import generate_speech_like, encode_audio
+
+
+def make_model(*texts):
+    """Modèle factice : un segment de 2 s par texte"""
+    model = MagicMock()
+    model.transcribe.side_effect = lambda audio, **kwargs: (
+        iter(
+            [MagicMock(start=2.0 * i, end=2.0 * (i + 1), text=text) for i, text in enumerate(texts)]
+        ),
+        MagicMock(duration=2.0 * len(texts), language="fr"),
+    )
+    return model
+
+
+@pytest.fixture
+def two_models(tmp_path):
+    """Brouillon base, modèle final medium, clip WAV de 6 s"""
+    path = tmp_path / "clip.wav"
+    path.write_bytes(encode_audio(generate_speech_like(6.0), "wav"))
+
+    service = AzureOpenAIService()
+    service.pool_for("base").add(make_model(" brouillon un", " brouillon deux", " brouillon trois"))
+    service.pool_for("medium").add(make_model(" final un", " final deux", " final trois"))
+
+    with patch.object(settings, "USE_LOCAL_WHISPER", True), \
+         patch.object(settings, "WHISPER_MODEL_SIZE", "medium"), \
+         patch.object(settings, "WHISPER_MODEL_ROUTING", ""), \
+         patch.object(settings, "WHISPER_DRAFT_MODEL", "base"), \
+         patch.object(settings, "WHISPER_BATCHING_ENABLED", False):
+        yield service, str(path)
+
+
+def test_merge_refined_replaces_draft_prefix():
+    """Test : les segments affinés remplacent le brouillon jusqu'à leur fin"""
+    draft = SegmentTimeline.from_segments([(0.0, 2.0, "a"), (2.0, 4.5, "b"), (4.5, 6.0, "c")])
+    refined = SegmentTimeline.from_segments([(0.0, 2.1, "A"), (2.1, 4.4, "B")])
+
+    assert draft.merge_refined(refined).text == "A B c"
+    assert draft.merge_refined(SegmentTimeline.from_segments([])) is draft
+
+
+@pytest.mark.asyncio
+async def test_draft_then_refined_on_shared_audio(two_models):
+    """Test : brouillon livré d'abord, remplacé segment par segment, audio décodé une fois"""
+    service, path = two_models
+    drafts = []
+
+    with patch.object(audio_preprocessor, "prepare", wraps=audio_preprocessor.prepare) as prepare:
+        result = await service.transcribe_audio(path, None, draft_callback=drafts.append)
+
+    assert prepare.call_count == 1
+    assert [draft["text"] for draft in drafts] == [
+        "brouillon un brouillon deux brouillon trois",
+        "final un brouillon deux brouillon trois",
+        "final un final deux brouillon trois",
+        "final un final deux final trois",
+    ]
+    assert drafts[0]["model"] == "base"
+    assert drafts[-1]["refined_until"] == 6.0
+    assert (result["model"], result["text"]) == ("medium", "final un final deux final trois")
+    # Langue détectée par le brouillon, réutilisée par la passe finale ; brouillon glouton
+    assert service.pool_for("medium").primary.transcribe.call_args.kwargs["language"] == "fr"
+    assert service.pool_for("base").primary.transcribe.call_args.kwargs["beam_size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_emits_draft_before_segments(two_models):
+    """Test : en streaming, l'événement draft précède les segments définitifs"""
+    service, path = two_models
+
+    events = [event async for event in service.stream_transcription(path, "fr", two_pass=True)]
+
+    assert [event["type"] for event in events] == ["draft", "segment", "segment", "segment", "done"]
+    assert events[0]["segments"]["text"] == ["brouillon un", "brouillon deux", "brouillon trois"]
+    assert events[-1]["text"] == "final un final deux final trois"
+    json.dumps(events)
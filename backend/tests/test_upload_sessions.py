@@ -0,0 +1,149 @@
+"""
+Tests des uploads reprenables (session, blocs, finalisation)
+"""
+import asyncio
+import hashlib
+import pytest
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from starlette.requests import ClientDisconnect
+from app.config import settings
+from app.main import app
+from app.services.azure_service import AzureOpenAIService, azure_service
+from app.services.upload_sessions import UploadSessionManager
+from benchmarks.synthetic_audio import generate_speech_like, encode_audio
+
+WAV = encode_audio(generate_speech_like(2.0), "wav")
+UPLOADS = "/api/v1/transcription/uploads"
+
+
+@pytest.fixture
+def client():
+    """Client API avec une transcription factice qui relit le fichier assemblé"""
+    received = {}
+
+    async def fake_transcribe(file_path, language, content_hash=None, model=None):
+        received["path"] = file_path
+        received["data"] = Path(file_path).read_bytes()
+        return {
+            "text": "bonjour", "language": language, "duration": 2.0,
+            "word_count": 1, "processing_time": 0.1, "segments": None
+        }
+
+    with patch.object(
+        AzureOpenAIService, "transcription_available", new_callable=PropertyMock, return_value=True
+    ), patch.object(azure_service, "transcribe_audio", side_effect=fake_transcribe):
+        yield TestClient(app), received
+
+
+def test_resumable_upload_roundtrip(client):
+    """Test : blocs dans l'ordre, reprise à la position de la session, fichier assemblé transcrit"""
+    client, received = client
+    session = client.post(UPLOADS, json={"filename": "reunion.wav", "size_bytes": len(WAV)}).json()
+    url = f"{UPLOADS}/{session['id']}"
+    half = len(WAV) // 2
+
+    assert (
+        client.put(url, params={"offset": 0}, content=WAV[:half]).json()["received_bytes"] == half
+    )
+    # Bloc renvoyé après une coupure : position refusée, position attendue indiquée
+    conflict = client.put(url, params={"offset": 0}, content=WAV[:half])
+    assert conflict.status_code == 409
+    assert conflict.headers["Upload-Offset"] == str(half)
+
+    resume_at = client.get(url).json()["received_bytes"]
+    state = client.put(url, params={"offset": resume_at}, content=WAV[resume_at:]).json()
+    assert state["complete"] is True
+
+    response = client.post(
+        f"{url}/complete", data={"sha256": hashlib.sha256(WAV).hexdigest(), "language": "fr"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["text"] == "bonjour"
+    assert received["data"] == WAV
+    assert not Path(received["path"]).exists()
+    assert client.get(url).status_code == 404
+
+
+def test_complete_rejects_incomplete_or_corrupted_upload(client):
+    """Test : finalisation refusée si incomplet ; empreinte différente -> session supprimée"""
+    client, _ = client
+    session = client.post(UPLOADS, json={"filename": "reunion.wav", "size_bytes": len(WAV)}).json()
+    url = f"{UPLOADS}/{session['id']}"
+    part_path = Path(settings.TEMP_FOLDER) / f"{session['id']}.upload.part"
+
+    client.put(url, params={"offset": 0}, content=WAV[:100])
+    assert client.post(f"{url}/complete", data={"sha256": "0" * 64}).status_code == 409
+
+    too_long = client.put(url, params={"offset": 100}, content=WAV[100:] + b"\x00")
+    assert too_long.status_code == 413
+    client.put(url, params={"offset": client.get(url).json()["received_bytes"]}, content=WAV[100:])
+    corrupted = client.post(f"{url}/complete", data={"sha256": "0" * 64})
+
+    assert corrupted.status_code == 400
+    assert client.get(url).status_code == 404
+    assert not part_path.exists()
+
+
+def test_create_validates_declared_file(client):
+    """Test : extension et taille annoncées vérifiées à l'ouverture"""
+    client, _ = client
+
+    assert client.post(UPLOADS, json={"filename": "notes.txt", "size_bytes": 10}).status_code == 400
+    too_big = {"filename": "reunion.wav", "size_bytes": settings.max_file_size_bytes + 1}
+    assert client.post(UPLOADS, json=too_big).status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_interrupted_chunk_keeps_written_bytes():
+    """Test : coupure au milieu d'un bloc -> les octets écrits sont conservés pour la reprise"""
+    manager = UploadSessionManager()
+    session = await manager.create("reunion.wav", len(WAV))
+
+    async def dropped_connection():
+        yield WAV[:1000]
+        raise ClientDisconnect()
+
+    async def remaining():
+        yield WAV[1000:]
+
+    with pytest.raises(ClientDisconnect):
+        await manager.write(session, 0, dropped_connection())
+    assert session.received_bytes == 1000
+
+    await manager.write(session, session.received_bytes, remaining())
+    stored = await manager.finalize(session, hashlib.sha256(WAV).hexdigest())
+
+    assert Path(stored.file_path).read_bytes() == WAV
+    assert stored.sha256 == hashlib.sha256(WAV).hexdigest()
+    Path(stored.file_path).unlink()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_finalize_and_delete_get_not_found():
+    """Test : finalisation en cours -> seconde finalisation, abandon et bloc refusés (404)"""
+    manager = UploadSessionManager()
+    session = await manager.create("reunion.wav", len(WAV))
+
+    async def whole_file():
+        yield WAV
+
+    await manager.write(session, 0, whole_file())
+    sha256 = hashlib.sha256(WAV).hexdigest()
+
+    first = asyncio.ensure_future(manager.finalize(session, sha256))
+    await asyncio.sleep(0)
+    with pytest.raises(HTTPException) as second:
+        await manager.finalize(session, sha256)
+    assert second.value.status_code == 404
+    assert await manager.delete(session.id) is False
+    with pytest.raises(HTTPException) as late_chunk:
+        await manager.write(session, session.received_bytes, whole_file())
+    assert late_chunk.value.status_code == 404
+
+    stored = await first
+    assert Path(stored.file_path).read_bytes() == WAV
+    Path(stored.file_path).unlink()
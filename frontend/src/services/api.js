@@ -13,24 +13,43 @@ const api = axios.create({
   },
 });
 
+const JOB_POLL_INTERVAL_MS = 2000;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
 /**
- * Transcrit un fichier audio
+ * Transcrit un fichier audio via un job asynchrone
  * @param {File} file - Fichier audio
  * @param {string} language - Code langue (fr, en, etc.)
+ * @param {Function} onProgress - Appelé avec la progression (0-1)
  * @returns {Promise} Réponse avec transcription
  */
-export const transcribeAudio = async (file, language = 'fr') => {
+export const transcribeAudio = async (file, language = 'fr', onProgress = null) => {
   const formData = new FormData();
   formData.append('file', file);
   formData.append('language', language);
 
-  const response = await api.post('/api/v1/transcription/upload', formData, {
+  const response = await api.post('/api/v1/transcription/jobs', formData, {
     headers: {
       'Content-Type': 'multipart/form-data',
     },
   });
 
-  return response.data;
+  // Suivi du job jusqu'à la fin de la transcription
+  let job = response.data;
+  while (job.status === 'pending' || job.status === 'processing') {
+    await sleep(JOB_POLL_INTERVAL_MS);
+    job = (await api.get(`/api/v1/transcription/jobs/${job.id}`)).data;
+    if (onProgress) onProgress(job.progress);
+  }
+
+  if (job.status === 'failed') {
+    const error = new Error(job.error);
+    error.response = { data: { detail: job.error } };
+    throw error;
+  }
+
+  return job.result;
 };
 
 /**